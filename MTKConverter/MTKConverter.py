@@ -35,21 +35,41 @@ from pathlib import Path
 import manufacturingtoolkit.CadExMTK  as mtk
 
 sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../helpers/"))
 
 import mtk_license as license
 
 import MTKConverter_Application as app
 
+from MTKConverter_WallThicknessProcessor import MTKConverter_WallThicknessRefinement
+
 def PrintUsage():
     print ("Usage:")
-    print ("MTKConverter -i <import_file> -p <process> --no-screenshot -e <export_folder>\n")
+    print ("MTKConverter -i <import_file> -p <process>[,<process>...] --no-screenshot -e <export_folder> [-j <jobs>] [--concurrent] [--concurrent-dfm] [--report-version <version>] [--cbor] [--trace]")
+    print ("             [--wt-adaptive] [--wt-tolerance <ratio>] [--wt-thresholds <min>,<max>] [--wt-time-budget <seconds>] [--wt-memory-budget <MB>]")
+    print ("             [--wt-cache <cache_folder>]\n")
     print ("Arguments:")
     print ("  <import_file> - import file name")
-    print ("  <process> - manufacturing process or algorithm name")
+    print ("  <process> - manufacturing process or algorithm name, or a comma-separated list of them")
     print ("  <export_folder> - export folder name")
     print ("  --no-screenshot - disable screenshot generation (optional)")
+    print ("  <jobs> - number of worker processes for multi-part models (optional, default: 1)")
+    print ("  --concurrent - run the listed processes at the same time (optional)")
+    print ("  --concurrent-dfm - run the DFM analyzers of a machining solid at the same time (optional)")
+    print ("  <version> - process_data.json schema: 1, or 2 for the compact schema (optional, default: 1)")
+    print ("  --cbor - also write the report as process_data.cbor (optional)")
+    print ("  --trace - also write the stages of the run as OpenTelemetry spans to trace.json (optional)")
+    print ("  --wt-adaptive - analyze wall thickness from a coarse resolution up, refining solids until")
+    print ("                  their min and max thickness converge, instead of at resolution 800 (optional)")
+    print ("  <ratio> - relative change of min and max thickness at which refinement stops (optional, default: 0.01)")
+    print ("  <min>,<max> - wall thickness limits in mm; solids clear of them aren't refined, either may be empty (optional)")
+    print ("  <seconds> - time a solid may take; a finer run expected to exceed it isn't started (optional)")
+    print ("  <MB> - resident memory a solid may take; a finer run expected to exceed it isn't started (optional)")
+    print ("  <cache_folder> - folder of wall thickness results reused for unchanged solids (optional)")
+    print ("  The --wt-* options other than --wt-cache imply --wt-adaptive.")
     print ("Example:")
     print ("MTKConverter -i C:\\models\\test.step -p machining_milling -e C:\\models\\test")
+    print ("MTKConverter -i C:\\models\\test.step -p machining_milling,wall_thickness,molding -e C:\\models\\test")
 
     print ("\nRecognized processes:")
     print ("  wall_thickness   :\t Wall Thickness analysis")
@@ -57,8 +77,17 @@ def PrintUsage():
     print ("  machining_turning:\t CNC Machining Lathe+Milling feature recognition and dfm analyzis")
     print ("  molding          :\t Molding feature recognition and dfm analyzis")
     print ("  sheet_metal      :\t Sheet Metal feature recognition, unfolding and dfm analysis")
-
-def main (theSource: str, theProcess: str, theTarget: str, theToGenerateScreenshot: str = ""):
+    print ("\nParallel processing (-j) applies to machining and wall thickness analysis;")
+    print ("molding and sheet metal parts are always processed one after another.")
+    print ("With several processes the model is imported once and the report lists the")
+    print ("results of every process for each part, in the order of the processes.")
+    print ("\nWall time, CPU time and peak memory of every stage and part are written to")
+    print ("timings.json in the export folder.")
+
+def main (theSource: str, theProcess: str, theTarget: str, theToGenerateScreenshot: str = "", theJobs: int = 1,
+          theToRunConcurrently: bool = False, theReportVersion: int = 1, theToWriteCBOR: bool = False,
+          theToAnalyzeConcurrently: bool = False, theToWriteTrace: bool = False,
+          theWallThicknessRefinement: MTKConverter_WallThicknessRefinement = None, theWallThicknessCache: str = None):
     aKey = license.Value()
 
     if not mtk.LicenseManager.Activate(aKey):
@@ -66,7 +95,9 @@ def main (theSource: str, theProcess: str, theTarget: str, theToGenerateScreensh
         return 1
 
     anApp = app.MTKConverter_Application()
-    aRes = anApp.Run (theSource, theProcess, theTarget)
+    aRes = anApp.Run (theSource, theProcess, theTarget, theToGenerateScreenshot, theJobs, theToRunConcurrently,
+                      theReportVersion, theToWriteCBOR, theToAnalyzeConcurrently, theToWriteTrace,
+                      theWallThicknessRefinement, theWallThicknessCache)
     return aRes.value
 
 if __name__ == "__main__":
@@ -76,12 +107,68 @@ if __name__ == "__main__":
         PrintUsage()
         sys.exit()
 
-    if len(sys.argv) < 6 :
+    aSource = ""
+    aProcess = ""
+    aTarget = ""
+    aScreenshotFlag = ""
+    aJobs = 1
+    aToRunConcurrently = False
+    aReportVersion = 1
+    aToWriteCBOR = False
+    aToAnalyzeConcurrently = False
+    aToWriteTrace = False
+    aRefinement = None
+    aWallThicknessCache = None
+    anArgs = sys.argv[1:]
+    try:
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-i":
+                aSource = os.path.abspath(anArgs.pop(0))
+            elif anOption == "-p":
+                aProcess = anArgs.pop(0)
+            elif anOption == "-e":
+                aTarget = os.path.abspath(anArgs.pop(0))
+            elif anOption == "--no-screenshot":
+                aScreenshotFlag = anOption
+            elif anOption == "-j" or anOption == "--jobs":
+                aJobs = int(anArgs.pop(0))
+            elif anOption == "--concurrent":
+                aToRunConcurrently = True
+            elif anOption == "--concurrent-dfm":
+                aToAnalyzeConcurrently = True
+            elif anOption == "--report-version":
+                aReportVersion = int(anArgs.pop(0))
+            elif anOption == "--cbor":
+                aToWriteCBOR = True
+            elif anOption == "--trace":
+                aToWriteTrace = True
+            elif anOption == "--wt-cache":
+                aWallThicknessCache = os.path.abspath(anArgs.pop(0))
+            elif anOption.startswith("--wt-"):
+                if aRefinement is None:
+                    aRefinement = MTKConverter_WallThicknessRefinement()
+                if anOption == "--wt-tolerance":
+                    aRefinement.myTolerance = float(anArgs.pop(0))
+                elif anOption == "--wt-thresholds":
+                    aMin, aMax = anArgs.pop(0).split(",")
+                    aRefinement.myMinThreshold = float(aMin) if aMin.strip() else None
+                    aRefinement.myMaxThreshold = float(aMax) if aMax.strip() else None
+                elif anOption == "--wt-time-budget":
+                    aRefinement.myTimeBudget = float(anArgs.pop(0))
+                elif anOption == "--wt-memory-budget":
+                    aRefinement.myMemoryBudget = float(anArgs.pop(0)) * 1024 * 1024
+                elif anOption != "--wt-adaptive":
+                    raise ValueError(anOption)
+            else:
+                raise ValueError(anOption)
+    except (IndexError, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value)
+
+    if not aSource or not aProcess or not aTarget:
         print("Invalid number of arguments. Please use \"-h\" or \"--help\" for usage information.")
         sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgumentsNumber.value)
 
-    aSource  = os.path.abspath(sys.argv[2])
-    aProcess = sys.argv[4]
-    aTarget  = os.path.abspath(sys.argv[6])
-
-    sys.exit(main(aSource, aProcess, aTarget))
+    sys.exit(main(aSource, aProcess, aTarget, aScreenshotFlag, aJobs, aToRunConcurrently, aReportVersion, aToWriteCBOR,
+                  aToAnalyzeConcurrently, aToWriteTrace, aRefinement, aWallThicknessCache))
@@ -27,19 +27,23 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 
 import os
 import manufacturingtoolkit.CadExMTK as mtk
 import manufacturingtoolkit.MTKView as view
  
 import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Parallel as parallel
+import MTKConverter_Timings as timings
  
 from MTKConverter_Report import MTKConverter_Report
 from MTKConverter_MachiningProcessor import MTKConverter_MachiningProcessor
 from MTKConverter_MoldingProcessor import MTKConverter_MoldingProcessor
 from MTKConverter_SheetMetalProcessor import MTKConverter_SheetMetalProcessor
-from MTKConverter_WallThicknessProcessor import MTKConverter_WallThicknessProcessor
+from MTKConverter_WallThicknessProcessor import MTKConverter_WallThicknessProcessor, MTKConverter_WallThicknessRefinement
  
 class MTKConverter_ProcessType(Enum):
     MTKConverter_PT_Undefined        = -1
@@ -72,7 +76,9 @@ class MTKConverter_ReturnCode(Enum):
  
 class MTKConverter_Application:
     def __init__(self):
-        pass
+        self.myReport = None
+        self.myTimings = {}
+        self.myTracer = None
  
     @staticmethod
     def __ProcessType(theProcessName: str):
@@ -125,22 +131,45 @@ class MTKConverter_Application:
         for i in theProcessor.myData:
             theReport.AddData(i)
  
+    @staticmethod
+    def __ApplyProcessorToParts (theProcessorFactory,
+                                 theModel: mtk.ModelData_Model,
+                                 theReport: MTKConverter_Report,
+                                 theSource: str,
+                                 theJobs: int):
+        # Only for processors that don't write into a shared process model
+        if theJobs > 1:
+            aParts = parallel.CollectParts(theModel)
+            if len(aParts) > 1:
+                with timings.Stage("parallel", {"jobs": theJobs, "parts": len(aParts)}):
+                    aData = parallel.ProcessPartsInParallel(theProcessorFactory, theSource, aParts, theJobs,
+                                                            theReport.Measurements())
+                if aData is not None:
+                    for i in aData:
+                        theReport.AddData(i)
+                    return
+
+        MTKConverter_Application.__ApplyProcessorToModel(theProcessorFactory(), theModel, theReport)
+ 
     @staticmethod
     def __Process (theProcess: str,
                    theModel: mtk.ModelData_Model,
                    theReport: MTKConverter_Report,
-                   theProcessModel: mtk.ModelData_Model):
-        print("Processing ", theProcess, "... ", sep="", end="")
- 
-        theModel.AssignUuids()
- 
+                   theProcessModel: mtk.ModelData_Model,
+                   theSource: str = "",
+                   theJobs: int = 1,
+                   theToAnalyzeConcurrently: bool = False,
+                   theWallThicknessRefinement: MTKConverter_WallThicknessRefinement = None,
+                   theWallThicknessCache: str = None):
         aProcessType = MTKConverter_Application.__ProcessType(theProcess)
         if aProcessType == MTKConverter_ProcessType.MTKConverter_PT_MachiningMilling:
-            aProcessor = MTKConverter_MachiningProcessor(mtk.Machining_OT_Milling)
-            MTKConverter_Application.__ApplyProcessorToModel(aProcessor, theModel, theReport)
+            aProcessorFactory = partial(MTKConverter_MachiningProcessor, mtk.Machining_OT_Milling,
+                                        theToAnalyzeConcurrently)
+            MTKConverter_Application.__ApplyProcessorToParts(aProcessorFactory, theModel, theReport, theSource, theJobs)
         elif aProcessType == MTKConverter_ProcessType.MTKConverter_PT_MachiningTurning:
-            aProcessor = MTKConverter_MachiningProcessor(mtk.Machining_OT_LatheMilling)
-            MTKConverter_Application.__ApplyProcessorToModel(aProcessor, theModel, theReport)
+            aProcessorFactory = partial(MTKConverter_MachiningProcessor, mtk.Machining_OT_LatheMilling,
+                                        theToAnalyzeConcurrently)
+            MTKConverter_Application.__ApplyProcessorToParts(aProcessorFactory, theModel, theReport, theSource, theJobs)
         elif aProcessType == MTKConverter_ProcessType.MTKConverter_PT_Molding:
             anExtraDataName = str(theModel.Name()) + "_extra"
             theProcessModel.SetName(mtk.UTF16String(anExtraDataName))
@@ -152,69 +181,209 @@ class MTKConverter_Application:
             aProcessor = MTKConverter_SheetMetalProcessor(theProcessModel)
             MTKConverter_Application.__ApplyProcessorToModel(aProcessor, theModel, theReport)
         elif aProcessType == MTKConverter_ProcessType.MTKConverter_PT_WallThickness:
-            aProcessor = MTKConverter_WallThicknessProcessor(800)
-            MTKConverter_Application.__ApplyProcessorToModel(aProcessor, theModel, theReport)
+            aProcessorFactory = partial(MTKConverter_WallThicknessProcessor, 800, theWallThicknessRefinement,
+                                        theWallThicknessCache, theReport.Measurements())
+            MTKConverter_Application.__ApplyProcessorToParts(aProcessorFactory, theModel, theReport, theSource, theJobs)
         else:
             return MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument
  
         return MTKConverter_ReturnCode.MTKConverter_RC_OK
  
+    @staticmethod
+    def __ProcessAll (theProcesses,
+                      theModel: mtk.ModelData_Model,
+                      theReport: MTKConverter_Report,
+                      theProcessModels,
+                      theSource: str,
+                      theJobs: int,
+                      theToRunConcurrently: bool,
+                      theToAnalyzeConcurrently: bool,
+                      theWallThicknessRefinement: MTKConverter_WallThicknessRefinement,
+                      theWallThicknessCache: str):
+        print("Processing ", ", ".join(theProcesses), "... ", sep="", end="")
+
+        if not theProcesses:
+            return MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument
+        for aProcess in theProcesses:
+            if MTKConverter_Application.__ProcessType(aProcess) == MTKConverter_ProcessType.MTKConverter_PT_Undefined:
+                return MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument
+
+        theModel.AssignUuids()
+
+        # Every process reports into its own report, merged in the requested order
+        aReports = [MTKConverter_Report(theReport.Version(), theReport.ToWriteCBOR(), theReport.Measurements())
+                    for i in theProcesses]
+
+        # Concurrent processes run on other threads, their stages are attached explicitly
+        aParentStage = timings.Current()
+
+        def ProcessOne(theIndex: int):
+            with timings.Stage("process:" + theProcesses[theIndex], theParent=aParentStage):
+                return MTKConverter_Application.__Process(theProcesses[theIndex], theModel, aReports[theIndex],
+                                                          theProcessModels[theIndex], theSource, theJobs,
+                                                          theToAnalyzeConcurrently, theWallThicknessRefinement,
+                                                          theWallThicknessCache)
+
+        if theToRunConcurrently and len(theProcesses) > 1:
+            with ThreadPoolExecutor(len(theProcesses)) as anExecutor:
+                aResults = list(anExecutor.map(ProcessOne, range(len(theProcesses))))
+        else:
+            aResults = [ProcessOne(i) for i in range(len(theProcesses))]
+
+        for aRes in aResults:
+            if aRes != MTKConverter_ReturnCode.MTKConverter_RC_OK:
+                return aRes
+
+        for aProcessReport in aReports:
+            for i in aProcessReport.ProcessData():
+                theReport.AddData(i)
+
+        return MTKConverter_ReturnCode.MTKConverter_RC_OK
+ 
     @staticmethod
     def __Export(theFolderPath: mtk.UTF16String,
                  theModel: mtk.ModelData_Model,
                  theToGenerateScreenshot: bool,
                  theReport: MTKConverter_Report,
-                 theProcessModel: mtk.ModelData_Model):
+                 theProcessModels):
         print("Exporting ", theFolderPath, "...", sep="", end="")
  
         os.mkdir(theFolderPath)
  
         aModelPath = theFolderPath + "/" + str(theModel.Name()) + ".mtkweb" + "/scenegraph.mtkweb"
-        if not theModel.Save(mtk.UTF16String(aModelPath), mtk.ModelData_Model.FileFormatType_MTKWEB):
+        with timings.Stage("save", {"model": str(theModel.Name())}):
+            aRes = theModel.Save(mtk.UTF16String(aModelPath), mtk.ModelData_Model.FileFormatType_MTKWEB)
+        if not aRes:
             print("\nERROR: Failed to export ", aModelPath, ". Exiting", sep="")
             return MTKConverter_ReturnCode.MTKConverter_RC_ExportError
  
         aThumbnailPath = theFolderPath + "/thumbnail.png"
-        if theToGenerateScreenshot and not MTKConverter_Application.__CreateOriginModelThumbnail(mtk.UTF16String(aThumbnailPath), theModel):
-            print("\nERROR: Failed to create thumbnail ", aThumbnailPath, ". Exiting", sep="")
-            return MTKConverter_ReturnCode.ExportError
+        if theToGenerateScreenshot:
+            with timings.Stage("thumbnail"):
+                aRes = MTKConverter_Application.__CreateOriginModelThumbnail(mtk.UTF16String(aThumbnailPath), theModel)
+            if not aRes:
+                print("\nERROR: Failed to create thumbnail ", aThumbnailPath, ". Exiting", sep="")
+                return MTKConverter_ReturnCode.MTKConverter_RC_ExportError
  
-        if not theProcessModel.IsEmpty():
-            aProcessModelPath = theFolderPath + "/" + str(theProcessModel.Name()) + ".mtkweb" + "/scenegraph.mtkweb"
-            if not theProcessModel.Save(mtk.UTF16String(aProcessModelPath), mtk.ModelData_Model.FileFormatType_MTKWEB):
+        for aProcessModel in theProcessModels:
+            if aProcessModel.IsEmpty():
+                continue
+            aProcessModelPath = theFolderPath + "/" + str(aProcessModel.Name()) + ".mtkweb" + "/scenegraph.mtkweb"
+            with timings.Stage("save", {"model": str(aProcessModel.Name())}):
+                aRes = aProcessModel.Save(mtk.UTF16String(aProcessModelPath), mtk.ModelData_Model.FileFormatType_MTKWEB)
+            if not aRes:
                 print("\nERROR: Failed to export ", aProcessModelPath, ". Exiting", sep="")
                 return MTKConverter_ReturnCode.MTKConverter_RC_ExportError
  
-        aJsonPath = theFolderPath + "\\process_data.json"
-        if not theReport.WriteToJSON (aJsonPath):
+        # Feature shape ids and part measurements are collected here
+        with timings.Stage("report:model"):
+            theReport.Model()
+
+        aJsonPath = theFolderPath + "/process_data.json"
+        with timings.Stage("report:json"):
+            aRes = theReport.WriteToJSON (aJsonPath)
+        if not aRes:
             print("\nERROR: Failed to create JSON file ", aJsonPath, ". Exiting", sep="")
             return MTKConverter_ReturnCode.MTKConverter_RC_ExportError
+
+        aCborPath = theFolderPath + "/process_data.cbor"
+        if theReport.ToWriteCBOR():
+            with timings.Stage("report:cbor"):
+                aRes = theReport.WriteToCBOR (aCborPath)
+            if not aRes:
+                print("\nERROR: Failed to create CBOR file ", aCborPath, ". Exiting", sep="")
+                return MTKConverter_ReturnCode.MTKConverter_RC_ExportError
  
         return MTKConverter_ReturnCode.MTKConverter_RC_OK
  
-    def Run(self, theSource: str, theProcess: str, theTarget: str, theToGenerateScreenshot: str = ""):
+    # theProcess is a process name or a comma-separated list of them; the model
+    # is imported once and every process is applied to it. theReportVersion is
+    # the process_data.json schema, 1 or the compact 2; with theToWriteCBOR the
+    # report is also written as process_data.cbor. With theToAnalyzeConcurrently
+    # the DFM analyzers of a machining solid run at the same time. With
+    # theWallThicknessRefinement wall thickness is analyzed adaptively instead
+    # of at a fixed resolution, and with theWallThicknessCache its results are
+    # reused from and kept in that folder. The stages of the run are written to
+    # timings.json in theTarget, and with theToWriteTrace to trace.json as
+    # OpenTelemetry (OTLP/JSON) spans.
+    def Run(self, theSource: str, theProcess: str, theTarget: str, theToGenerateScreenshot: str = "", theJobs: int = 1,
+            theToRunConcurrently: bool = False, theReportVersion: int = 1, theToWriteCBOR: bool = False,
+            theToAnalyzeConcurrently: bool = False, theToWriteTrace: bool = False,
+            theWallThicknessRefinement: MTKConverter_WallThicknessRefinement = None,
+            theWallThicknessCache: str = None):
+        aProcesses = []
+        for aProcess in theProcess.split(","):
+            aProcess = aProcess.strip()
+            if aProcess and aProcess not in aProcesses:
+                aProcesses.append(aProcess)
+
+        if theReportVersion not in (1, 2):
+            print("ERROR: Unsupported report version ", theReportVersion, sep="")
+            return MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument
+
         aModel = mtk.ModelData_Model()
-        aProcessModel = mtk.ModelData_Model()
-        aReport = MTKConverter_Report()
+        aProcessModels = [mtk.ModelData_Model() for i in aProcesses]
+        aReport = MTKConverter_Report(theReportVersion, theToWriteCBOR)
+        self.myReport = aReport
         aToGenerateScreenshot = True
  
         if theToGenerateScreenshot == "--no-screenshot":
             aToGenerateScreenshot = False
         aRes = MTKConverter_ReturnCode.MTKConverter_RC_OK
+        aTracer = timings.MTKConverter_Tracer()
+        self.myTracer = aTracer
         try:
-            aRes = MTKConverter_Application.__Import (theSource, aModel)
-            print("Done.")
-            if aRes == MTKConverter_ReturnCode.MTKConverter_RC_OK:
-                aRes = MTKConverter_Application.__Process (theProcess, aModel, aReport, aProcessModel)
-                print("Done.")
-            if aRes == MTKConverter_ReturnCode.MTKConverter_RC_OK:
-                aRes = MTKConverter_Application.__Export (theTarget, aModel, aToGenerateScreenshot, aReport, aProcessModel)
+            with aTracer.Activate():
+                with aTracer.Stage("import", {"source": os.path.basename(theSource)}):
+                    aRes = MTKConverter_Application.__Import (theSource, aModel)
                 print("Done.")
+                if aRes == MTKConverter_ReturnCode.MTKConverter_RC_OK:
+                    with aTracer.Stage("process", {"jobs": theJobs}):
+                        aRes = MTKConverter_Application.__ProcessAll (aProcesses, aModel, aReport, aProcessModels,
+                                                                      theSource, theJobs, theToRunConcurrently,
+                                                                      theToAnalyzeConcurrently, theWallThicknessRefinement,
+                                                                      theWallThicknessCache)
+                    print("Done.")
+                if aRes == MTKConverter_ReturnCode.MTKConverter_RC_OK:
+                    with aTracer.Stage("export"):
+                        aRes = MTKConverter_Application.__Export (theTarget, aModel, aToGenerateScreenshot, aReport,
+                                                                  aProcessModels)
+                    print("Done.")
         except Exception as anE:
             print("Failed.\nERROR: ", anE, sep="")
             return MTKConverter_ReturnCode.MTKConverter_RC_GeneralException
         except:
             print("Failed.\nERROR: Unhandled exception caught.")
             return MTKConverter_ReturnCode.MTKConverter_RC_GeneralException
+        finally:
+            self.myTimings = MTKConverter_Application.__StageDurations(aTracer)
+            MTKConverter_Application.__WriteTimings(aTracer, theTarget, theToWriteTrace)
  
-        return aRes
\ No newline at end of file
+        return aRes
+
+    # Wall times of the top-level stages by name, and of every process when
+    # there are several, as reported by the pipeline and the batch converter
+    @staticmethod
+    def __StageDurations(theTracer: timings.MTKConverter_Tracer):
+        aDurations = {}
+        for aStage in theTracer.myRoots:
+            aDurations[aStage.Name] = aStage.Wall
+            if aStage.Name != "process":
+                continue
+            aProcessStages = [i for i in aStage.Children if i.Name.startswith("process:")]
+            if len(aProcessStages) > 1:
+                for aProcessStage in aProcessStages:
+                    aDurations[aProcessStage.Name] = aProcessStage.Wall
+        return aDurations
+
+    # Only once the export folder exists, failed runs included
+    @staticmethod
+    def __WriteTimings(theTracer: timings.MTKConverter_Tracer, theTarget: str, theToWriteTrace: bool):
+        if not os.path.isdir(theTarget):
+            return
+        try:
+            theTracer.WriteJSON(theTarget + "/timings.json")
+            if theToWriteTrace:
+                theTracer.WriteTrace(theTarget + "/trace.json")
+        except OSError as anE:
+            print("WARNING: Failed to write timings: ", anE, sep="")
\ No newline at end of file
@@ -0,0 +1,392 @@
+# MTKConverter_Batch.py
+#
+# Converts many files in one run. Inputs come from a directory, a glob pattern
+# or a CSV/JSONL manifest of (input, process, output) rows, and are spread over
+# a pool of worker processes that each activate the license once. Files whose
+# export is newer than the input and was made by the same process and toolkit
+# version are skipped unless --force is given, and a summary with the status,
+# return code, timings and peak memory of every file is written at the end.
+#
+# A worker that dies or takes longer than the timeout on a file is killed and
+# replaced, and the file is recorded as failed.
+
+import collections
+import contextlib
+import csv
+import glob
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+
+from multiprocessing.connection import wait
+
+from pathlib import Path
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../helpers/"))
+
+import mtk_license as license
+
+import MTKConverter_Application as app
+import MTKConverter_Memory as memory
+import MTKConverter_Pipeline as pipeline
+
+# Workers are replaced after this many files, as the toolkit doesn't give all
+# memory back between models
+MAX_FILES_PER_WORKER = 100
+
+# Process and toolkit version of an export, written into it by the batch
+STAMP_FILE = "conversion.json"
+
+CAD_EXTENSIONS = (".stp", ".step", ".igs", ".iges", ".x_t", ".x_b", ".sat", ".jt", ".stl")
+
+def PrintUsage():
+    print ("Usage:")
+    print ("MTKConverter_Batch <inputs> [-p <process>] [-o <output_root>] [-w <workers>] [-t <timeout>] [--force] [--no-screenshot] [-s <summary>]\n")
+    print ("Arguments:")
+    print ("  <inputs> - directory, glob pattern, or .csv/.jsonl manifest with input, process and output columns")
+    print ("  <process> - process for inputs without one (default: machining_milling)")
+    print ("  <output_root> - folder for exports of inputs without an output, in the subfolders the inputs are in (default: next to each input)")
+    print ("  <workers> - number of worker processes (default: number of CPUs)")
+    print ("  <timeout> - seconds a file may take before its worker is killed, 0 for no limit (default: 1800)")
+    print ("  --force - convert even if the export is up to date")
+    print ("  --no-screenshot - disable screenshot generation")
+    print ("  <summary> - summary file (default: batch_summary.json in the output root or current folder)")
+    print ("Example:")
+    print ("MTKConverter_Batch C:\\models\\legacy -p machining_milling -o C:\\models\\converted -w 4")
+
+class MTKConverter_BatchItem:
+    def __init__(self, theSource: str, theProcess: str, theTarget: str):
+        self.mySource = theSource
+        self.myProcess = theProcess
+        self.myTarget = theTarget
+
+# Under theOutputRoot the folder of theSource relative to theRoot is kept, so
+# that inputs of the same name in different folders don't share an export
+def _DefaultTarget(theSource: str, theOutputRoot: str, theRoot: str):
+    aFolder = os.path.dirname(os.path.abspath(theSource))
+    if theOutputRoot:
+        aFolder = os.path.normpath(os.path.join(theOutputRoot, os.path.relpath(aFolder, os.path.abspath(theRoot))))
+    return os.path.join(aFolder, Path(theSource).stem + "_mtk")
+
+def _NormalizedProcess(theProcess: str):
+    # As MTKConverter_Application.Run reads it
+    aProcesses = []
+    for aProcess in theProcess.split(","):
+        aProcess = aProcess.strip()
+        if aProcess and aProcess not in aProcesses:
+            aProcesses.append(aProcess)
+    return ",".join(aProcesses)
+
+def _ReadManifest(thePath: str, theProcess: str, theOutputRoot: str):
+    aRows = []
+    with open(thePath, "r", encoding="utf-8-sig", newline="") as f:
+        if thePath.lower().endswith(".jsonl"):
+            for aLine in f:
+                if aLine.strip():
+                    aRows.append(json.loads(aLine))
+        else:
+            aRows = list(csv.DictReader(f))
+
+    aBaseDir = os.path.dirname(os.path.abspath(thePath))
+    anItems = []
+    for aRow in aRows:
+        aSource = os.path.join(aBaseDir, aRow["input"])
+        aProcess = aRow.get("process") or theProcess
+        aTarget = aRow.get("output")
+        aTarget = os.path.join(aBaseDir, aTarget) if aTarget else _DefaultTarget(aSource, theOutputRoot, aBaseDir)
+        anItems.append(MTKConverter_BatchItem(os.path.abspath(aSource), aProcess, os.path.abspath(aTarget)))
+    return anItems
+
+def CollectItems(theInputs: str, theProcess: str, theOutputRoot: str = ""):
+    if os.path.isfile(theInputs) and theInputs.lower().endswith((".csv", ".jsonl")):
+        return _ReadManifest(theInputs, theProcess, theOutputRoot)
+
+    if os.path.isdir(theInputs):
+        aRoot = theInputs
+        aSources = [str(i) for i in sorted(Path(theInputs).rglob("*")) if i.suffix.lower() in CAD_EXTENSIONS]
+    else:
+        aSources = sorted(glob.glob(theInputs, recursive=True))
+        aRoot = os.path.commonpath([os.path.dirname(os.path.abspath(i)) for i in aSources]) if aSources else ""
+
+    return [MTKConverter_BatchItem(os.path.abspath(i), theProcess,
+                                   os.path.abspath(_DefaultTarget(i, theOutputRoot, aRoot)))
+            for i in aSources]
+
+# Items sharing their export folder with another one, by folder
+def FindTargetCollisions(theItems):
+    aSources = collections.defaultdict(list)
+    for anItem in theItems:
+        aSources[os.path.normcase(anItem.myTarget)].append(anItem.mySource)
+    return {aTarget: i for aTarget, i in aSources.items() if len(i) > 1}
+
+def IsUpToDate(theItem: MTKConverter_BatchItem, theToolkitVersion: str):
+    if not theToolkitVersion:
+        return False
+    aReportPath = os.path.join(theItem.myTarget, "process_data.json")
+    if (not os.path.isfile(aReportPath)
+        or os.path.getmtime(aReportPath) < os.path.getmtime(theItem.mySource)):
+        return False
+    try:
+        with open(os.path.join(theItem.myTarget, STAMP_FILE), "r", encoding="utf-8") as f:
+            aStamp = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return (aStamp.get("process") == _NormalizedProcess(theItem.myProcess)
+            and aStamp.get("toolkit") == theToolkitVersion)
+
+class _WorkerState:
+    myError = ""
+    myToGenerateScreenshot = ""
+
+def _InitWorker(theToGenerateScreenshot: str):
+    _WorkerState.myToGenerateScreenshot = theToGenerateScreenshot
+    if not mtk.LicenseManager.Activate(license.Value()):
+        _WorkerState.myError = "Failed to activate Manufacturing Toolkit license."
+
+def _ConvertItem(theIndexedItem):
+    anIndex, anItem = theIndexedItem
+    aResult = {
+        "input": anItem.mySource,
+        "process": anItem.myProcess,
+        "output": anItem.myTarget,
+        "rc": None,
+        "timings": {"total": 0.0},
+    }
+    if _WorkerState.myError:
+        aResult["status"] = "failed"
+        aResult["log"] = _WorkerState.myError
+        return anIndex, aResult
+
+    aLog = io.StringIO()
+    aStartTime = time.perf_counter()
+    with memory.MTKConverter_PeakRssSampler() as aSampler, contextlib.redirect_stdout(aLog):
+        try:
+            if os.path.isdir(anItem.myTarget):
+                shutil.rmtree(anItem.myTarget)
+            anApp = app.MTKConverter_Application()
+            aRes = anApp.Run(anItem.mySource, anItem.myProcess, anItem.myTarget, _WorkerState.myToGenerateScreenshot)
+            aResult["rc"] = aRes.value
+            aResult["timings"] = anApp.myTimings
+            if aRes == app.MTKConverter_ReturnCode.MTKConverter_RC_OK:
+                with open(os.path.join(anItem.myTarget, STAMP_FILE), "w", encoding="utf-8") as f:
+                    json.dump({"process": _NormalizedProcess(anItem.myProcess),
+                               "toolkit": pipeline.ToolkitVersion()}, f)
+        except Exception as anE:
+            print("ERROR:", anE)
+
+    aResult["timings"]["total"] = time.perf_counter() - aStartTime
+    aResult["peakRss"] = aSampler.myPeak
+    aResult["status"] = "ok" if aResult["rc"] == 0 else "failed"
+    aResult["log"] = aLog.getvalue()
+    return anIndex, aResult
+
+def _WorkerMain(theConnection, theToGenerateScreenshot: str):
+    _InitWorker(theToGenerateScreenshot)
+    for i in range(MAX_FILES_PER_WORKER):
+        try:
+            anIndexedItem = theConnection.recv()
+        except EOFError:
+            return
+        theConnection.send(_ConvertItem(anIndexedItem))
+
+# A worker process and the item it is converting, if any. The parent hands
+# it one item at a time, so that the item a dead or stuck worker was on is
+# known.
+class _BatchWorker:
+    def __init__(self, theContext, theToGenerateScreenshot: str):
+        self.myConnection, aChildConnection = theContext.Pipe()
+        self.myProcess = theContext.Process(target=_WorkerMain, args=(aChildConnection, theToGenerateScreenshot),
+                                            daemon=True)
+        self.myProcess.start()
+        aChildConnection.close()
+        self.myItem = None
+        self.myStartTime = 0.0
+        self.myItemCount = 0
+
+    def Send(self, theIndexedItem):
+        self.myItem = theIndexedItem
+        self.myStartTime = time.perf_counter()
+        self.myItemCount += 1
+        self.myConnection.send(theIndexedItem)
+
+    # Whether it takes another item before it exits
+    def IsAvailable(self):
+        return self.myItem is None and self.myItemCount < MAX_FILES_PER_WORKER and self.myProcess.is_alive()
+
+    def Stop(self, theToKill: bool = False):
+        if theToKill:
+            self.myProcess.kill()
+        self.myConnection.close()
+        self.myProcess.join()
+
+def _FailedResult(theItem: MTKConverter_BatchItem, theElapsed: float, theLog: str):
+    return {"input": theItem.mySource, "process": theItem.myProcess, "output": theItem.myTarget,
+            "status": "failed", "rc": None, "timings": {"total": theElapsed}, "log": theLog}
+
+def RunBatch(theItems, theWorkers: int, theToForce: bool = False, theToGenerateScreenshot: str = "",
+             theTimeout: float = 0):
+    aResults = [None] * len(theItems)
+    aPending = collections.deque()
+    aToolkitVersion = pipeline.ToolkitVersion()
+    for i, anItem in enumerate(theItems):
+        if not theToForce and IsUpToDate(anItem, aToolkitVersion):
+            aResults[i] = {"input": anItem.mySource, "process": anItem.myProcess, "output": anItem.myTarget,
+                           "status": "skipped", "rc": None, "timings": {}}
+        else:
+            aPending.append((i, anItem))
+
+    aContext = multiprocessing.get_context("spawn")
+    aWorkerCount = max(1, min(theWorkers, len(aPending)))
+    aTotal = len(aPending)
+    aDone = 0
+    aWorkers = []
+
+    def Finish(theIndex: int, theResult: dict):
+        nonlocal aDone
+        aDone += 1
+        aResults[theIndex] = theResult
+        print("[", aDone, "/", aTotal, "] ", theResult["status"], " ", theResult["input"],
+              " (", f"{theResult['timings']['total']:.1f}", " s)", sep="")
+
+    while aPending or any(i.myItem is not None for i in aWorkers):
+        # Retired workers are replaced as long as there are items left
+        for aWorker in [i for i in aWorkers if i.myItem is None and not i.IsAvailable()]:
+            aWorker.Stop()
+            aWorkers.remove(aWorker)
+        while aPending and len(aWorkers) < aWorkerCount:
+            aWorkers.append(_BatchWorker(aContext, theToGenerateScreenshot))
+        for aWorker in aWorkers:
+            if aPending and aWorker.IsAvailable():
+                aWorker.Send(aPending.popleft())
+
+        aBusy = [i for i in aWorkers if i.myItem is not None]
+        if not aBusy:
+            continue
+        aTimeout = None
+        if theTimeout > 0:
+            aTimeout = max(0.0, min(i.myStartTime for i in aBusy) + theTimeout - time.perf_counter())
+        wait([i.myConnection for i in aBusy] + [i.myProcess.sentinel for i in aBusy], aTimeout)
+
+        for aWorker in aBusy:
+            anIndex, anItem = aWorker.myItem
+            anElapsed = time.perf_counter() - aWorker.myStartTime
+            aResult = None
+            try:
+                if aWorker.myConnection.poll():
+                    aResult = aWorker.myConnection.recv()[1]
+            except (EOFError, OSError):
+                pass
+
+            if aResult is not None:
+                aWorker.myItem = None
+                Finish(anIndex, aResult)
+            elif not aWorker.myProcess.is_alive():
+                aWorker.Stop()
+                aWorkers.remove(aWorker)
+                Finish(anIndex, _FailedResult(anItem, anElapsed,
+                                              f"Worker exited with code {aWorker.myProcess.exitcode}"))
+            elif theTimeout > 0 and anElapsed >= theTimeout:
+                aWorker.Stop(True)
+                aWorkers.remove(aWorker)
+                Finish(anIndex, _FailedResult(anItem, anElapsed, f"Timed out after {theTimeout:g} s"))
+
+    for aWorker in aWorkers:
+        aWorker.Stop()
+    return aResults
+
+def WriteSummary(theResults, thePath: str, theElapsed: float):
+    aCounts = {}
+    for aResult in theResults:
+        aCounts[aResult["status"]] = aCounts.get(aResult["status"], 0) + 1
+
+    aSummary = {
+        "total": len(theResults),
+        "counts": aCounts,
+        "elapsed": theElapsed,
+        "files": theResults,
+    }
+    with open(thePath, "w", encoding="utf-8") as f:
+        json.dump(aSummary, f, indent=4)
+    return aCounts
+
+def main(theInputs: str, theProcess: str = "machining_milling", theOutputRoot: str = "", theWorkers: int = 0,
+         theToForce: bool = False, theToGenerateScreenshot: str = "", theSummaryPath: str = "",
+         theTimeout: float = 1800):
+    anItems = CollectItems(theInputs, theProcess, theOutputRoot)
+    if not anItems:
+        print("No input files found for ", theInputs, ".", sep="")
+        return app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value
+
+    aCollisions = FindTargetCollisions(anItems)
+    if aCollisions:
+        print("ERROR: Several inputs would be exported to the same folder:")
+        for aTarget, aSources in aCollisions.items():
+            print("  ", aTarget, ": ", ", ".join(aSources), sep="")
+        return app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value
+
+    if theOutputRoot:
+        os.makedirs(theOutputRoot, exist_ok=True)
+    aSummaryPath = theSummaryPath or os.path.join(theOutputRoot or os.getcwd(), "batch_summary.json")
+
+    aStartTime = time.perf_counter()
+    aResults = RunBatch(anItems, theWorkers or os.cpu_count() or 1, theToForce, theToGenerateScreenshot, theTimeout)
+    aCounts = WriteSummary(aResults, aSummaryPath, time.perf_counter() - aStartTime)
+
+    print("\nConverted: ", aCounts.get("ok", 0), ", skipped: ", aCounts.get("skipped", 0),
+          ", failed: ", aCounts.get("failed", 0), sep="")
+    print("Summary written to ", aSummaryPath, sep="")
+    return 0 if not aCounts.get("failed") else app.MTKConverter_ReturnCode.MTKConverter_RC_GeneralException.value
+
+if __name__ == "__main__":
+    if (len(sys.argv) == 1
+        or sys.argv[1] == "-?" or sys.argv[1] == "/?"
+        or sys.argv[1] == "-h" or sys.argv[1] == "--help"):
+        PrintUsage()
+        sys.exit()
+
+    anInputs = ""
+    aProcess = "machining_milling"
+    anOutputRoot = ""
+    aWorkers = 0
+    aToForce = False
+    aScreenshotFlag = ""
+    aSummaryPath = ""
+    aTimeout = 1800
+    anArgs = sys.argv[1:]
+    try:
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-p":
+                aProcess = anArgs.pop(0)
+            elif anOption == "-o":
+                anOutputRoot = os.path.abspath(anArgs.pop(0))
+            elif anOption == "-w" or anOption == "--workers":
+                aWorkers = int(anArgs.pop(0))
+            elif anOption == "-t" or anOption == "--timeout":
+                aTimeout = float(anArgs.pop(0))
+            elif anOption == "-s" or anOption == "--summary":
+                aSummaryPath = os.path.abspath(anArgs.pop(0))
+            elif anOption == "--force":
+                aToForce = True
+            elif anOption == "--no-screenshot":
+                aScreenshotFlag = anOption
+            elif not anInputs:
+                anInputs = anOption
+            else:
+                raise ValueError(anOption)
+    except (IndexError, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value)
+
+    if not anInputs:
+        print("Invalid number of arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgumentsNumber.value)
+
+    sys.exit(main(anInputs, aProcess, anOutputRoot, aWorkers, aToForce, aScreenshotFlag, aSummaryPath, aTimeout))
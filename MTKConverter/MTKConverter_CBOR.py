@@ -0,0 +1,87 @@
+# MTKConverter_CBOR.py
+#
+# Minimal CBOR (RFC 8949) encoder for the binary report. Shape ids and
+# coordinates are written as RFC 8746 typed arrays, little-endian so that a
+# browser can view them as a BigUint64Array or a Float64Array without copying.
+
+import array
+import struct
+import sys
+
+TAG_UINT64_LE = 71
+TAG_FLOAT64_LE = 86
+
+class UInt64Array:
+    def __init__(self, theValues):
+        self.myValues = theValues
+
+class Float64Array:
+    def __init__(self, theValues):
+        self.myValues = theValues
+
+def _WriteHead(theOut: bytearray, theMajorType: int, theValue: int):
+    aMajor = theMajorType << 5
+    if theValue < 24:
+        theOut.append(aMajor | theValue)
+    elif theValue < 0x100:
+        theOut.append(aMajor | 24)
+        theOut.append(theValue)
+    elif theValue < 0x10000:
+        theOut.append(aMajor | 25)
+        theOut += struct.pack(">H", theValue)
+    elif theValue < 0x100000000:
+        theOut.append(aMajor | 26)
+        theOut += struct.pack(">I", theValue)
+    else:
+        theOut.append(aMajor | 27)
+        theOut += struct.pack(">Q", theValue)
+
+def _WriteTypedArray(theOut: bytearray, theTag: int, theTypeCode: str, theValues):
+    anArray = array.array(theTypeCode, theValues)
+    if sys.byteorder == "big":
+        anArray.byteswap()
+    aBytes = anArray.tobytes()
+    _WriteHead(theOut, 6, theTag)
+    _WriteHead(theOut, 2, len(aBytes))
+    theOut += aBytes
+
+def _Write(theOut: bytearray, theValue):
+    if theValue is None:
+        theOut.append(0xf6)
+    elif type(theValue) is bool:
+        theOut.append(0xf5 if theValue else 0xf4)
+    elif type(theValue) is int:
+        if theValue >= 0:
+            _WriteHead(theOut, 0, theValue)
+        else:
+            _WriteHead(theOut, 1, -1 - theValue)
+    elif type(theValue) is float:
+        theOut.append(0xfb)
+        theOut += struct.pack(">d", theValue)
+    elif type(theValue) is str:
+        aBytes = theValue.encode("utf-8")
+        _WriteHead(theOut, 3, len(aBytes))
+        theOut += aBytes
+    elif type(theValue) is bytes:
+        _WriteHead(theOut, 2, len(theValue))
+        theOut += theValue
+    elif type(theValue) is list or type(theValue) is tuple:
+        _WriteHead(theOut, 4, len(theValue))
+        for i in theValue:
+            _Write(theOut, i)
+    elif type(theValue) is dict:
+        _WriteHead(theOut, 5, len(theValue))
+        for aKey, aValue in theValue.items():
+            _Write(theOut, aKey)
+            _Write(theOut, aValue)
+    elif type(theValue) is UInt64Array:
+        _WriteTypedArray(theOut, TAG_UINT64_LE, "Q", theValue.myValues)
+    elif type(theValue) is Float64Array:
+        _WriteTypedArray(theOut, TAG_FLOAT64_LE, "d", theValue.myValues)
+    else:
+        raise TypeError("Can't encode " + type(theValue).__name__ + " as CBOR")
+
+def Encode(theValue):
+    anOut = bytearray()
+    _Write(anOut, theValue)
+    return bytes(anOut)
@@ -30,6 +30,9 @@
 import manufacturingtoolkit.CadExMTK as mtk
 
 import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Timings as timings
+
+import machining_session
 
 class MTKConverter_MachiningData(part_proc.MTKConverter_ProcessData):
     def __init__(self, thePart: mtk.ModelData_Part):
@@ -39,44 +42,30 @@ class MTKConverter_MachiningData(part_proc.MTKConverter_ProcessData):
         self.myOperation = mtk.Machining_OT_Undefined
 
 class MTKConverter_MachiningProcessor(part_proc.MTKConverter_VoidPartProcessor):
-    def __init__(self, theOperation):
+    # With theToAnalyzeConcurrently the DFM analyzers of a solid run at the same time
+    def __init__(self, theOperation, theToAnalyzeConcurrently: bool = False):
         super().__init__()
         self.myOperation = theOperation
+        self.myToAnalyzeConcurrently = theToAnalyzeConcurrently
 
     def ProcessSolid (self, thePart: mtk.ModelData_Part, theSolid: mtk.ModelData_Solid):
         aMachiningData = MTKConverter_MachiningData(thePart)
         self.myData.append(aMachiningData)
         aMachiningData.myOperation = self.myOperation
 
-        aParams = mtk.Machining_FeatureRecognizerParameters()
-        aParams.SetOperation(self.myOperation)
-        aFeatureRecognizer = mtk.Machining_FeatureRecognizer(aParams)
-        anAnalyzer = mtk.Machining_Analyzer()
-        anAnalyzer.AddTool (aFeatureRecognizer)
-        aData = anAnalyzer.Perform(theSolid)
-        if aData.IsEmpty():
+        # Only the feature and issue lists are kept, so that the session and its
+        # Machining_Data are released once the solid is done
+        aSession = machining_session.MachiningSession(theSolid, self.myOperation,
+                                                     self.myToAnalyzeConcurrently)
+        with timings.Stage("featureRecognition"):
+            anIsEmpty = aSession.IsEmpty()
+        if anIsEmpty:
             return
 
         # Features
-        for i in aData.FeatureList():
+        for i in aSession.Features():
             aMachiningData.myFeatureList.Append(i)
 
         # Issues
-        aDrillingParameters = mtk.DFMMachining_DrillingAnalyzerParameters()
-        aDrillingAnalyzer = mtk.DFMMachining_Analyzer(aDrillingParameters)
-        aMachiningData.myIssueList = aDrillingAnalyzer.Perform(theSolid, aData)
-
-        aMillingParameters = mtk.DFMMachining_MillingAnalyzerParameters()
-        aMillingAnalyzer = mtk.DFMMachining_Analyzer(aMillingParameters)
-        aMillingIssueList = aMillingAnalyzer.Perform(theSolid, aData)
-        for anIssue in aMillingIssueList:
-            if self.myOperation == mtk.Machining_OT_LatheMilling and not mtk.DFMMachining_DeepPocketIssue.CompareType(anIssue):
-                continue
-            aMachiningData.myIssueList.Append(anIssue)
-
-        if self.myOperation == mtk.Machining_OT_LatheMilling:
-            aTurninigParameters = mtk.DFMMachining_TurningAnalyzerParameters()
-            aTurningAnalyzer = mtk.DFMMachining_Analyzer(aTurninigParameters)
-            aTurningIssueList = aTurningAnalyzer.Perform(theSolid, aData)
-            for anIssue in aTurningIssueList:
-                aMachiningData.myIssueList.Append(anIssue)
+        with timings.Stage("dfm", {"concurrent": self.myToAnalyzeConcurrently}):
+            aMachiningData.myIssueList = aSession.Issues()
@@ -0,0 +1,88 @@
+# MTKConverter_Memory.py
+#
+# Resident set size of the current process. Long-lived workers use it to decide
+# when to retire, since memory held by the toolkit is not returned to the OS
+# between models.
+
+import os
+import sys
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def _WindowsRss():
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t)]
+
+    aCounters = PROCESS_MEMORY_COUNTERS()
+    aCounters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+    aProcess = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(aProcess, ctypes.byref(aCounters), aCounters.cb):
+        return 0
+    return aCounters.WorkingSetSize
+
+def CurrentRss():
+    """Returns the resident set size in bytes, or 0 if it can't be measured."""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+
+    if sys.platform == "win32":
+        try:
+            return _WindowsRss()
+        except (OSError, AttributeError):
+            return 0
+
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+        # Peak rather than current RSS, which is still a usable high-water mark
+        aMaxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return aMaxRss if sys.platform == "darwin" else aMaxRss * 1024
+    except (ImportError, OSError):
+        return 0
+
+class MTKConverter_PeakRssSampler:
+    """Samples the resident set size in a background thread and keeps the maximum."""
+
+    def __init__(self, theInterval: float = 0.05):
+        self.myInterval = theInterval
+        self.myPeak = 0
+        self.__myStopEvent = threading.Event()
+        self.__myThread = None
+
+    def __enter__(self):
+        self.myPeak = CurrentRss()
+        self.__myStopEvent.clear()
+        self.__myThread = threading.Thread(target=self.__Sample, daemon=True)
+        self.__myThread.start()
+        return self
+
+    def __exit__(self, theType, theValue, theTraceback):
+        self.__myStopEvent.set()
+        self.__myThread.join()
+        self.myPeak = max(self.myPeak, CurrentRss())
+        return False
+
+    def __Sample(self):
+        while not self.__myStopEvent.wait(self.myInterval):
+            self.myPeak = max(self.myPeak, CurrentRss())
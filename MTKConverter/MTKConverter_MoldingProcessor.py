@@ -30,6 +30,7 @@
 import manufacturingtoolkit.CadExMTK as mtk
 
 import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Timings as timings
 
 class MTKConverter_MoldingData(part_proc.MTKConverter_ProcessData):
     def __init__(self, thePart: mtk.ModelData_Part):
@@ -64,7 +65,8 @@ class MTKConverter_MoldingProcessor(part_proc.MTKConverter_VoidPartProcessor):
         aFeatureRecognizer = mtk.Molding_FeatureRecognizer(aParams)
         anAnalyzer = mtk.Molding_Analyzer()
         anAnalyzer.AddTool(aFeatureRecognizer)
-        aData = anAnalyzer.Perform(theSolid)
+        with timings.Stage("featureRecognition"):
+            aData = anAnalyzer.Perform(theSolid)
         if aData.IsEmpty():
             return
 
@@ -76,7 +78,8 @@ class MTKConverter_MoldingProcessor(part_proc.MTKConverter_VoidPartProcessor):
         # Issues
         aParameters = mtk.DFMMolding_AnalyzerParameters()
         aDFMAnalyzer = mtk.DFMMolding_Analyzer(aParameters)
-        aMoldingData.myIssueList = aDFMAnalyzer.Perform(aData)
+        with timings.Stage("dfm"):
+            aMoldingData.myIssueList = aDFMAnalyzer.Perform(aData)
 
     def PostPartProcess(self, thePart: mtk.ModelData_Part):
         if len(self.myCurrentNewFaces.Shapes()) == 0:
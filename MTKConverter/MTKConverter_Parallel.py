@@ -0,0 +1,124 @@
+# MTKConverter_Parallel.py
+#
+# Per-part parallel processing. Every worker process activates its own
+# license, imports the same file and walks the unique parts in the same
+# order as the parent, so a part is identified by its index in that order.
+# Workers return the report model entry of each processed part, measurements
+# included, the parent attaches its own part (and so its partId) to it and
+# adds it to the report.
+
+import multiprocessing
+import os
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+import mtk_license as license
+
+import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Timings as timings
+
+import measurements
+
+from MTKConverter_Report import MTKConverter_Report
+
+class MTKConverter_PartCollector(part_proc.MTKConverter_PartProcessor):
+    def __init__(self):
+        super().__init__()
+        self.myParts = []
+
+    def VisitPart(self, thePart: mtk.ModelData_Part):
+        self.myParts.append(thePart)
+
+def CollectParts(theModel: mtk.ModelData_Model):
+    aCollector = MTKConverter_PartCollector()
+    aVisitor = mtk.ModelData_ModelElementUniqueVisitor(aCollector)
+    theModel.Accept(aVisitor)
+    return aCollector.myParts
+
+def ShapeIdFingerprint(thePart: mtk.ModelData_Part):
+    # Feature shape ids refer to faces and edges of the parent's model, so a
+    # worker's result is only usable if its import produced the same ids
+    anIds = []
+    for aBody in thePart.Bodies():
+        for aType in (mtk.ShapeType_Face, mtk.ShapeType_Edge):
+            anIds.append(aType)
+            for aShape in mtk.ModelData_ShapeIterator(aBody, aType):
+                anIds.append(aShape.Id())
+    return hash(tuple(anIds))
+
+class _WorkerState:
+    myParts = []
+    myProcessorFactory = None
+    myMeasurements = None
+    myError = ""
+
+def _InitWorker(theSource: str, theProcessorFactory, theMeasurements: measurements.MeasurementsService):
+    # Errors are reported from _ProcessPart: a pool whose initializer raises
+    # keeps restarting workers instead of failing
+    if not mtk.LicenseManager.Activate(license.Value()):
+        _WorkerState.myError = "Failed to activate Manufacturing Toolkit license."
+        return
+
+    aModel = mtk.ModelData_Model()
+    aReader = mtk.ModelData_ModelReader()
+    if not aReader.Read(mtk.UTF16String(theSource), aModel):
+        _WorkerState.myError = "Failed to import " + theSource
+        return
+
+    _WorkerState.myParts = CollectParts(aModel)
+    _WorkerState.myProcessorFactory = theProcessorFactory
+    _WorkerState.myMeasurements = theMeasurements
+
+def _ProcessPart(theIndex: int):
+    if _WorkerState.myError:
+        raise RuntimeError(_WorkerState.myError)
+
+    aPart = _WorkerState.myParts[theIndex]
+    aTracer = timings.MTKConverter_Tracer()
+    with aTracer.Activate(), aTracer.Stage("worker", {"index": theIndex, "pid": os.getpid()}) as aStage:
+        aProcessor = _WorkerState.myProcessorFactory()
+        aProcessor.VisitPart(aPart)
+        with aTracer.Stage("report:model"):
+            aPartReports = [MTKConverter_Report.BuildPartReport(i, _WorkerState.myMeasurements)
+                            for i in aProcessor.myData]
+    return theIndex, ShapeIdFingerprint(aPart), aPartReports, aStage
+
+def ProcessPartsInParallel(theProcessorFactory, theSource: str, theParts, theJobs: int,
+                           theMeasurements: measurements.MeasurementsService):
+    """Returns the process data of theParts in order, or None if the workers couldn't be used."""
+    # theMeasurements is the service the processors of theProcessorFactory
+    # measure through, if any. It is pickled with the factory, so every worker
+    # gets one service of its own for its processors and part reports.
+    aResults = [None] * len(theParts)
+    try:
+        # Unlike multiprocessing.Pool, the executor fails the pending parts with
+        # BrokenProcessPool when a worker dies, instead of waiting for them forever
+        aContext = multiprocessing.get_context("spawn")
+        anExecutor = ProcessPoolExecutor(min(theJobs, len(theParts)), aContext, _InitWorker,
+                                         (theSource, theProcessorFactory, theMeasurements))
+        try:
+            aFutures = [anExecutor.submit(_ProcessPart, i) for i in range(len(theParts))]
+            for aFuture in as_completed(aFutures):
+                anIndex, aFingerprint, aPartReports, aStage = aFuture.result()
+                aResults[anIndex] = (aFingerprint, aPartReports)
+                timings.Attach(aStage)
+        finally:
+            # Parts not started yet are dropped if one failed
+            anExecutor.shutdown(cancel_futures=True)
+    except Exception as anE:
+        print("\nWARNING: Parallel processing failed (", anE, "), falling back to serial processing", sep="")
+        return None
+
+    aData = []
+    for aPart, (aFingerprint, aPartReports) in zip(theParts, aResults):
+        if aFingerprint != ShapeIdFingerprint(aPart):
+            # Shape ids differ from the worker's import, redo this part here
+            aProcessor = theProcessorFactory()
+            aProcessor.VisitPart(aPart)
+            aData.extend(aProcessor.myData)
+            continue
+        for aPartReport in aPartReports:
+            aData.append(part_proc.MTKConverter_SerializedData(aPart, aPartReport))
+    return aData
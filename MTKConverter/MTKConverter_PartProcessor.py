@@ -31,26 +31,36 @@ from abc import abstractmethod
 
 import manufacturingtoolkit.CadExMTK as mtk
 
+import MTKConverter_Timings as timings
+
 class MTKConverter_ProcessData:
     def __init__(self, thePart: mtk.ModelData_Part):
         self.myPart = thePart
 
+# Process data that was computed in another process; myPartReport holds its
+# MTKConverter_ReportModel.PartReport, the partId is taken from thePart
+class MTKConverter_SerializedData(MTKConverter_ProcessData):
+    def __init__(self, thePart: mtk.ModelData_Part, thePartReport):
+        super().__init__(thePart)
+        self.myPartReport = thePartReport
+
 class MTKConverter_PartProcessor(mtk.ModelData_ModelElementVoidVisitor):
     def __init__(self):
         super().__init__()
         self.myData = []
 
     def VisitPart(self, thePart: mtk.ModelData_Part):
-        aBodyList = thePart.Bodies()
-        for aBody in aBodyList:
-            aShapeIt = mtk.ModelData_ShapeIterator(aBody)
-            for aShape in aShapeIt:
-                if aShape.Type() == mtk.ShapeType_Solid:
-                    self.ProcessSolid(thePart, mtk.ModelData_Solid.Cast(aShape))
-                elif aShape.Type() == mtk.ShapeType_Shell:
-                    self.ProcessShell(thePart, mtk.ModelData_Shell.Cast(aShape))
-
-        self.PostPartProcess (thePart)
+        with timings.Stage("part", {"name": str(thePart.Name())}):
+            aBodyList = thePart.Bodies()
+            for aBody in aBodyList:
+                aShapeIt = mtk.ModelData_ShapeIterator(aBody)
+                for aShape in aShapeIt:
+                    if aShape.Type() == mtk.ShapeType_Solid:
+                        self.ProcessSolid(thePart, mtk.ModelData_Solid.Cast(aShape))
+                    elif aShape.Type() == mtk.ShapeType_Shell:
+                        self.ProcessShell(thePart, mtk.ModelData_Shell.Cast(aShape))
+
+            self.PostPartProcess (thePart)
 
     @abstractmethod
     def ProcessSolid(self, thePart: mtk.ModelData_Part, theSolid: mtk.ModelData_Solid):
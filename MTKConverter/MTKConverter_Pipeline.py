@@ -0,0 +1,203 @@
+# MTKConverter_Pipeline.py
+#
+# Single-pass analysis used by the web viewer: the model is imported and the
+# features are recognized once, and the same process data feeds the exported
+# report, with the part measurements in it, and the console summaries.
+
+import gzip
+import importlib.metadata
+import os
+import shutil
+import sys
+import time
+
+from pathlib import Path
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../helpers/"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../machining/feature_recognizer/"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../machining/dfm_analyzer/"))
+
+import mtk_license as license
+
+import MTKConverter_Application as app
+import MTKConverter_MachiningProcessor as mach_proc
+import MTKConverter_PartProcessor as part_proc
+
+import feature_recognizer
+import dfm_analyzer
+
+def PrintUsage():
+    print ("Usage:")
+    print ("MTKConverter_Pipeline <import_file> <export_folder> [<process>] [--no-screenshot] [-j <jobs>] [--concurrent-dfm] [--report-version <version>] [--cbor] [--wt-cache <cache_folder>]")
+    print ("MTKConverter_Pipeline --version\n")
+    print ("Arguments:")
+    print ("  <import_file> - import file name")
+    print ("  <export_folder> - export folder name")
+    print ("  <process> - process name (default: machining_milling), or a comma-separated list of them")
+    print ("  --no-screenshot - disable screenshot generation (optional)")
+    print ("  <jobs> - number of worker processes for multi-part models (optional, default: 1)")
+    print ("  --concurrent-dfm - run the DFM analyzers of a machining solid at the same time (optional)")
+    print ("  <version> - process_data.json schema: 1, or 2 for the compact schema (optional, default: 1)")
+    print ("  --cbor - also write the report as process_data.cbor (optional)")
+    print ("  <cache_folder> - folder of wall thickness results reused for unchanged solids (optional)")
+    print ("  --version - print the Manufacturing Toolkit version and exit")
+
+def ActivateLicense():
+    aKey = license.Value()
+    if not mtk.LicenseManager.Activate(aKey):
+        print("Failed to activate Manufacturing Toolkit license.")
+        return False
+    return True
+
+# Results are reused while this stays the same, so a toolkit without a version
+# is told apart by when its bindings were installed; empty if even that is
+# unknown, and then nothing should be reused
+def ToolkitVersion():
+    try:
+        return importlib.metadata.version("manufacturingtoolkit")
+    except importlib.metadata.PackageNotFoundError:
+        pass
+    if hasattr(mtk, "__version__"):
+        return mtk.__version__
+    try:
+        return f"unknown-{os.path.getmtime(mtk.__file__):.0f}"
+    except (AttributeError, OSError):
+        return ""
+
+def _PrintSummaries(theProcessData):
+    print("\nFeature Recognition:")
+    for i, aData in enumerate(theProcessData):
+        if type(aData) is not mach_proc.MTKConverter_MachiningData:
+            continue
+        aPartName = "noname" if aData.myPart.Name().IsEmpty() else aData.myPart.Name()
+        print("Part #", i, " [\"", aPartName, "\"] has:", sep="")
+        feature_recognizer.PrintFeatures(aData.myFeatureList)
+
+    aSerializedCount = sum(1 for i in theProcessData if type(i) is part_proc.MTKConverter_SerializedData)
+    if aSerializedCount:
+        print(aSerializedCount, "part(s) were analyzed in worker processes, see process_data.json")
+
+    print("\nDFM Analysis:")
+    for i, aData in enumerate(theProcessData):
+        if type(aData) is not mach_proc.MTKConverter_MachiningData:
+            continue
+        aPartName = "noname" if aData.myPart.Name().IsEmpty() else aData.myPart.Name()
+        print("Part #", i, " [\"", aPartName, "\"] has:", sep="")
+        dfm_analyzer.PrintIssues(aData.myIssueList)
+
+def _WriteCompressedVariants(theTarget: str, theMinSize: int = 1024):
+    # Precompressed copies next to each exported file, served by the web viewer
+    # by Accept-Encoding so that it never has to compress on the fly
+    for aRoot, _, aFiles in os.walk(theTarget):
+        for aName in aFiles:
+            if aName.endswith((".gz", ".br", ".png")):
+                continue
+            aPath = os.path.join(aRoot, aName)
+            with open(aPath, "rb") as f:
+                aData = f.read()
+            if len(aData) < theMinSize:
+                continue
+
+            aVariants = [(".gz", gzip.compress(aData, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                aVariants.append((".br", brotli.compress(aData)))
+            for aSuffix, aCompressed in aVariants:
+                # Not worth a round of decompression on the client
+                if len(aCompressed) > len(aData) * 0.9:
+                    continue
+                with open(aPath + aSuffix, "wb") as f:
+                    f.write(aCompressed)
+
+def Analyze(theSource: str, theTarget: str, theProcess: str = "machining_milling", theToGenerateScreenshot: str = "",
+            theTimings: dict = None, theJobs: int = 1, theReportVersion: int = 1, theToWriteCBOR: bool = False,
+            theToAnalyzeConcurrently: bool = False, theWallThicknessCache: str = None):
+    """Runs the pipeline; per-stage durations in seconds are added to theTimings if given."""
+    if theTimings is None:
+        theTimings = {}
+
+    # The converter creates the export folder itself and fails if it already exists
+    if os.path.isdir(theTarget):
+        shutil.rmtree(theTarget)
+
+    anApp = app.MTKConverter_Application()
+    aRes = anApp.Run(theSource, theProcess, theTarget, theToGenerateScreenshot, theJobs,
+                     theReportVersion=theReportVersion, theToWriteCBOR=theToWriteCBOR,
+                     theToAnalyzeConcurrently=theToAnalyzeConcurrently,
+                     theWallThicknessCache=theWallThicknessCache)
+    theTimings.update(anApp.myTimings)
+    if aRes != app.MTKConverter_ReturnCode.MTKConverter_RC_OK:
+        return aRes.value
+
+    aProcessData = anApp.myReport.ProcessData()
+    _PrintSummaries(aProcessData)
+
+    aStartTime = time.perf_counter()
+    _WriteCompressedVariants(theTarget)
+    theTimings["compress"] = time.perf_counter() - aStartTime
+    return aRes.value
+
+def main(theSource: str, theTarget: str, theProcess: str = "machining_milling", theToGenerateScreenshot: str = "",
+         theJobs: int = 1, theReportVersion: int = 1, theToWriteCBOR: bool = False,
+         theToAnalyzeConcurrently: bool = False, theWallThicknessCache: str = None):
+    if not ActivateLicense():
+        return app.MTKConverter_ReturnCode.MTKConverter_RC_NoValidLicense.value
+    return Analyze(theSource, theTarget, theProcess, theToGenerateScreenshot, None, theJobs, theReportVersion,
+                   theToWriteCBOR, theToAnalyzeConcurrently, theWallThicknessCache)
+
+if __name__ == "__main__":
+    if (len(sys.argv) == 1
+        or sys.argv[1] == "-?" or sys.argv[1] == "/?"
+        or sys.argv[1] == "-h" or sys.argv[1] == "--help"):
+        PrintUsage()
+        sys.exit()
+
+    if sys.argv[1] == "--version":
+        print(ToolkitVersion())
+        sys.exit()
+
+    anArgs = []
+    aScreenshotFlag = ""
+    aJobs = 1
+    aReportVersion = 1
+    aToWriteCBOR = False
+    aToAnalyzeConcurrently = False
+    aWallThicknessCache = None
+    anArgIt = iter(sys.argv[1:])
+    try:
+        for anArg in anArgIt:
+            if anArg == "--no-screenshot":
+                aScreenshotFlag = anArg
+            elif anArg == "-j" or anArg == "--jobs":
+                aJobs = int(next(anArgIt))
+            elif anArg == "--report-version":
+                aReportVersion = int(next(anArgIt))
+            elif anArg == "--cbor":
+                aToWriteCBOR = True
+            elif anArg == "--concurrent-dfm":
+                aToAnalyzeConcurrently = True
+            elif anArg == "--wt-cache":
+                aWallThicknessCache = os.path.abspath(next(anArgIt))
+            else:
+                anArgs.append(anArg)
+    except (StopIteration, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value)
+
+    if len(anArgs) < 2 or len(anArgs) > 3:
+        print("Invalid number of arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgumentsNumber.value)
+
+    aSource = os.path.abspath(anArgs[0])
+    aTarget = os.path.abspath(anArgs[1])
+    aProcess = anArgs[2] if len(anArgs) == 3 else "machining_milling"
+
+    sys.exit(main(aSource, aTarget, aProcess, aScreenshotFlag, aJobs, aReportVersion, aToWriteCBOR,
+                  aToAnalyzeConcurrently, aWallThicknessCache))
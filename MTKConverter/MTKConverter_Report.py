@@ -28,69 +28,37 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import io
+import json
 import math
+import os
 
 import manufacturingtoolkit.CadExMTK as mtk
 
+import MTKConverter_CBOR as cbor
+import MTKConverter_ReportModel as model
 import MTKConverter_PartProcessor as part_proc
 import MTKConverter_MachiningProcessor as mach_proc
 import MTKConverter_MoldingProcessor as mold_proc
 import MTKConverter_SheetMetalProcessor as sm_proc
 import MTKConverter_WallThicknessProcessor as wt_proc
 
-class Pair:
-    def __init__(self, theFirst: float, theSecond: float):
-        self.First = theFirst
-        self.Second = theSecond
+from MTKConverter_ReportModel import Pair, Dimension, Direction, Point
 
-    def __repr__(self):
-        return f"Pair({self.First}, {self.Second})"
+import measurements
 
-    def __str__(self):
-        return f"{self.First:.2f} x {self.Second:.2f}"
-
-class Dimension:
-    def __init__(self, theX: float, theY: float, theZ: float):
-        self.X = theX
-        self.Y = theY
-        self.Z = theZ
-
-    def __repr__(self):
-        return f"Dimension({self.X}, {self.Y}, {self.Z})"
-
-    def __str__(self):
-        return f"{self.X:.2f} x {self.Y:.2f} x {self.Z:.2f}"
-
-class Direction:
-    def __init__(self, theX: float, theY: float, theZ: float):
-        self.X = theX
-        self.Y = theY
-        self.Z = theZ
-
-    def __repr__(self):
-        return f"Direction({self.X}, {self.Y}, {self.Z})"
-
-    def __str__(self):
-        return f"({self.X:.2f}, {self.Y:.2f}, {self.Z:.2f})"
-
-class Point:
-    def __init__(self, theX: float, theY: float, theZ: float):
-        self.X = theX
-        self.Y = theY
-        self.Z = theZ
-
-    def __repr__(self):
-        return f"Point({self.X}, {self.Y}, {self.Z})"
-
-    def __str__(self):
-        return f"({self.X:.2f}, {self.Y:.2f}, {self.Z:.2f})"
+from shape_key import UnorientedShapeKey
 
+# Writes the report either as version 1, indented and with every value as a
+# string, or as the compact version 2: minified, with numbers, booleans and
+# points as JSON values and shape ids replaced by indices into a per-part table
 class JSONWriter:
-    def __init__(self, theFile: io.TextIOBase, theStartNestingLevel = 0):
+    def __init__(self, theFile: io.TextIOBase, theStartNestingLevel = 0, theIsCompact = False):
         self.__myStream = theFile
         self.__myNestingLevel = theStartNestingLevel
         self.__myPrevNestingLevel = theStartNestingLevel - 1
         self.__myIsInit = False
+        self.__myIsCompact = theIsCompact
+        self.__myShapeIDTable = None
 
     def OpenSection(self, theName = ""):
         self.__DoOpenSection (theName, '{')
@@ -105,6 +73,10 @@ class JSONWriter:
         self.__DoCloseSection(']')
 
     def WriteData(self, theParamName: str, theValue):
+        if self.__myIsCompact:
+            self.__Stream().write("\"" + theParamName + "\":" + JSONWriter.__CompactValue(theValue))
+            return
+
         aValueStr = str(theValue)
         if type(theValue) is float:
             aValueStr = f"{theValue:.2f}"
@@ -115,15 +87,73 @@ class JSONWriter:
         self.__myStream.write(theRawData)
 
     def WriteEmptyArray (self, theParamName: str):
-        self.__Stream().write("\"" + theParamName + "\": []")
+        self.__Stream().write("\"" + theParamName + ("\":[]" if self.__myIsCompact else "\": []"))
+
+    # Same as WriteRawData() with the text produced by a new writer started at
+    # theNestingLevel, but the returned writer writes straight to the stream
+    def SubWriter(self, theNestingLevel: int):
+        self.__PrepareStream()
+        aWriter = JSONWriter(self.__myStream, theNestingLevel, self.__myIsCompact)
+        aWriter.__myShapeIDTable = self.__myShapeIDTable
+        return aWriter
 
     def NestingLevel(self):
         return self.__myNestingLevel
 
+    def IsCompact(self):
+        return self.__myIsCompact
+
+    # Shape ids are 64-bit and don't survive a JavaScript number, so the compact
+    # report lists them once per part as strings and features refer to them by
+    # index. Does nothing for version 1.
+    def StartShapeIDTable(self):
+        if self.__myIsCompact:
+            self.__myShapeIDTable = {}
+
+    def WriteShapeIDTable(self):
+        if self.__myShapeIDTable:
+            self.__Stream().write("\"shapeIDTable\":" + json.dumps([str(i) for i in self.__myShapeIDTable]))
+        self.__myShapeIDTable = None
+
+    def WriteShapeIDs(self, theShapeIDs):
+        if self.__myIsCompact:
+            self.WriteRawData(self.__ShapeIDIndices(theShapeIDs))
+            return
+
+        self.OpenSection()
+        self.WriteData("shapeIDCount", len(theShapeIDs))
+        if not theShapeIDs:
+            self.WriteEmptyArray("shapeIDs")
+        else:
+            self.OpenArraySection("shapeIDs")
+            for aShapeID in theShapeIDs:
+                self.OpenSection()
+                self.WriteData("id", aShapeID)
+                self.CloseSection()
+            self.CloseArraySection()
+        self.CloseSection()
+
+    # Indices of theShapeIDs in the shape id table as a JSON array, where an
+    # entry -n stands for the n indices following the previous one
+    def __ShapeIDIndices(self, theShapeIDs):
+        anIndices = []
+        aRunEnd = -2
+        for aShapeID in theShapeIDs:
+            anIndex = self.__myShapeIDTable.setdefault(aShapeID, len(self.__myShapeIDTable))
+            if anIndex == aRunEnd + 1:
+                if anIndices[-1] < 0:
+                    anIndices[-1] -= 1
+                else:
+                    anIndices.append(-1)
+            else:
+                anIndices.append(anIndex)
+            aRunEnd = anIndex
+        return "[" + ",".join(map(str, anIndices)) + "]"
+
     def __DoOpenSection(self, theName: str, theOpenBracketSymbol: str):
         aStream = self.__Stream()
         if theName:
-            aStream.write("\"" + theName + "\": ")
+            aStream.write("\"" + theName + ("\":" if self.__myIsCompact else "\": "))
         aStream.write(theOpenBracketSymbol)
         self.__myNestingLevel += 1
 
@@ -135,16 +165,256 @@ class JSONWriter:
         if self.__myNestingLevel == self.__myPrevNestingLevel:
             self.__myStream.write(",")
         self.__myPrevNestingLevel = self.__myNestingLevel
-        if self.__myIsInit:
+        if self.__myIsInit and not self.__myIsCompact:
             self.__myStream.write('\n')
         self.__myIsInit = True
 
     def __Stream(self):
         self.__PrepareStream()
-        for i in range(self.__myNestingLevel):
-            self.__myStream.write("    ")
+        if not self.__myIsCompact:
+            self.__myStream.write("    " * self.__myNestingLevel)
         return self.__myStream
 
+    @staticmethod
+    def __CompactNumber(theValue, theDigits: int):
+        if not math.isfinite(theValue):
+            return "null"
+        if type(theValue) is int:
+            return str(theValue)
+        return repr(round(float(theValue), theDigits))
+
+    @staticmethod
+    def __CompactValue(theValue):
+        # Numbers keep the precision they are printed with in version 1
+        if type(theValue) is bool:
+            return "true" if theValue else "false"
+        if type(theValue) is int or type(theValue) is float:
+            return JSONWriter.__CompactNumber(theValue, 2)
+        if type(theValue) is Pair:
+            return "[" + ",".join(JSONWriter.__CompactNumber(i, 5) for i in (theValue.First, theValue.Second)) + "]"
+        if type(theValue) is Dimension:
+            return "[" + ",".join(JSONWriter.__CompactNumber(i, 5) for i in (theValue.X, theValue.Y, theValue.Z)) + "]"
+        if type(theValue) is Direction or type(theValue) is Point:
+            return "[" + ",".join(JSONWriter.__CompactNumber(i, 2) for i in (theValue.X, theValue.Y, theValue.Z)) + "]"
+        return json.dumps(str(theValue))
+
+# Builds the report as Python values for the CBOR report, through the same
+# calls as JSONWriter. Numbers keep their full precision, points and
+# directions become float64 arrays and shape ids uint64 arrays.
+class TreeWriter:
+    def __init__(self):
+        self.__myStack = [[]]
+
+    def OpenSection(self, theName = ""):
+        self.__Open(theName, {})
+
+    def OpenArraySection (self, theName: str):
+        self.__Open(theName, [])
+
+    def CloseSection(self):
+        self.__myStack.pop()
+
+    def CloseArraySection(self):
+        self.__myStack.pop()
+
+    def WriteData(self, theParamName: str, theValue):
+        self.__myStack[-1][theParamName] = TreeWriter.__Value(theValue)
+
+    def WriteEmptyArray (self, theParamName: str):
+        self.__myStack[-1][theParamName] = []
+
+    def SubWriter(self, theNestingLevel: int):
+        return self
+
+    def NestingLevel(self):
+        return len(self.__myStack) - 1
+
+    def IsCompact(self):
+        return True
+
+    def StartShapeIDTable(self):
+        pass
+
+    def WriteShapeIDTable(self):
+        pass
+
+    def WriteShapeIDs(self, theShapeIDs):
+        self.__myStack[-1].append(cbor.UInt64Array(list(theShapeIDs)))
+
+    def Root(self):
+        return self.__myStack[0][0]
+
+    def __Open(self, theName: str, theContainer):
+        aParent = self.__myStack[-1]
+        if type(aParent) is list:
+            aParent.append(theContainer)
+        else:
+            aParent[theName] = theContainer
+        self.__myStack.append(theContainer)
+
+    @staticmethod
+    def __Value(theValue):
+        if type(theValue) in (bool, int, float, str):
+            return theValue
+        if type(theValue) is Pair:
+            return cbor.Float64Array([theValue.First, theValue.Second])
+        if type(theValue) in (Dimension, Direction, Point):
+            return cbor.Float64Array([theValue.X, theValue.Y, theValue.Z])
+        return str(theValue)
+
+# Writes a model.Report through any of the writers above: JSONWriter for
+# both JSON versions, TreeWriter for the CBOR report
+class ReportSerializer:
+    @staticmethod
+    def Write(theWriter, theReport: model.Report, theVersion):
+        theWriter.OpenSection()
+        theWriter.WriteData("version", theVersion)
+
+        if not theReport.Parts:
+            theWriter.WriteData("error", "The model doesn't contain any parts.")
+        else:
+            theWriter.OpenArraySection("parts")
+            for aPartReport in theReport.Parts:
+                theWriter.OpenSection()
+                ReportSerializer.__WritePart(theWriter, aPartReport)
+                theWriter.CloseSection()
+            theWriter.CloseArraySection()
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WritePart(theWriter, thePartReport: model.PartReport):
+        theWriter.WriteData("partId", thePartReport.PartId)
+        theWriter.StartShapeIDTable()
+        if thePartReport.Process is not None:
+            theWriter.WriteData("process", thePartReport.Process)
+        if thePartReport.Measurements is not None and thePartReport.Measurements.SolidCount > 0:
+            ReportSerializer.__WriteMeasurements(theWriter, thePartReport.Measurements)
+
+        for aSection in thePartReport.Sections:
+            if type(aSection) is model.FeatureSection:
+                ReportSerializer.__WriteFeatureSection(theWriter, aSection)
+            elif type(aSection) is model.UnfoldedPartSection:
+                ReportSerializer.__WriteUnfoldedPartSection(theWriter, aSection)
+            elif type(aSection) is model.ThicknessSection:
+                ReportSerializer.__WriteThicknessSection(theWriter, aSection)
+
+        if thePartReport.Error is not None:
+            theWriter.WriteData("error", thePartReport.Error)
+        theWriter.WriteShapeIDTable()
+
+    @staticmethod
+    def __WriteMeasurements(theWriter, theMeasurements: measurements.Measurements):
+        theWriter.OpenSection("measurements")
+        theWriter.WriteData("solidCount", theMeasurements.SolidCount)
+        for aKey, aName, aUnits, aValue in (("volume",      "Volume",       "mm³", theMeasurements.Volume),
+                                            ("surfaceArea", "Surface Area", "mm²", theMeasurements.SurfaceArea)):
+            if aValue is not None:
+                theWriter.OpenSection(aKey)
+                theWriter.WriteData("name", aName)
+                theWriter.WriteData("units", aUnits)
+                theWriter.WriteData("value", aValue)
+                theWriter.CloseSection()
+
+        if theMeasurements.Centroid is not None:
+            theWriter.OpenSection("centroid")
+            theWriter.WriteData("name", "Centroid")
+            theWriter.WriteData("units", "mm")
+            theWriter.WriteData("value", Point(*theMeasurements.Centroid))
+            theWriter.CloseSection()
+
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteFeatureSection(theWriter, theSection: model.FeatureSection):
+        theWriter.OpenSection(theSection.Key)
+        theWriter.WriteData("name", theSection.Name)
+
+        if theSection.Message is not None:
+            theWriter.WriteData("message", theSection.Message)
+        else:
+            theWriter.WriteData("totalFeatureCount", theSection.TotalFeatureCount())
+            theWriter.OpenArraySection("featureGroups")
+            for aGroup in theSection.Groups:
+                ReportSerializer.__WriteFeatureGroup(theWriter, aGroup)
+            theWriter.CloseArraySection()
+
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteFeatureGroup(theWriter, theGroup: model.FeatureGroup):
+        theWriter.OpenSection()
+        theWriter.WriteData("name", theGroup.Name)
+        theWriter.WriteData("color", theGroup.Color)
+        theWriter.WriteData("totalGroupFeatureCount", theGroup.FeatureCount)
+
+        if theGroup.SubGroups:
+            theWriter.WriteData ("subGroupCount", len(theGroup.SubGroups))
+            theWriter.OpenArraySection ("subGroups")
+            for aSubGroup in theGroup.SubGroups:
+                ReportSerializer.__WriteFeatureSubGroup(theWriter.SubWriter(7), aSubGroup)
+            theWriter.CloseArraySection()
+        else:
+            theWriter.OpenArraySection("features")
+            if theGroup.Features:
+                aWriter = theWriter.SubWriter(6)
+                for aShapeIDs in theGroup.Features:
+                    aWriter.WriteShapeIDs(aShapeIDs)
+            theWriter.CloseArraySection()
+
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteFeatureSubGroup(theWriter, theSubGroup: model.FeatureSubGroup):
+        theWriter.OpenSection()
+        theWriter.WriteData("parametersCount", len(theSubGroup.Parameters))
+        theWriter.OpenArraySection("parameters")
+        for aParameter in theSubGroup.Parameters:
+            ReportSerializer.__WriteParameter(theWriter, aParameter)
+        theWriter.CloseArraySection()
+
+        if theSubGroup.ShapeIDs:
+            theWriter.OpenArraySection("features")
+            for aShapeIDs in theSubGroup.ShapeIDs:
+                theWriter.WriteShapeIDs(aShapeIDs)
+            theWriter.CloseArraySection()
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteParameter(theWriter, theParameter: model.Parameter):
+        theWriter.OpenSection()
+        theWriter.WriteData("name", theParameter.Name)
+        theWriter.WriteData("units", theParameter.Units)
+        theWriter.WriteData("value", theParameter.Value)
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteUnfoldedPartSection(theWriter, theSection: model.UnfoldedPartSection):
+        theWriter.OpenSection(theSection.Key)
+        theWriter.WriteData("name", theSection.Name)
+
+        if theSection.Parameters is not None:
+            aWriter = theWriter.SubWriter(4)
+
+            aWriter.WriteData("parametersCount", 3)
+            aWriter.OpenArraySection("parameters")
+            for aParameter in theSection.Parameters:
+                ReportSerializer.__WriteParameter(aWriter, aParameter)
+            aWriter.CloseArraySection()
+        else:
+            theWriter.WriteData("message", theSection.Message)
+
+        theWriter.CloseSection()
+
+    @staticmethod
+    def __WriteThicknessSection(theWriter, theSection: model.ThicknessSection):
+        theWriter.OpenSection(theSection.Key)
+        theWriter.WriteData("name", theSection.Name)
+        theWriter.WriteData("units", theSection.Units)
+        theWriter.WriteData("value", theSection.Value)
+        theWriter.WriteData("firstPoint",  theSection.FirstPoint)
+        theWriter.WriteData("secondPoint", theSection.SecondPoint)
+        theWriter.CloseSection()
+
 class FeatureGroupManager:
     def __init__(self):
         self.__myGroups = []
@@ -152,84 +422,46 @@ class FeatureGroupManager:
     def AddGroupData (self,
                       theGroupName: str,
                       theGroupColor: str,
-                      theFeatureData: str,
+                      theFeatureData: model.FeatureSubGroup,
                       theFeatureNb: int):
         # Find or create
         aRes = -1
         for i in range(len(self.__myGroups)):
             aGroup = self.__myGroups[i]
-            if aGroup.myName == theGroupName:
+            if aGroup.Name == theGroupName:
                 aRes = i
                 break
 
         if aRes == -1:
-            self.__myGroups.append(self.FeatureGroup(theGroupName, theGroupColor))
+            self.__myGroups.append(model.FeatureGroup(theGroupName, theGroupColor))
             aRes = len(self.__myGroups) - 1
 
-        # Update
+        # Update; features without parameters are listed by the group itself
         aGroup = self.__myGroups[aRes]
-        aGroup.myFeatureData.append(theFeatureData)
-        aGroup.myFeatureCount += theFeatureNb
-
-    def TotalFeatureCount(self):
-        aTotalFeatureCount = 0
-        for aGroup in self.__myGroups:
-            aTotalFeatureCount += aGroup.myFeatureCount
-        return aTotalFeatureCount
-
-    def Write(self, theWriter: JSONWriter):
-        for aGroup in self.__myGroups:
-            theWriter.OpenSection()
-            theWriter.WriteData("name", aGroup.myName)
-            theWriter.WriteData("color", aGroup.myColor)
-            theWriter.WriteData("totalGroupFeatureCount", aGroup.myFeatureCount)
-
-            aFeatureData = aGroup.myFeatureData
-            if aFeatureData:
-                aHasParams = "parameters" in aFeatureData[0]
-                if aHasParams:
-                    theWriter.WriteData ("subGroupCount", len(aFeatureData))
-                    theWriter.OpenArraySection ("subGroups")
-                    for j in aFeatureData:
-                        theWriter.WriteRawData(j)
-                    theWriter.CloseArraySection()
-                else:
-                    theWriter.OpenArraySection("features")
-                    for j in aFeatureData:
-                        theWriter.WriteRawData(j)
-                    theWriter.CloseArraySection()
-
-            theWriter.CloseSection()
+        if theFeatureData.Parameters is None:
+            aGroup.Features.extend(theFeatureData.ShapeIDs)
+        else:
+            aGroup.SubGroups.append(theFeatureData)
+        aGroup.FeatureCount += theFeatureNb
 
-    class FeatureGroup:
-        def __init__(self, theName: str, theColor: str):
-            self.myName = theName
-            self.myColor = theColor
-            self.myFeatureData = []
-            self.myFeatureCount = 0
+    def Groups(self):
+        return self.__myGroups
 
 class OrderedFeatureList:
+    # Features are collected as they come and sorted once, on first access.
+    # The sort is stable and equal features end up next to each other, so
+    # merging neighbours gives the same list, counts and shape ID order as
+    # inserting every feature at its place.
     def __init__(self):
         self.__myList = []
+        self.__myIsSorted = True
 
     def Append(self, theFeature: mtk.MTKBase_Feature, theShapeIDs):
-        anInsertIndex = 0
-        for i in self.__myList:
-            aRes = OrderedFeatureList.__CompareFeatures(theFeature, i.Feature)
-            if aRes == 0:
-                i.Count += 1
-                i.ShapeIDs.append(theShapeIDs)
-                anInsertIndex = -1
-                break
-            elif aRes < 0:
-                break
-
-            anInsertIndex += 1
-
-        if anInsertIndex >= 0:
-            self.__myList.insert(anInsertIndex, self.FeatureData(theFeature, theShapeIDs))
+        self.__myList.append(self.FeatureData(theFeature, theShapeIDs))
+        self.__myIsSorted = False
 
     def Size(self):
+        self.__Sort()
         return len(self.__myList)
 
     def GetFeature(self, theIndex: int):
@@ -242,20 +474,36 @@ class OrderedFeatureList:
         return self.__GetFeatureData(theIndex).ShapeIDs
 
     def __GetFeatureData(self, theIndex: int):
+        self.__Sort()
         return self.__myList[theIndex]
 
-    @staticmethod
-    def __CompareFeatures(theA: mtk.MTKBase_Feature, theB: mtk.MTKBase_Feature):
+    def __Sort(self):
+        if self.__myIsSorted:
+            return
+
         aComparator = mtk.MTKBase_FeatureComparator()
-        anALessThanB = aComparator(theA, theB)
-        if anALessThanB:
-            return -1
+        self.__myList.sort(key=lambda theData: OrderedFeatureList.SortKey(theData.Feature, aComparator))
 
-        aBLessThanA = aComparator(theB, theA)
-        if aBLessThanA:
-            return 1
+        aMergedList = []
+        for i in self.__myList:
+            # Sorted, so i is equal to the previous entry unless it's greater
+            if aMergedList and not aComparator(aMergedList[-1].Feature, i.Feature):
+                aMergedList[-1].Count += i.Count
+                aMergedList[-1].ShapeIDs.extend(i.ShapeIDs)
+            else:
+                aMergedList.append(i)
+
+        self.__myList = aMergedList
+        self.__myIsSorted = True
+
+    class SortKey:
+        # list.sort() only asks "less than", one comparator call per comparison
+        def __init__(self, theFeature: mtk.MTKBase_Feature, theComparator: mtk.MTKBase_FeatureComparator):
+            self.Feature = theFeature
+            self.Comparator = theComparator
 
-        return 0
+        def __lt__(self, theOther):
+            return self.Comparator(self.Feature, theOther.Feature)
 
     class FeatureData:
         def __init__(self, theFeature: mtk.MTKBase_Feature, theShapeIDs):
@@ -264,152 +512,205 @@ class OrderedFeatureList:
             self.ShapeIDs = []
             self.ShapeIDs.append(theShapeIDs)
 
-class MTKConverter_Report:
+class ShapeIdCache:
+    # Ids of the faces or edges of a shape, collected once per part: features
+    # and issues referring to the same shape get the same list, which must
+    # not be modified
     def __init__(self):
+        self.__myShapeIds = {}
+
+    def Get(self, theShape: mtk.ModelData_Shape, theType):
+        aKey = (UnorientedShapeKey(theShape), theType)
+        aShapeIdVector = self.__myShapeIds.get(aKey)
+        if aShapeIdVector is None:
+            aShapeIdVector = [aShape.Id() for aShape in mtk.ModelData_ShapeIterator(theShape, theType)]
+            self.__myShapeIds[aKey] = aShapeIdVector
+        return aShapeIdVector
+
+    # Ids of several (shape, shape type) sources in a row
+    def Collect(self, *theSources):
+        if len(theSources) == 1:
+            return self.Get(*theSources[0])
+        aShapeIdVector = []
+        for aShape, aType in theSources:
+            aShapeIdVector.extend(self.Get(aShape, aType))
+        return aShapeIdVector
+
+class LazyShapeIDs:
+    # Shape ids of a feature, collected by theCollector when they are first
+    # read, that is when the report is written. Pickled as a plain list.
+    def __init__(self, theCollector):
+        self.__myCollector = theCollector
+        self.__myShapeIds = None
+
+    def __Ids(self):
+        if self.__myShapeIds is None:
+            self.__myShapeIds = self.__myCollector()
+            self.__myCollector = None
+        return self.__myShapeIds
+
+    def __len__(self):
+        return len(self.__Ids())
+
+    def __iter__(self):
+        return iter(self.__Ids())
+
+    def __getitem__(self, theIndex):
+        return self.__Ids()[theIndex]
+
+    def __reduce__(self):
+        return list, (self.__Ids(),)
+
+class FeatureTypeDispatcher:
+    # Finds the (type, handler) of a feature through theResolver and remembers
+    # it by the Python class of the feature, as CompareType() calls are native
+    # calls and the resolvers try dozens of types in turn. A class is only
+    # used as a key if it decides the resolution: it is or derives from the
+    # type resolved to, and none of the types the resolver tells apart, given
+    # by theTypes on first use, derives from it. Features handed out as base
+    # class proxies are resolved every time.
+    def __init__(self, theResolver, theTypes):
+        self.__myResolver = theResolver
+        self.__myTypesGetter = theTypes
+        self.__myTypes = None
+        self.__myHandlers = {}
+        self.__myNonKeys = set()
+
+    def Find(self, theFeature: mtk.MTKBase_Feature):
+        aClass = type(theFeature)
+        aHandler = self.__myHandlers.get(aClass)
+        if aHandler is not None:
+            return aHandler
+
+        aHandler = self.__myResolver(theFeature)
+        if aHandler is not None and aClass not in self.__myNonKeys:
+            if self.__IsKey(aClass, aHandler[0]):
+                self.__myHandlers[aClass] = aHandler
+            else:
+                self.__myNonKeys.add(aClass)
+        return aHandler
+
+    def __IsKey(self, theClass, theType):
+        if self.__myTypes is None:
+            self.__myTypes = tuple(self.__myTypesGetter())
+        return (issubclass(theClass, theType)
+                and not any(i is not theClass and issubclass(i, theClass) for i in self.__myTypes))
+
+class MTKConverter_Report:
+    # theMeasurements is shared with the processors and the other reports of a
+    # run, if given
+    def __init__(self, theVersion: int = 1, theToWriteCBOR: bool = False,
+                 theMeasurements: measurements.MeasurementsService = None):
         self.__myData = []
+        self.__myVersion = theVersion
+        self.__myToWriteCBOR = theToWriteCBOR
+        self.__myModel = None
+        self.__myMeasurements = theMeasurements if theMeasurements is not None else measurements.MeasurementsService()
 
     def AddData(self, theData: part_proc.MTKConverter_ProcessData):
         self.__myData.append(theData)
+        self.__myModel = None
 
-    def WriteToJSON(self, thePath: str):
-        aFile = open(thePath, "w", encoding="utf-8")
-        if not aFile:
-            return False
+    def ProcessData(self):
+        return self.__myData
 
-        aWriter = JSONWriter(aFile)
-        aWriter.OpenSection()
-        aWriter.WriteData("version", "1")
+    def Version(self):
+        return self.__myVersion
 
-        if not self.__myData:
-            aWriter.WriteData("error", "The model doesn't contain any parts.")
-        else:
-            aWriter.OpenArraySection("parts")
+    def ToWriteCBOR(self):
+        return self.__myToWriteCBOR
+
+    def Measurements(self):
+        return self.__myMeasurements
+
+    # The report as a model.Report, built on first use and shared by the
+    # JSON and CBOR reports
+    def Model(self):
+        if self.__myModel is None:
+            aModel = model.Report()
             for aProcessData in self.__myData:
-                aWriter.OpenSection()
-                MTKConverter_Report.__WritePartProcessData(aWriter, aProcessData)
-                aWriter.CloseSection()
-            aWriter.CloseArraySection()
-        aWriter.CloseSection()
+                if type(aProcessData) is part_proc.MTKConverter_SerializedData:
+                    aPartReport = aProcessData.myPartReport
+                    if aPartReport.Measurements is None:
+                        aPartReport.Measurements = self.__myMeasurements.Part(aProcessData.myPart)
+                else:
+                    aPartReport = MTKConverter_Report.BuildPartReport(aProcessData, self.__myMeasurements)
+                aPartReport.PartId = str(aProcessData.myPart.Uuid())
+                aModel.Parts.append(aPartReport)
+            self.__myModel = aModel
+        return self.__myModel
+
+    def WriteToJSON(self, thePath: str):
+        # A report that failed half way isn't left behind
+        try:
+            with open(thePath, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+                aWriter = JSONWriter(f, 0, self.__myVersion >= 2)
+                ReportSerializer.Write(aWriter, self.Model(), self.__myVersion)
+        except BaseException:
+            if os.path.exists(thePath):
+                os.remove(thePath)
+            raise
+        return True
+
+    # Same content as the version 2 JSON report, but shape ids are listed in
+    # place as uint64 arrays and numbers aren't rounded
+    def WriteToCBOR(self, thePath: str):
+        aWriter = TreeWriter()
+        ReportSerializer.Write(aWriter, self.Model(), 2)
 
-        aFile.close()
+        with open(thePath, "wb") as f:
+            f.write(cbor.Encode(aWriter.Root()))
         return True
 
     @staticmethod
-    def __WriteParameter(theWriter: JSONWriter, theParamName: str, theParamUnits: str, theParamValue):
-        theWriter.OpenSection()
-        theWriter.WriteData("name", theParamName)
-        theWriter.WriteData("units", theParamUnits)
-        theWriter.WriteData("value", theParamValue)
-        theWriter.CloseSection()
+    def __FeatureData0(theVector):
+        return model.FeatureSubGroup(None, theVector)
 
     @staticmethod
-    def __WriteShapeIDs(theWriter: JSONWriter, theVector, theWriteFeatureSection: bool):
-        if not theVector:
-            return
+    def __FeatureData1(theParamName: str, theParamUnits: str, theParamValue, theVector):
+        return model.FeatureSubGroup([model.Parameter(theParamName, theParamUnits, theParamValue)], theVector)
 
-        if theWriteFeatureSection:
-            theWriter.OpenArraySection("features")
+    @staticmethod
+    def __FeatureData2(theParamName1: str, theParamUnits1: str, theParamValue1,
+                       theParamName2: str, theParamUnits2: str, theParamValue2,
+                       theVector):
+        return model.FeatureSubGroup([model.Parameter(theParamName1, theParamUnits1, theParamValue1),
+                                      model.Parameter(theParamName2, theParamUnits2, theParamValue2)], theVector)
 
-        for aShapeIDVector in theVector:
-            theWriter.OpenSection()
-            theWriter.WriteData("shapeIDCount", len(aShapeIDVector))
-            if not aShapeIDVector:
-                theWriter.WriteEmptyArray("shapeIDs")
-            else:
-                theWriter.OpenArraySection("shapeIDs")
-                for aShapeID in aShapeIDVector:
-                    theWriter.OpenSection()
-                    theWriter.WriteData("id", aShapeID)
-                    theWriter.CloseSection()
-                theWriter.CloseArraySection()
-            theWriter.CloseSection()
+    @staticmethod
+    def __FeatureData3(theParamName1: str, theParamUnits1: str, theParamValue1,
+                       theParamName2: str, theParamUnits2: str, theParamValue2,
+                       theParamName3: str, theParamUnits3: str, theParamValue3,
+                       theVector):
+        return model.FeatureSubGroup([model.Parameter(theParamName1, theParamUnits1, theParamValue1),
+                                      model.Parameter(theParamName2, theParamUnits2, theParamValue2),
+                                      model.Parameter(theParamName3, theParamUnits3, theParamValue3)], theVector)
 
-        if theWriteFeatureSection:
-            theWriter.CloseArraySection()
+    @staticmethod
+    def __FeatureData4(theParamName1: str, theParamUnits1: str, theParamValue1,
+                       theParamName2: str, theParamUnits2: str, theParamValue2,
+                       theParamName3: str, theParamUnits3: str, theParamValue3,
+                       theParamName4: str, theParamUnits4: str, theParamValue4,
+                       theVector):
+        return model.FeatureSubGroup([model.Parameter(theParamName1, theParamUnits1, theParamValue1),
+                                      model.Parameter(theParamName2, theParamUnits2, theParamValue2),
+                                      model.Parameter(theParamName3, theParamUnits3, theParamValue3),
+                                      model.Parameter(theParamName4, theParamUnits4, theParamValue4)], theVector)
 
     @staticmethod
-    def __DoWriteFeatureDataToString (theFunc, theParamCount: int, theVector):
-        aStream = io.StringIO()
-        aWriter = JSONWriter(aStream, 7)
-
-        aWriter.OpenSection()
-        aWriter.WriteData("parametersCount", theParamCount)
-        aWriter.OpenArraySection("parameters")
-        theFunc(aWriter)
-        aWriter.CloseArraySection()
-        MTKConverter_Report.__WriteShapeIDs(aWriter, theVector, True)
-        aWriter.CloseSection()
-
-        aRes = aStream.getvalue()
-        aStream.close()
-        return aRes
-
-    @staticmethod
-    def __WriteFeatureDataToString0(theVector):
-        aStream = io.StringIO()
-        aWriter = JSONWriter(aStream, 6)
-
-        MTKConverter_Report.__WriteShapeIDs(aWriter, theVector, False)
-
-        aRes = aStream.getvalue()
-        aStream.close()
-        return aRes
-
-    @staticmethod
-    def __WriteFeatureDataToString1(theParamName: str, theParamUnits: str, theParamValue, theVector):
-        def WriteParams (theWriter: JSONWriter):
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName, theParamUnits, theParamValue)
-        return MTKConverter_Report.__DoWriteFeatureDataToString(WriteParams, 1, theVector)
-
-    @staticmethod
-    def __WriteFeatureDataToString2(theParamName1: str, theParamUnits1: str, theParamValue1,
-                                    theParamName2: str, theParamUnits2: str, theParamValue2,
-                                    theVector):
-        def WriteParams (theWriter: JSONWriter):
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName1, theParamUnits1, theParamValue1)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName2, theParamUnits2, theParamValue2)
-        return MTKConverter_Report.__DoWriteFeatureDataToString (WriteParams, 2, theVector)
-
-    @staticmethod
-    def __WriteFeatureDataToString3(theParamName1: str, theParamUnits1: str, theParamValue1,
-                                    theParamName2: str, theParamUnits2: str, theParamValue2,
-                                    theParamName3: str, theParamUnits3: str, theParamValue3,
-                                    theVector):
-        def WriteParams (theWriter: JSONWriter):
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName1, theParamUnits1, theParamValue1)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName2, theParamUnits2, theParamValue2)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName3, theParamUnits3, theParamValue3)
-        return MTKConverter_Report.__DoWriteFeatureDataToString (WriteParams, 3, theVector)
-
-    @staticmethod
-    def __WriteFeatureDataToString4(theParamName1: str, theParamUnits1: str, theParamValue1,
-                                    theParamName2: str, theParamUnits2: str, theParamValue2,
-                                    theParamName3: str, theParamUnits3: str, theParamValue3,
-                                    theParamName4: str, theParamUnits4: str, theParamValue4,
-                                    theVector):
-        def WriteParams (theWriter: JSONWriter):
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName1, theParamUnits1, theParamValue1)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName2, theParamUnits2, theParamValue2)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName3, theParamUnits3, theParamValue3)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName4, theParamUnits4, theParamValue4)
-        return MTKConverter_Report.__DoWriteFeatureDataToString (WriteParams, 4, theVector)
-
-    @staticmethod
-    def __WriteFeatureDataToString6(theParamName1: str, theParamUnits1: str, theParamValue1,
-                                    theParamName2: str, theParamUnits2: str, theParamValue2,
-                                    theParamName3: str, theParamUnits3: str, theParamValue3,
-                                    theParamName4: str, theParamUnits4: str, theParamValue4,
-                                    theParamName5: str, theParamUnits5: str, theParamValue5,
-                                    theParamName6: str, theParamUnits6: str, theParamValue6,
-                                    theVector):
-        def WriteParams (theWriter: JSONWriter):
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName1, theParamUnits1, theParamValue1)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName2, theParamUnits2, theParamValue2)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName3, theParamUnits3, theParamValue3)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName4, theParamUnits4, theParamValue4)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName5, theParamUnits5, theParamValue5)
-            MTKConverter_Report.__WriteParameter(theWriter, theParamName6, theParamUnits6, theParamValue6)
-        return MTKConverter_Report.__DoWriteFeatureDataToString (WriteParams, 6, theVector)
+    def __FeatureData6(theParamName1: str, theParamUnits1: str, theParamValue1,
+                       theParamName2: str, theParamUnits2: str, theParamValue2,
+                       theParamName3: str, theParamUnits3: str, theParamValue3,
+                       theParamName4: str, theParamUnits4: str, theParamValue4,
+                       theParamName5: str, theParamUnits5: str, theParamValue5,
+                       theParamName6: str, theParamUnits6: str, theParamValue6,
+                       theVector):
+        return model.FeatureSubGroup([model.Parameter(theParamName1, theParamUnits1, theParamValue1),
+                                      model.Parameter(theParamName2, theParamUnits2, theParamValue2),
+                                      model.Parameter(theParamName3, theParamUnits3, theParamValue3),
+                                      model.Parameter(theParamName4, theParamUnits4, theParamValue4),
+                                      model.Parameter(theParamName5, theParamUnits5, theParamValue5),
+                                      model.Parameter(theParamName6, theParamUnits6, theParamValue6)], theVector)
 
     @staticmethod
     def __MachiningFaceTypeToString(theType):
@@ -664,1117 +965,1185 @@ class MTKConverter_Report:
         return "(0, 0, 0)"
 
     @staticmethod
-    def __AddShapeFeature(theManager: FeatureGroupManager, theFeature: mtk.MTKBase_ShapeFeature, theCount: int, theShapeIdVector):
-        aFeature = theFeature
-        #machining
-        if mtk.Machining_TurningFace.CompareType(aFeature):
-            aTurningFace = mtk.Machining_TurningFace.Cast(aFeature)
-            aType = aTurningFace.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1("Radius", "mm", aTurningFace.Radius(), theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__MachiningFaceTypeToString(aType),
-                                    MTKConverter_Report.__MachiningFaceColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_Face.CompareType(aFeature):
-            aFace = mtk.Machining_Face.Cast(aFeature)
-            aType = aFace.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__MachiningFaceTypeToString(aType),
-                                    MTKConverter_Report.__MachiningFaceColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_Countersink.CompareType(aFeature):
-            aCountersink = mtk.Machining_Countersink.Cast(aFeature)
-            anAxis = aCountersink.Axis().Axis()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Radius", "mm", aCountersink.Radius(),
-                "Depth",  "mm", aCountersink.Depth(),
-                "Axis",    "",  aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData("Countersink(s)", "(55, 125, 34)", aFeatureData, theCount)
-        elif mtk.Machining_ThreadedHole.CompareType(aFeature):
-            aThreadedHole = mtk.Machining_ThreadedHole.Cast(aFeature)
-            anAxis = aThreadedHole.Axis().Axis()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aType = aThreadedHole.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString6(
-                "Minor radius",  "mm", aThreadedHole.MinorRadius(),
-                "Major radius",  "mm", aThreadedHole.MajorRadius(),
-                "Thread length", "mm", aThreadedHole.ThreadLength(),
-                "Pitch",         "mm", aThreadedHole.Pitch(),
-                "Depth",         "mm", aThreadedHole.Depth(),
-                "Axis",          "",   aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData("Threaded " + MTKConverter_Report.__MachiningHoleTypeToString(aType),
-                                    MTKConverter_Report.__MachiningThreadedHoleColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_Hole.CompareType(aFeature):
-            aHole = mtk.Machining_Hole.Cast(aFeature)
-            anAxis = aHole.Axis().Axis()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aType = aHole.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Radius", "mm", aHole.Radius(),
-                "Depth",  "mm", aHole.Depth(),
-                "Axis",    "",  aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__MachiningHoleTypeToString(aType),
-                                    MTKConverter_Report.__MachiningHoleColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_SteppedHole.CompareType(aFeature):
-            aSteppedHole = mtk.Machining_SteppedHole.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1(
-                "Depth",  "mm", aSteppedHole.Depth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Stepped Hole(s)", "(204, 0, 125)", aFeatureData, theCount)
-        elif mtk.Machining_Pocket.CompareType(aFeature):
-            aPocket = mtk.Machining_Pocket.Cast(aFeature)
-            anAxis = aPocket.Axis().Direction()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aType = aPocket.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString4(
-                "Length", "mm", aPocket.Length(),
-                "Width",  "mm", aPocket.Width(),
-                "Depth",  "mm", aPocket.Depth(),
-                "Axis",    "",  aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__MachiningPocketTypeToString(aType),
-                                    MTKConverter_Report.__MachiningPocketColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_TurningGroove.CompareType(aFeature):
-            aTurningGroove = mtk.Machining_TurningGroove.Cast(aFeature)
-            aType = aTurningGroove.Type()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Radius", "mm", aTurningGroove.Radius(),
-                "Depth",  "mm", aTurningGroove.Depth(),
-                "Width",  "mm", aTurningGroove.Width(),
-                theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__MachiningTurningGrooveTypeToString(aType),
-                                    MTKConverter_Report.__MachiningTurningGrooveColor(aType),
-                                    aFeatureData, theCount)
-        elif mtk.Machining_Bore.CompareType(aFeature):
-            aBore = mtk.Machining_Bore.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Radius", "mm", aBore.Radius(),
-                "Depth",  "mm", aBore.Depth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Bore(s)", "(127, 130, 187)", aFeatureData, theCount)
-
-        #molding
-        elif mtk.Molding_ScrewBoss.CompareType(aFeature):
-            aScrewBoss = mtk.Molding_ScrewBoss.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Outer Radius", "mm",  aScrewBoss.OuterRadius(),
-                "Inner Radius", "mm",  aScrewBoss.InnerRadius(),
-                "Draft Angle",  "deg", aScrewBoss.DraftAngle() * 180 / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Screw Boss(es)", "(12, 32, 63)", aFeatureData, theCount)
-        elif mtk.MTKBase_Boss.CompareType(aFeature):
-            aBoss = mtk.MTKBase_Boss.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Length", "mm", aBoss.Length(),
-                "Width",  "mm", aBoss.Width(),
-                "Height", "mm", aBoss.Height(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Boss(es)", "(56, 72, 13)", aFeatureData, theCount)
-        elif mtk.Molding_Rib.CompareType(aFeature):
-            aRib = mtk.Molding_Rib.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString4(
-                "Length",      "mm",  aRib.Length(),
-                "Height",      "mm",  aRib.Height(),
-                "Thickness",   "mm",  aRib.Thickness(),
-                "Draft Angle", "deg", aRib.DraftAngle() * 180 / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Rib(s)", "(34, 51, 127)", aFeatureData, theCount)
-
-        #sheet metal
-        elif mtk.SheetMetal_FormingFeature.CompareType(aFeature):
-            aFormingFeature = mtk.SheetMetal_FormingFeature.Cast(aFeature)
-            anAxis = aFormingFeature.Axis().Direction()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Depth", "mm", aFormingFeature.Depth(),
-                "Length", "mm", aFormingFeature.Length(),
-                "Axis", "", aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData("Forming Feature(s)", "(235, 211, 253)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Bead.CompareType(aFeature):
-            aBead = mtk.SheetMetal_Bead.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1("Depth", "mm", aBead.Depth(), theShapeIdVector)
-            theManager.AddGroupData("Bead(s)", "(115, 251, 253)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Bend.CompareType(aFeature):
-            aBend = mtk.SheetMetal_Bend.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString4(
-                "Radius", "mm",  aBend.Radius(),
-                "Angle",  "deg", aBend.Angle() * 180 / math.pi,
-                "Length", "mm",  aBend.Length(),
-                "Width",  "mm",  aBend.Width(),
-                theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__BendName(aBend), MTKConverter_Report.__BendColor(aBend),
-                                    aFeatureData, theCount)
-        elif mtk.SheetMetal_Bridge.CompareType(aFeature):
-            aBridge = mtk.SheetMetal_Bridge.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Length", "mm", aBridge.Length(),
-                "Depth",  "mm", aBridge.Depth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Bridge(s)", "(240, 155, 89)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Hole.CompareType(aFeature):
-            aHole = mtk.SheetMetal_Hole.Cast(aFeature)
-            anAxis = aHole.Axis().Axis()
-            aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Radius", "mm", aHole.Radius(),
-                "Depth",  "mm", aHole.Depth(),
-                "Axis",    "",  aDirection,
-                theShapeIdVector)
-            theManager.AddGroupData (MTKConverter_Report.__SheetMetalHoleName(aHole),
-                                     MTKConverter_Report.__SheetMetalHoleColor(aHole),
-                                     aFeatureData, theCount)
-        elif mtk.SheetMetal_Cutout.CompareType(aFeature):
-            aCutout = mtk.SheetMetal_Cutout.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1("Perimeter", "mm", aCutout.Perimeter(), theShapeIdVector)
-            theManager.AddGroupData ("Cutout(s)", "(88, 19, 94)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Louver.CompareType(aFeature):
-            aLouver = mtk.SheetMetal_Louver.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1(
-                "Depth",  "mm", aLouver.Depth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Louver(s)", "(161, 251, 142)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Notch.CompareType(aFeature):
-            aNotch = mtk.SheetMetal_Notch.Cast(aFeature)
-            if mtk.SheetMetal_StraightNotch.CompareType(aNotch):
-                aStraightNotch = mtk.SheetMetal_StraightNotch.Cast(aNotch)
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                    "Length", "mm", aNotch.Length(),
-                    "Width",  "mm", aNotch.Width(),
-                    "Corner Fillet Radius", "mm", aStraightNotch.CornerFilletRadius(),
-                    theShapeIdVector)
-                theManager.AddGroupData ("Straight Notch(es)", "(240, 135, 132)", aFeatureData, theCount)
-            elif mtk.SheetMetal_VNotch.CompareType(aNotch):
-                aVNotch = mtk.SheetMetal_VNotch.Cast(aNotch)
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                    "Length", "mm", aNotch.Length(),
-                    "Width",  "mm", aNotch.Width(),
-                    "Angle", "deg", aVNotch.Angle() * 180 / math.pi,
-                    theShapeIdVector)
-                theManager.AddGroupData ("V Notch(es)", "(235, 51, 36)", aFeatureData, theCount)
-            else:
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                    "Length", "mm", aNotch.Length(),
-                    "Width",  "mm", aNotch.Width(),
-                    theShapeIdVector)
-                theManager.AddGroupData("Notch(es)", "(239, 136, 190)", aFeatureData, theCount)
-        elif mtk.SheetMetal_Tab.CompareType(aFeature):
-            aTab = mtk.SheetMetal_Tab.Cast(aFeature)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Length", "mm", aTab.Length(),
-                "Width",  "mm", aTab.Width(),
-                theShapeIdVector)
-            theManager.AddGroupData("Tab(s)", "(127, 130, 187)", aFeatureData, theCount)
+    def __ShapeFeatureWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            #machining
+            (mtk.Machining_TurningFace, MTKConverter_Report.__AddMachiningTurningFace),
+            (mtk.Machining_Face, MTKConverter_Report.__AddMachiningFace),
+            (mtk.Machining_Countersink, MTKConverter_Report.__AddMachiningCountersink),
+            (mtk.Machining_ThreadedHole, MTKConverter_Report.__AddMachiningThreadedHole),
+            (mtk.Machining_Hole, MTKConverter_Report.__AddMachiningHole),
+            (mtk.Machining_SteppedHole, MTKConverter_Report.__AddMachiningSteppedHole),
+            (mtk.Machining_Pocket, MTKConverter_Report.__AddMachiningPocket),
+            (mtk.Machining_TurningGroove, MTKConverter_Report.__AddMachiningTurningGroove),
+            (mtk.Machining_Bore, MTKConverter_Report.__AddMachiningBore),
+            #molding
+            (mtk.Molding_ScrewBoss, MTKConverter_Report.__AddMoldingScrewBoss),
+            (mtk.MTKBase_Boss, MTKConverter_Report.__AddMTKBaseBoss),
+            (mtk.Molding_Rib, MTKConverter_Report.__AddMoldingRib),
+            #sheet metal
+            (mtk.SheetMetal_FormingFeature, MTKConverter_Report.__AddSheetMetalFormingFeature),
+            (mtk.SheetMetal_Bead, MTKConverter_Report.__AddSheetMetalBead),
+            (mtk.SheetMetal_Bend, MTKConverter_Report.__AddSheetMetalBend),
+            (mtk.SheetMetal_Bridge, MTKConverter_Report.__AddSheetMetalBridge),
+            (mtk.SheetMetal_Hole, MTKConverter_Report.__AddSheetMetalHole),
+            (mtk.SheetMetal_Cutout, MTKConverter_Report.__AddSheetMetalCutout),
+            (mtk.SheetMetal_Louver, MTKConverter_Report.__AddSheetMetalLouver),
+            (mtk.SheetMetal_StraightNotch, MTKConverter_Report.__AddSheetMetalStraightNotch),
+            (mtk.SheetMetal_VNotch, MTKConverter_Report.__AddSheetMetalVNotch),
+            (mtk.SheetMetal_Notch, MTKConverter_Report.__AddSheetMetalNotch),
+            (mtk.SheetMetal_Tab, MTKConverter_Report.__AddSheetMetalTab),
+        )
 
     @staticmethod
-    def __AddDrillingIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_DrillingIssue, theCount: int, theShapeIdVector):
-        if mtk.DFMMachining_SmallDiameterHoleIssue.CompareType(theIssue):
-            aSmallHoleIssue = mtk.DFMMachining_SmallDiameterHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Diameter", "mm", aSmallHoleIssue.ExpectedMinDiameter(),
-                "Actual Diameter", "mm", aSmallHoleIssue.ActualDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Diameter Hole(s)", "(115, 251, 253)", aFeatureData, theCount)
-        elif mtk.DFMMachining_DeepHoleIssue.CompareType(theIssue):
-            aDeepHoleIssue = mtk.DFMMachining_DeepHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Depth", "mm", aDeepHoleIssue.ExpectedMaxDepth(),
-                "Actual Depth", "mm", aDeepHoleIssue.ActualDepth(), theShapeIdVector)
-            theManager.AddGroupData("Deep Hole(s)", "(0, 35, 245)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NonStandardDiameterHoleIssue.CompareType(theIssue):
-            aNSDiameterHoleIssue = mtk.DFMMachining_NonStandardDiameterHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Nearest Standard Diameter", "mm", aNSDiameterHoleIssue.NearestStandardDiameter(),
-                "Actual Diameter", "mm", aNSDiameterHoleIssue.ActualDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Non Standard Diameter Hole(s)", "(22, 65, 124)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NonStandardDrillPointAngleBlindHoleIssue.CompareType(theIssue):
-            aNSDrillPointAngleBlindHoleIssue = mtk.DFMMachining_NonStandardDrillPointAngleBlindHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Nearest Standard Angle", "deg", aNSDrillPointAngleBlindHoleIssue.NearestStandardAngle() * 180 / math.pi,
-                "Actual Angle", "deg", aNSDrillPointAngleBlindHoleIssue.ActualAngle() * 180 / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Non Standard Drill Point Angle Blind Hole(s)", "(88, 13, 78)", aFeatureData, theCount)
-        elif mtk.DFMMachining_PartialHoleIssue.CompareType(theIssue):
-            aPartialHoleIssue = mtk.DFMMachining_PartialHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Material Percent", "%", aPartialHoleIssue.ExpectedMinMaterialPercent() * 100,
-                "Actual Material Percent", "%", aPartialHoleIssue.ActualMaterialPercent() * 100,
-                theShapeIdVector)
-            theManager.AddGroupData("Partial Hole(s)", "(255, 254, 145)", aFeatureData, theCount)
-        elif mtk.DFMMachining_FlatBottomHoleIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Flat Bottom Hole(s)", "(240, 155, 89)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NonPerpendicularHoleIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Non Perpendicular Hole(s)", "(129, 127, 38)", aFeatureData, theCount)
-        elif mtk.DFMMachining_IntersectingCavityHoleIssue.Cast(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Intersecting Cavity Hole(s)", "(115, 43, 245)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue.CompareType(theIssue):
-            anIssue = mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue.Cast(theIssue)
-            aTHole = mtk.Machining_ThreadedHole.Cast(anIssue.Hole());
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString4(
-                "Expected Minimum Distance", "mm", anIssue.ExpectedMinDistance(),
-                "Actual Distance", "mm", anIssue.ActualDistance(),
-                "Actual Diameter", "mm", aTHole.MajorRadius() * 2,
-                "Expected Minimum Distance To Diameter Ratio", "mm", anIssue.ExpectedMinDistanceToDiameterRatio(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Distance Between Threaded Hole And Edge(s)", "(142, 65, 213)", aFeatureData, theCount)
+    def __AddMachiningTurningFace(theManager: FeatureGroupManager, theTurningFace: mtk.Machining_TurningFace, theCount: int, theShapeIdVector):
+        aType = theTurningFace.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData1("Radius", "mm", theTurningFace.Radius(), theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__MachiningFaceTypeToString(aType),
+                                MTKConverter_Report.__MachiningFaceColor(aType),
+                                aFeatureData, theCount)
 
     @staticmethod
-    def __AddMillingIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_MillingIssue, theCount: int, theShapeIdVector):
-        if mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue.CompareType(theIssue):
-            aFloorRadiusIssue = mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Nearest Standard Radius", "mm", aFloorRadiusIssue.NearestStandardRadius(),
-                "Actual Radius", "mm", aFloorRadiusIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Non Standard Radius Milled Part Floor Fillet Issue(s)", "(0, 215, 3)", aFeatureData, theCount)
-        elif mtk.DFMMachining_DeepPocketIssue.CompareType(theIssue):
-            aDeepPocketIssue = mtk.DFMMachining_DeepPocketIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Depth", "mm", aDeepPocketIssue.ExpectedMaxDepth(),
-                "Actual Depth", "mm", aDeepPocketIssue.ActualDepth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Deep Pocket Issue(s)", "(190, 10, 100)", aFeatureData, theCount)
-        elif mtk.DFMMachining_HighBossIssue.CompareType(theIssue):
-            aHighBossIssue = mtk.DFMMachining_HighBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Height", "mm", aHighBossIssue.ExpectedMaxHeight(),
-                "Actual Height", "mm", aHighBossIssue.ActualHeight(),
-                theShapeIdVector)
-            theManager.AddGroupData("High Boss Issue(s)", "(180, 100, 50)", aFeatureData, theCount)
-        elif mtk.DFMMachining_LargeMilledPartIssue.CompareType(theIssue):
-            aLMPIssue = mtk.DFMMachining_LargeMilledPartIssue.Cast(theIssue)
-            anExpectedSize = aLMPIssue.ExpectedMaxMilledPartSize()
-            anActualSize = aLMPIssue.ActualMilledPartSize()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Size (LxWxH)", "mm",
-                Dimension(anExpectedSize.Length(), anExpectedSize.Width(), anExpectedSize.Height()),
-                "Actual Size (LxWxH)", "mm",
-                Dimension(anActualSize.Length(), anActualSize.Width(), anActualSize.Height()),
-                theShapeIdVector)
-            theManager.AddGroupData("Large Milled Part(s)", "(17, 37, 205)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue.CompareType(theIssue):
-            aMSICRIssue = mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Radius", "mm", aMSICRIssue.ExpectedMinRadius(),
-                "Actual Radius", "mm", aMSICRIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Radius Milled Part Internal Corner(s)", "(10, 10, 200)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue.CompareType(theIssue):
-            aNPMPSIssue = mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString1(
-                "Actual Angle", "deg", aNPMPSIssue.ActualAngle() * 180 / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Non Perpendicular Milled Part Shape(s)", "(129, 227, 138)", aFeatureData, theCount)
-        elif mtk.DFMMachining_MilledPartExternalEdgeFilletIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Milled Part External Edge Fillet(s)", "(201, 227, 13)", aFeatureData, theCount)
-        elif mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue.CompareType(theIssue):
-            anInconsistentRadiusIssue = mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Radius", "mm", anInconsistentRadiusIssue.ExpectedRadius(),
-                "Actual Radius", "mm", anInconsistentRadiusIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Inconsistent Radius Milled Part Floor Fillet Issue(s)", "(180, 15, 190)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NarrowRegionInPocketIssue.CompareType(theIssue):
-            aNarrowRegionIssue = mtk.DFMMachining_NarrowRegionInPocketIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Region Size", "mm", aNarrowRegionIssue.ExpectedMinRegionSize(),
-                "Actual Region Size", "mm", aNarrowRegionIssue.ActualRegionSize(),
-                theShapeIdVector)
-            theManager.AddGroupData("Narrow Region In Pocket Issue(s)", "(70, 150, 150)", aFeatureData, theCount)
-        elif mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue.CompareType(theIssue):
-            aLargeRatioIssue = mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Regions Maximum To Minimum Size Ratio", "", aLargeRatioIssue.ExpectedMaxRegionsMaxToMinSizeRatio(),
-                "Actual Regions Maximum To Minimum Size Ratio", "", aLargeRatioIssue.ActualMaxRegionsMaxToMinSizeRatio(),
-                theShapeIdVector)
-            theManager.AddGroupData("Large Difference Regions Size In Pocket Issue(s)", "(100, 150, 150)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SmallWallThicknessIssue.CompareType(theIssue):
-            aSWTIssue = mtk.DFMMachining_SmallWallThicknessIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Thickness", "mm", aSWTIssue.ExpectedMinThickness(),
-                "Actual Thickness", "mm", aSWTIssue.ActualThickness(), 
-                theShapeIdVector)
-            theManager.AddGroupData("Small Wall Thickness Issue(s)", "(64, 224, 208)", aFeatureData, theCount)
+    def __AddMachiningFace(theManager: FeatureGroupManager, theFace: mtk.Machining_Face, theCount: int, theShapeIdVector):
+        aType = theFace.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__MachiningFaceTypeToString(aType),
+                                MTKConverter_Report.__MachiningFaceColor(aType),
+                                aFeatureData, theCount)
 
     @staticmethod
-    def __AddTurningIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMBase_Issue, theCount: int, theShapeIdVector):
-        if mtk.DFMMachining_LargeTurnedPartIssue.CompareType(theIssue):
-            aLTSIssue = mtk.DFMMachining_LargeTurnedPartIssue.Cast(theIssue)
-            anExpectedSize = aLTSIssue.ExpectedMaxTurnedPartSize()
-            anActualSize = aLTSIssue.ActualTurnedPartSize()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Size (LxR)", "mm", Pair(anExpectedSize.Length(), anExpectedSize.Radius()),
-                "Actual Size (LxR)", "mm", Pair(anActualSize.Length(), anActualSize.Radius()),
-                theShapeIdVector)
-            theManager.AddGroupData("Large Turned Part(s)", "(195, 195, 195)", aFeatureData, theCount)
-        elif mtk.DFMMachining_LongSlenderTurnedPartIssue.CompareType(theIssue):
-            aLSTIssue = mtk.DFMMachining_LongSlenderTurnedPartIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Maximum Length", "mm", aLSTIssue.ExpectedMaxLength(),
-                "Actual Length", "mm", aLSTIssue.ActualLength(),
-                "Actual Minimum Diameter", "mm", aLSTIssue.ActualMinDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Long-Slender Turned Part(s)", "(195, 195, 195)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue.CompareType(theIssue):
-            aBBHRIssue = mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Minimum Relief Depth", "mm", aBBHRIssue.ExpectedMinReliefDepth(),
-                "Actual Relief Depth", "mm", aBBHRIssue.ActualReliefDepth(),
-                "Actual Diameter", "mm", aBBHRIssue.ActualDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Depth Blind Bored Hole Relief(s)", "(88, 19, 94)", aFeatureData, theCount)
-        elif mtk.DFMMachining_DeepBoredHoleIssue.CompareType(theIssue):
-            aISBHIssue = mtk.DFMMachining_DeepBoredHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Maximum Depth", "mm", aISBHIssue.ExpectedMaxDepth(),
-                "Actual Depth", "mm", aISBHIssue.ActualDepth(),
-                "Actual Diameter", "mm", aISBHIssue.ActualDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Deep Bored Hole(s)", "(161, 251, 142)", aFeatureData, theCount)
-        elif mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue.CompareType(theIssue):
-            aODPRIssue = mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Face Incline Angle", "deg", aODPRIssue.ExpectedMaxFaceInclineAngle() * 180 / math.pi,
-                "Actual Face Incline Angle", "deg", aODPRIssue.ActualFaceInclineAngle() * 180 / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Turned Part Outer Diameter Profile Relief(s)", "(239, 136, 190)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue.CompareType(theIssue):
-            aTSICRIssue = mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Radius", "mm", aTSICRIssue.ExpectedMinRadius(),
-                "Actual Radius", "mm", aTSICRIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Radius Turned Part Internal Corner(s)", "(127, 130, 187)", aFeatureData, theCount)
-        elif mtk.DFMMachining_SquareEndKeywayIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Square End Keyway(s)", "(157, 160, 207)", aFeatureData, theCount)
-        elif mtk.DFMMachining_NonSymmetricalAxialSlotIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Non Symmetrical Axial Slot(s)", "(130, 170, 200)", aFeatureData, theCount)
-
-    @staticmethod
-    def __AddMoldingIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMBase_Issue, theCount: int, theShapeIdVector):
-        if mtk.DFMMolding_HighRibIssue.CompareType(theIssue):
-            aHRIssue = mtk.DFMMolding_HighRibIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Height", "mm", aHRIssue.ExpectedMaxHeight(),
-                "Actual Height", "mm", aHRIssue.ActualHeight(),
-                theShapeIdVector)
-            theManager.AddGroupData("High Rib(s)", "(284, 36, 12)", aFeatureData, theCount)
-        elif mtk.DFMMolding_HighScrewBossIssue.CompareType(theIssue):
-            aHSBIssue = mtk.DFMMolding_HighScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Height", "mm", aHSBIssue.ExpectedMaxHeight(),
-                "Actual Height", "mm", aHSBIssue.ActualHeight(),
-                theShapeIdVector)
-            theManager.AddGroupData("High Screw Boss(es)", "(16, 75, 95)", aFeatureData, theCount)
-        elif mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.CompareType(theIssue):
-            aICDSBIssue = mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Actual Height", "mm", aICDSBIssue.ActualHeight(),
-                "Actual Core Depth", "mm", aICDSBIssue.ActualCoreDepth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Core Depth Screw Boss(es)", "(56, 176, 95)", aFeatureData, theCount)
-        elif mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.CompareType(theIssue):
-            aICDSBIssue = mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Minimum Outer Diameter", "mm", aICDSBIssue.ExpectedMinCoreDiameter(),
-                "Expected Maximum Outer Diameter", "mm", aICDSBIssue.ExpectedMaxCoreDiameter(),
-                "actual core diameter", "mm", aICDSBIssue.ActualCoreDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Core Diameter Screw Boss(es)", "(195, 195, 195)", aFeatureData, theCount)
-        elif mtk.DFMMolding_IrregularThicknessRibIssue.CompareType(theIssue):
-            aITRIssue = mtk.DFMMolding_IrregularThicknessRibIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Minimum Thickness", "mm", aITRIssue.ExpectedMinThickness(),
-                "Expected Maximum Thickness", "mm", aITRIssue.ExpectedMaxThickness(),
-                "Actual Thickness", "mm", aITRIssue.ActualThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Thickness Rib(s)", "(68, 114, 250)", aFeatureData, theCount)
-        elif mtk.DFMMolding_IrregularWallThicknessIssue.CompareType(theIssue):
-            aIWTIssue = mtk.DFMMolding_IrregularWallThicknessIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Maximum Wall Thickness", "mm", aIWTIssue.ExpectedMaxThickness(),
-                "Expected Minimum Wall Thickness", "mm", aIWTIssue.ExpectedMinThickness(),
-                "Actual Wall Thickness", "mm", aIWTIssue.ActualThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Irregular Wall(s)", "(23, 11, 19)", aFeatureData, theCount)
-        elif mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.CompareType(theIssue):
-            aIWTSBIssue = mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Maximum Thickness", "mm", aIWTSBIssue.ExpectedMaxThickness(),
-                "Expected Minimum Thickness", "mm", aIWTSBIssue.ExpectedMinThickness(),
-                "Actual Thickness", "mm", aIWTSBIssue.ActualThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Wall Thickness Screw Boss(es)", "(13, 12, 245)", aFeatureData, theCount)
-        elif mtk.DFMMolding_LargeWallThicknessIssue.CompareType(theIssue):
-            aLWTIssue = mtk.DFMMolding_LargeWallThicknessIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Wall Thickness", "mm", aLWTIssue.ExpectedMaxThickness(),
-                "Actual Wall Thickness", "mm", aLWTIssue.ActualThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Large Wall(s)", "(101, 22, 129)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallBaseRadiusRibIssue.CompareType(theIssue):
-            aSBRRIssue = mtk.DFMMolding_SmallBaseRadiusRibIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Base Radius", "mm", aSBRRIssue.ExpectedMinBaseRadius(),
-                "Actual Base Radius", "mm", aSBRRIssue.ActualBaseRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Small Base Radius Rib(s)", "(13, 12, 90)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.CompareType(theIssue):
-            aSBRSBIssue = mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Base Radius", "mm", aSBRSBIssue.ExpectedMinBaseRadius(),
-                "Actual Base Radius", "mm", aSBRSBIssue.ActualBaseRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Small Base Radius Screw Boss(es)", "(56, 18, 23)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallDraftAngleRibIssue.CompareType(theIssue):
-            aSDARIssue = mtk.DFMMolding_SmallDraftAngleRibIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Draft Angle", "deg", aSDARIssue.ExpectedMinDraftAngle() * 180. / math.pi,
-                "Actual Draft Angle", "deg", aSDARIssue.ActualDraftAngle() * 180. / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Small Draft Angle Rib(s)", "(189, 200, 13)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallDistanceBetweenRibsIssue.CompareType(theIssue):
-            aSDBRIssue = mtk.DFMMolding_SmallDistanceBetweenRibsIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Distance", "mm", aSDBRIssue.ExpectedMinDistanceBetweenRibs(),
-                "Actual Distance", "mm", aSDBRIssue.ActualDistanceBetweenRibs(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Distance Between Ribs Issue(s)", "(11, 90, 111)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallDraftAngleScrewBossIssue.CompareType(theIssue):
-            aSDASBIssue = mtk.DFMMolding_SmallDraftAngleScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Draft Angle", "deg", aSDASBIssue.ExpectedMinDraftAngle() * 180. / math.pi,
-                "Actual Draft Angle", "deg", aSDASBIssue.ActualDraftAngle() * 180. / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Small Draft Angle Screw Boss(es)", "(27, 101, 27)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.CompareType(theIssue):
-            aSHBRSBIssue = mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Hole Base Radius", "mm", aSHBRSBIssue.ExpectedMinHoleBaseRadius(),
-                "Actual Hole Base Radius", "mm", aSHBRSBIssue.ActualHoleBaseRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Hole Base Radius Screw Boss(es)", "(98, 8, 2)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallDraftAngleWallIssue.CompareType(theIssue):
-            aSDAWIssue = mtk.DFMMolding_SmallDraftAngleWallIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Draft Angle", "deg", aSDAWIssue.ExpectedMinDraftAngle() * 180. / math.pi,
-                "Actual Draft Angle", "deg", aSDAWIssue.ActualDraftAngle() * 180. / math.pi,
-                theShapeIdVector)
-            theManager.AddGroupData("Small Draft Angle Wall(s)", "(101, 67, 33)", aFeatureData, theCount)
-        elif mtk.DFMMolding_NonChamferedScrewBossIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Non Chamfered Screw Boss(es)", "(38, 38, 10)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallWallThicknessIssue.CompareType(theIssue):
-            aSWTIssue = mtk.DFMMolding_SmallWallThicknessIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Wall Thickness", "mm", aSWTIssue.ExpectedMinThickness(),
-                "Actual Wall Thickness", "mm", aSWTIssue.ActualThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData ("Small Wall(s)", "(14, 209, 199)", aFeatureData, theCount)
-        elif mtk.DFMMolding_SmallDistanceBetweenBossesIssue.CompareType(theIssue):
-            aSDBBIssue = mtk.DFMMolding_SmallDistanceBetweenBossesIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Distance Between Bosses", "mm", aSDBBIssue.ExpectedMinDistanceBetweenBosses(),
-                "Actual Distance Between Bosses", "mm", aSDBBIssue.ActualDistanceBetweenBosses(), 
-                theShapeIdVector)
-            theManager.AddGroupData ("Small Distance Between Bosses Issue(s)", "(255, 102, 0)", aFeatureData, theCount)
-
-    @staticmethod
-    def __AddSheetMetalIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMBase_Issue, theCount: int, theShapeIdVector):
-        if mtk.DFMSheetMetal_FlatPatternInterferenceIssue.CompareType(theIssue):
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString0(theShapeIdVector)
-            theManager.AddGroupData("Flat Pattern Interference(s)", "(115, 251, 253)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.CompareType(theIssue):
-            aICFRNIssue = mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Corner Fillet Radius", "mm", aICFRNIssue.ExpectedCornerFilletRadius(),
-                "Actual Corner Fillet Radius", "mm", aICFRNIssue.ActualCornerFilletRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Corner Fillet Radius Notch(es)", "(239, 136, 190)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.CompareType(theIssue):
-            aIDEHIssue = mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                "Expected Minimum Extruded Height", "mm", aIDEHIssue.ExpectedMinExtrudedHeight(),
-                "Expected Maximum Extruded Height", "mm", aIDEHIssue.ExpectedMaxExtrudedHeight(),
-                "Actual Extruded Height",           "mm", aIDEHIssue.ActualExtrudedHeight(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Depth Extruded Hole(s)", "(50, 120, 210)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue.CompareType(theIssue):
-            aIROHBIssue = mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Radius", "mm", aIROHBIssue.ExpectedRadius(),
-                "Actual Radius", "mm", aIROHBIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Radius Open Hem Bend(s)", "(188, 121, 11)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_InconsistentRadiusBendIssue.CompareType(theIssue):
-            aIRBIssue = mtk.DFMSheetMetal_InconsistentRadiusBendIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Radius", "mm", aIRBIssue.ExpectedRadius(),
-                "Actual Radius",   "mm", aIRBIssue.ActualRadius(),
-                theShapeIdVector)
-            theManager.AddGroupData("Inconsistent Radius Bend(s)", "(0, 35, 245)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularSizeBendReliefIssue.CompareType(theIssue):
-            aISBRIssue = mtk.DFMSheetMetal_IrregularSizeBendReliefIssue.Cast(theIssue)
-            anExpectedRelief = aISBRIssue.ExpectedMinBendRelief()
-            aFirstActualRelief = aISBRIssue.FirstActualRelief()
-            aSecondActualRelief = aISBRIssue.SecondActualRelief()
-            aFeatureData = ""
-            if (not aFirstActualRelief.IsNull()) and (not aSecondActualRelief.IsNull()):
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString3(
-                    "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
-                    "First Actual Relief Size (LxW)",     "mm", Pair(aFirstActualRelief.Length(), aFirstActualRelief.Width()),
-                    "Second Actual Relief Size (LxW)",    "mm", Pair(aSecondActualRelief.Length(), aSecondActualRelief.Width()),
-                    theShapeIdVector)
-            elif aFirstActualRelief.IsNull():
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                    "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
-                    "Actual Relief Size (LxW)",           "mm", Pair(aSecondActualRelief.Length(), aSecondActualRelief.Width()),
-                    theShapeIdVector)
-            else:
-                aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                    "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
-                    "Actual Relief Size (LxW)",           "mm", Pair(aFirstActualRelief.Length(), aFirstActualRelief.Width()),
-                    theShapeIdVector)
-            theManager.AddGroupData("Irregular Size Bend Relief(s)", "(22, 65, 124)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularSizeNotchIssue.CompareType(theIssue):
-            aISNIssue = mtk.DFMSheetMetal_IrregularSizeNotchIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Size (LxW)", "mm", Pair(aISNIssue.ExpectedLength(), aISNIssue.ExpectedWidth()),
-                "Actual Size (LxW)",   "mm", Pair(aISNIssue.ActualLength(), aISNIssue.ActualWidth()),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Size Notch(s)", "(255, 254, 145)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_IrregularSizeTabIssue.CompareType(theIssue):
-            aISTIssue = mtk.DFMSheetMetal_IrregularSizeTabIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Size (LxW)", "mm", Pair(aISTIssue.ExpectedLength(), aISTIssue.ExpectedWidth()),
-                "Actual Size (LxW)",   "mm", Pair(aISTIssue.ActualLength(), aISTIssue.ActualWidth()),
-                theShapeIdVector)
-            theManager.AddGroupData("Irregular Size Tab(s)", "(240, 155, 89)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_LargeDepthBeadIssue.CompareType(theIssue):
-            aLDBIssue = mtk.DFMSheetMetal_LargeDepthBeadIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Maximum Depth", "mm", aLDBIssue.ExpectedMaxDepth(),
-                "Actual Depth",           "mm", aLDBIssue.ActualDepth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Large Depth Bead(s)", "(129, 127, 38)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallDepthLouverIssue.CompareType(theIssue):
-            aSDLIssue = mtk.DFMSheetMetal_SmallDepthLouverIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Depth", "mm", aSDLIssue.ExpectedMinDepth(),
-                "Actual Depth",           "mm", aSDLIssue.ActualDepth(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Depth Louver(s)", "(190, 127, 58)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_NonStandardSheetSizeIssue.CompareType(theIssue):
-            aNSSSIssue = mtk.DFMSheetMetal_NonStandardSheetSizeIssue.Cast(theIssue)
-            aNesrestStandardSize = aNSSSIssue.NearestStandardSheetSize()
-            anActualSize = aNSSSIssue.ActualSheetSize()
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Nearest Standard Size (LxW)", "mm", Pair(aNesrestStandardSize.Length(), aNesrestStandardSize.Width()),
-                "Actual Size (LxW)",           "mm", Pair(anActualSize.Length(), anActualSize.Width()),
-                theShapeIdVector)
-            theManager.AddGroupData("Non Standard Sheet Size(s)", "(0, 0, 0)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_NonStandardSheetThicknessIssue.CompareType(theIssue):
-            aNSSTIssue = mtk.DFMSheetMetal_NonStandardSheetThicknessIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Nearest Standard Thickness", "mm", aNSSTIssue.NearestStandardSheetThickness(),
-                "Actual Thickness",           "mm", aNSSTIssue.ActualSheetThickness(),
-                theShapeIdVector)
-            theManager.AddGroupData("Non Standard Sheet Thickness(s)", "(0, 0, 0)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallDiameterHoleIssue.CompareType(theIssue):
-            aSDHIssue = mtk.DFMSheetMetal_SmallDiameterHoleIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Diameter", "mm", aSDHIssue.ExpectedMinDiameter(),
-                "Actual Diameter",           "mm", aSDHIssue.ActualDiameter(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Diameter Hole(s)", "(115, 43, 245)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallLengthFlangeIssue.CompareType(theIssue):
-            aSLFIssue = mtk.DFMSheetMetal_SmallLengthFlangeIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Length", "mm", aSLFIssue.ExpectedMinLength(),
-                "Actual Length",           "mm", aSLFIssue.ActualLength(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Length Flange(s)", "(88, 19, 94)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue.CompareType(theIssue):
-            aSLHBFIssue = mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Length", "mm", aSLHBFIssue.ExpectedMinLength(),
-                "Actual Length",           "mm", aSLHBFIssue.ActualLength(),
-                theShapeIdVector)
-            theManager.AddGroupData("Small Length Hem Bend Flange(s)", "(70, 139, 51)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallRadiusBendIssue.CompareType(theIssue):
-            aSRBIssue = mtk.DFMSheetMetal_SmallRadiusBendIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Radius", "mm", aSRBIssue.ExpectedMinRadius(),
-                "Actual Radius",           "mm", aSRBIssue.ActualRadius(),
+    def __AddMachiningCountersink(theManager: FeatureGroupManager, theCountersink: mtk.Machining_Countersink, theCount: int, theShapeIdVector):
+        anAxis = theCountersink.Axis().Axis()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Radius", "mm", theCountersink.Radius(),
+            "Depth",  "mm", theCountersink.Depth(),
+            "Axis",    "",  aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData("Countersink(s)", "(55, 125, 34)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningThreadedHole(theManager: FeatureGroupManager, theThreadedHole: mtk.Machining_ThreadedHole, theCount: int, theShapeIdVector):
+        anAxis = theThreadedHole.Axis().Axis()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aType = theThreadedHole.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData6(
+            "Minor radius",  "mm", theThreadedHole.MinorRadius(),
+            "Major radius",  "mm", theThreadedHole.MajorRadius(),
+            "Thread length", "mm", theThreadedHole.ThreadLength(),
+            "Pitch",         "mm", theThreadedHole.Pitch(),
+            "Depth",         "mm", theThreadedHole.Depth(),
+            "Axis",          "",   aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData("Threaded " + MTKConverter_Report.__MachiningHoleTypeToString(aType),
+                                MTKConverter_Report.__MachiningThreadedHoleColor(aType),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningHole(theManager: FeatureGroupManager, theHole: mtk.Machining_Hole, theCount: int, theShapeIdVector):
+        anAxis = theHole.Axis().Axis()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aType = theHole.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Radius", "mm", theHole.Radius(),
+            "Depth",  "mm", theHole.Depth(),
+            "Axis",    "",  aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__MachiningHoleTypeToString(aType),
+                                MTKConverter_Report.__MachiningHoleColor(aType),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningSteppedHole(theManager: FeatureGroupManager, theSteppedHole: mtk.Machining_SteppedHole, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData1(
+            "Depth",  "mm", theSteppedHole.Depth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Stepped Hole(s)", "(204, 0, 125)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningPocket(theManager: FeatureGroupManager, thePocket: mtk.Machining_Pocket, theCount: int, theShapeIdVector):
+        anAxis = thePocket.Axis().Direction()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aType = thePocket.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData4(
+            "Length", "mm", thePocket.Length(),
+            "Width",  "mm", thePocket.Width(),
+            "Depth",  "mm", thePocket.Depth(),
+            "Axis",    "",  aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__MachiningPocketTypeToString(aType),
+                                MTKConverter_Report.__MachiningPocketColor(aType),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningTurningGroove(theManager: FeatureGroupManager, theTurningGroove: mtk.Machining_TurningGroove, theCount: int, theShapeIdVector):
+        aType = theTurningGroove.Type()
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Radius", "mm", theTurningGroove.Radius(),
+            "Depth",  "mm", theTurningGroove.Depth(),
+            "Width",  "mm", theTurningGroove.Width(),
+            theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__MachiningTurningGrooveTypeToString(aType),
+                                MTKConverter_Report.__MachiningTurningGrooveColor(aType),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMachiningBore(theManager: FeatureGroupManager, theBore: mtk.Machining_Bore, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Radius", "mm", theBore.Radius(),
+            "Depth",  "mm", theBore.Depth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Bore(s)", "(127, 130, 187)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMoldingScrewBoss(theManager: FeatureGroupManager, theScrewBoss: mtk.Molding_ScrewBoss, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Outer Radius", "mm",  theScrewBoss.OuterRadius(),
+            "Inner Radius", "mm",  theScrewBoss.InnerRadius(),
+            "Draft Angle",  "deg", theScrewBoss.DraftAngle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Screw Boss(es)", "(12, 32, 63)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMTKBaseBoss(theManager: FeatureGroupManager, theBoss: mtk.MTKBase_Boss, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Length", "mm", theBoss.Length(),
+            "Width",  "mm", theBoss.Width(),
+            "Height", "mm", theBoss.Height(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Boss(es)", "(56, 72, 13)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddMoldingRib(theManager: FeatureGroupManager, theRib: mtk.Molding_Rib, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData4(
+            "Length",      "mm",  theRib.Length(),
+            "Height",      "mm",  theRib.Height(),
+            "Thickness",   "mm",  theRib.Thickness(),
+            "Draft Angle", "deg", theRib.DraftAngle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Rib(s)", "(34, 51, 127)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalFormingFeature(theManager: FeatureGroupManager, theFormingFeature: mtk.SheetMetal_FormingFeature, theCount: int, theShapeIdVector):
+        anAxis = theFormingFeature.Axis().Direction()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Depth", "mm", theFormingFeature.Depth(),
+            "Length", "mm", theFormingFeature.Length(),
+            "Axis", "", aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData("Forming Feature(s)", "(235, 211, 253)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalBead(theManager: FeatureGroupManager, theBead: mtk.SheetMetal_Bead, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData1("Depth", "mm", theBead.Depth(), theShapeIdVector)
+        theManager.AddGroupData("Bead(s)", "(115, 251, 253)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalBend(theManager: FeatureGroupManager, theBend: mtk.SheetMetal_Bend, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData4(
+            "Radius", "mm",  theBend.Radius(),
+            "Angle",  "deg", theBend.Angle() * 180 / math.pi,
+            "Length", "mm",  theBend.Length(),
+            "Width",  "mm",  theBend.Width(),
+            theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__BendName(theBend), MTKConverter_Report.__BendColor(theBend),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalBridge(theManager: FeatureGroupManager, theBridge: mtk.SheetMetal_Bridge, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Length", "mm", theBridge.Length(),
+            "Depth",  "mm", theBridge.Depth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Bridge(s)", "(240, 155, 89)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalHole(theManager: FeatureGroupManager, theHole: mtk.SheetMetal_Hole, theCount: int, theShapeIdVector):
+        anAxis = theHole.Axis().Axis()
+        aDirection = Direction(anAxis.X(), anAxis.Y(), anAxis.Z())
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Radius", "mm", theHole.Radius(),
+            "Depth",  "mm", theHole.Depth(),
+            "Axis",    "",  aDirection,
+            theShapeIdVector)
+        theManager.AddGroupData (MTKConverter_Report.__SheetMetalHoleName(theHole),
+                                 MTKConverter_Report.__SheetMetalHoleColor(theHole),
+                                 aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalCutout(theManager: FeatureGroupManager, theCutout: mtk.SheetMetal_Cutout, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData1("Perimeter", "mm", theCutout.Perimeter(), theShapeIdVector)
+        theManager.AddGroupData ("Cutout(s)", "(88, 19, 94)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalLouver(theManager: FeatureGroupManager, theLouver: mtk.SheetMetal_Louver, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData1(
+            "Depth",  "mm", theLouver.Depth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Louver(s)", "(161, 251, 142)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalStraightNotch(theManager: FeatureGroupManager, theStraightNotch: mtk.SheetMetal_StraightNotch, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Length", "mm", theStraightNotch.Length(),
+            "Width",  "mm", theStraightNotch.Width(),
+            "Corner Fillet Radius", "mm", theStraightNotch.CornerFilletRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Straight Notch(es)", "(240, 135, 132)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalVNotch(theManager: FeatureGroupManager, theVNotch: mtk.SheetMetal_VNotch, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Length", "mm", theVNotch.Length(),
+            "Width",  "mm", theVNotch.Width(),
+            "Angle", "deg", theVNotch.Angle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData ("V Notch(es)", "(235, 51, 36)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalNotch(theManager: FeatureGroupManager, theNotch: mtk.SheetMetal_Notch, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Length", "mm", theNotch.Length(),
+            "Width",  "mm", theNotch.Width(),
+            theShapeIdVector)
+        theManager.AddGroupData("Notch(es)", "(239, 136, 190)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddSheetMetalTab(theManager: FeatureGroupManager, theTab: mtk.SheetMetal_Tab, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Length", "mm", theTab.Length(),
+            "Width",  "mm", theTab.Width(),
+            theShapeIdVector)
+        theManager.AddGroupData("Tab(s)", "(127, 130, 187)", aFeatureData, theCount)
+
+    @staticmethod
+    def __DrillingIssueWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            (mtk.DFMMachining_SmallDiameterHoleIssue, MTKConverter_Report.__AddDFMMachiningSmallDiameterHoleIssue),
+            (mtk.DFMMachining_DeepHoleIssue, MTKConverter_Report.__AddDFMMachiningDeepHoleIssue),
+            (mtk.DFMMachining_NonStandardDiameterHoleIssue, MTKConverter_Report.__AddDFMMachiningNonStandardDiameterHoleIssue),
+            (mtk.DFMMachining_NonStandardDrillPointAngleBlindHoleIssue, MTKConverter_Report.__AddDFMMachiningNonStandardDrillPointAngleBlindHoleIssue),
+            (mtk.DFMMachining_PartialHoleIssue, MTKConverter_Report.__AddDFMMachiningPartialHoleIssue),
+            (mtk.DFMMachining_FlatBottomHoleIssue, MTKConverter_Report.__AddDFMMachiningFlatBottomHoleIssue),
+            (mtk.DFMMachining_NonPerpendicularHoleIssue, MTKConverter_Report.__AddDFMMachiningNonPerpendicularHoleIssue),
+            (mtk.DFMMachining_IntersectingCavityHoleIssue, MTKConverter_Report.__AddDFMMachiningIntersectingCavityHoleIssue),
+            (mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue, MTKConverter_Report.__AddDFMMachiningSmallDistanceBetweenThreadedHoleAndEdgeIssue),
+        )
+
+    @staticmethod
+    def __AddDFMMachiningSmallDiameterHoleIssue(theManager: FeatureGroupManager, theSmallHoleIssue: mtk.DFMMachining_SmallDiameterHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Diameter", "mm", theSmallHoleIssue.ExpectedMinDiameter(),
+            "Actual Diameter", "mm", theSmallHoleIssue.ActualDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Diameter Hole(s)", "(115, 251, 253)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningDeepHoleIssue(theManager: FeatureGroupManager, theDeepHoleIssue: mtk.DFMMachining_DeepHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Depth", "mm", theDeepHoleIssue.ExpectedMaxDepth(),
+            "Actual Depth", "mm", theDeepHoleIssue.ActualDepth(), theShapeIdVector)
+        theManager.AddGroupData("Deep Hole(s)", "(0, 35, 245)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNonStandardDiameterHoleIssue(theManager: FeatureGroupManager, theNSDiameterHoleIssue: mtk.DFMMachining_NonStandardDiameterHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Nearest Standard Diameter", "mm", theNSDiameterHoleIssue.NearestStandardDiameter(),
+            "Actual Diameter", "mm", theNSDiameterHoleIssue.ActualDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Non Standard Diameter Hole(s)", "(22, 65, 124)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNonStandardDrillPointAngleBlindHoleIssue(theManager: FeatureGroupManager, theNSDrillPointAngleBlindHoleIssue: mtk.DFMMachining_NonStandardDrillPointAngleBlindHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Nearest Standard Angle", "deg", theNSDrillPointAngleBlindHoleIssue.NearestStandardAngle() * 180 / math.pi,
+            "Actual Angle", "deg", theNSDrillPointAngleBlindHoleIssue.ActualAngle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Non Standard Drill Point Angle Blind Hole(s)", "(88, 13, 78)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningPartialHoleIssue(theManager: FeatureGroupManager, thePartialHoleIssue: mtk.DFMMachining_PartialHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Material Percent", "%", thePartialHoleIssue.ExpectedMinMaterialPercent() * 100,
+            "Actual Material Percent", "%", thePartialHoleIssue.ActualMaterialPercent() * 100,
+            theShapeIdVector)
+        theManager.AddGroupData("Partial Hole(s)", "(255, 254, 145)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningFlatBottomHoleIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_FlatBottomHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Flat Bottom Hole(s)", "(240, 155, 89)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNonPerpendicularHoleIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_NonPerpendicularHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Non Perpendicular Hole(s)", "(129, 127, 38)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningIntersectingCavityHoleIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_IntersectingCavityHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Intersecting Cavity Hole(s)", "(115, 43, 245)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSmallDistanceBetweenThreadedHoleAndEdgeIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue, theCount: int, theShapeIdVector):
+        aTHole = mtk.Machining_ThreadedHole.Cast(theIssue.Hole());
+        aFeatureData = MTKConverter_Report.__FeatureData4(
+            "Expected Minimum Distance", "mm", theIssue.ExpectedMinDistance(),
+            "Actual Distance", "mm", theIssue.ActualDistance(),
+            "Actual Diameter", "mm", aTHole.MajorRadius() * 2,
+            "Expected Minimum Distance To Diameter Ratio", "mm", theIssue.ExpectedMinDistanceToDiameterRatio(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Distance Between Threaded Hole And Edge(s)", "(142, 65, 213)", aFeatureData, theCount)
+
+    @staticmethod
+    def __MillingIssueWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            (mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue, MTKConverter_Report.__AddDFMMachiningNonStandardRadiusMilledPartFloorFilletIssue),
+            (mtk.DFMMachining_DeepPocketIssue, MTKConverter_Report.__AddDFMMachiningDeepPocketIssue),
+            (mtk.DFMMachining_HighBossIssue, MTKConverter_Report.__AddDFMMachiningHighBossIssue),
+            (mtk.DFMMachining_LargeMilledPartIssue, MTKConverter_Report.__AddDFMMachiningLargeMilledPartIssue),
+            (mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue, MTKConverter_Report.__AddDFMMachiningSmallRadiusMilledPartInternalCornerIssue),
+            (mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue, MTKConverter_Report.__AddDFMMachiningNonPerpendicularMilledPartShapeIssue),
+            (mtk.DFMMachining_MilledPartExternalEdgeFilletIssue, MTKConverter_Report.__AddDFMMachiningMilledPartExternalEdgeFilletIssue),
+            (mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue, MTKConverter_Report.__AddDFMMachiningInconsistentRadiusMilledPartFloorFilletIssue),
+            (mtk.DFMMachining_NarrowRegionInPocketIssue, MTKConverter_Report.__AddDFMMachiningNarrowRegionInPocketIssue),
+            (mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue, MTKConverter_Report.__AddDFMMachiningLargeDifferenceRegionsSizeInPocketIssue),
+            (mtk.DFMMachining_SmallWallThicknessIssue, MTKConverter_Report.__AddDFMMachiningSmallWallThicknessIssue),
+        )
+
+    @staticmethod
+    def __AddDFMMachiningNonStandardRadiusMilledPartFloorFilletIssue(theManager: FeatureGroupManager, theFloorRadiusIssue: mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Nearest Standard Radius", "mm", theFloorRadiusIssue.NearestStandardRadius(),
+            "Actual Radius", "mm", theFloorRadiusIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Non Standard Radius Milled Part Floor Fillet Issue(s)", "(0, 215, 3)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningDeepPocketIssue(theManager: FeatureGroupManager, theDeepPocketIssue: mtk.DFMMachining_DeepPocketIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Depth", "mm", theDeepPocketIssue.ExpectedMaxDepth(),
+            "Actual Depth", "mm", theDeepPocketIssue.ActualDepth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Deep Pocket Issue(s)", "(190, 10, 100)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningHighBossIssue(theManager: FeatureGroupManager, theHighBossIssue: mtk.DFMMachining_HighBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Height", "mm", theHighBossIssue.ExpectedMaxHeight(),
+            "Actual Height", "mm", theHighBossIssue.ActualHeight(),
+            theShapeIdVector)
+        theManager.AddGroupData("High Boss Issue(s)", "(180, 100, 50)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningLargeMilledPartIssue(theManager: FeatureGroupManager, theLMPIssue: mtk.DFMMachining_LargeMilledPartIssue, theCount: int, theShapeIdVector):
+        anExpectedSize = theLMPIssue.ExpectedMaxMilledPartSize()
+        anActualSize = theLMPIssue.ActualMilledPartSize()
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Size (LxWxH)", "mm",
+            Dimension(anExpectedSize.Length(), anExpectedSize.Width(), anExpectedSize.Height()),
+            "Actual Size (LxWxH)", "mm",
+            Dimension(anActualSize.Length(), anActualSize.Width(), anActualSize.Height()),
+            theShapeIdVector)
+        theManager.AddGroupData("Large Milled Part(s)", "(17, 37, 205)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSmallRadiusMilledPartInternalCornerIssue(theManager: FeatureGroupManager, theMSICRIssue: mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Radius", "mm", theMSICRIssue.ExpectedMinRadius(),
+            "Actual Radius", "mm", theMSICRIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Radius Milled Part Internal Corner(s)", "(10, 10, 200)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNonPerpendicularMilledPartShapeIssue(theManager: FeatureGroupManager, theNPMPSIssue: mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData1(
+            "Actual Angle", "deg", theNPMPSIssue.ActualAngle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Non Perpendicular Milled Part Shape(s)", "(129, 227, 138)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningMilledPartExternalEdgeFilletIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_MilledPartExternalEdgeFilletIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Milled Part External Edge Fillet(s)", "(201, 227, 13)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningInconsistentRadiusMilledPartFloorFilletIssue(theManager: FeatureGroupManager, theInconsistentRadiusIssue: mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Radius", "mm", theInconsistentRadiusIssue.ExpectedRadius(),
+            "Actual Radius", "mm", theInconsistentRadiusIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Inconsistent Radius Milled Part Floor Fillet Issue(s)", "(180, 15, 190)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNarrowRegionInPocketIssue(theManager: FeatureGroupManager, theNarrowRegionIssue: mtk.DFMMachining_NarrowRegionInPocketIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Region Size", "mm", theNarrowRegionIssue.ExpectedMinRegionSize(),
+            "Actual Region Size", "mm", theNarrowRegionIssue.ActualRegionSize(),
+            theShapeIdVector)
+        theManager.AddGroupData("Narrow Region In Pocket Issue(s)", "(70, 150, 150)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningLargeDifferenceRegionsSizeInPocketIssue(theManager: FeatureGroupManager, theLargeRatioIssue: mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Regions Maximum To Minimum Size Ratio", "", theLargeRatioIssue.ExpectedMaxRegionsMaxToMinSizeRatio(),
+            "Actual Regions Maximum To Minimum Size Ratio", "", theLargeRatioIssue.ActualMaxRegionsMaxToMinSizeRatio(),
+            theShapeIdVector)
+        theManager.AddGroupData("Large Difference Regions Size In Pocket Issue(s)", "(100, 150, 150)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSmallWallThicknessIssue(theManager: FeatureGroupManager, theSWTIssue: mtk.DFMMachining_SmallWallThicknessIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Thickness", "mm", theSWTIssue.ExpectedMinThickness(),
+            "Actual Thickness", "mm", theSWTIssue.ActualThickness(), 
+            theShapeIdVector)
+        theManager.AddGroupData("Small Wall Thickness Issue(s)", "(64, 224, 208)", aFeatureData, theCount)
+
+    @staticmethod
+    def __TurningIssueWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            (mtk.DFMMachining_LargeTurnedPartIssue, MTKConverter_Report.__AddDFMMachiningLargeTurnedPartIssue),
+            (mtk.DFMMachining_LongSlenderTurnedPartIssue, MTKConverter_Report.__AddDFMMachiningLongSlenderTurnedPartIssue),
+            (mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue, MTKConverter_Report.__AddDFMMachiningSmallDepthBlindBoredHoleReliefIssue),
+            (mtk.DFMMachining_DeepBoredHoleIssue, MTKConverter_Report.__AddDFMMachiningDeepBoredHoleIssue),
+            (mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue, MTKConverter_Report.__AddDFMMachiningIrregularTurnedPartOuterDiameterProfileReliefIssue),
+            (mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue, MTKConverter_Report.__AddDFMMachiningSmallRadiusTurnedPartInternalCornerIssue),
+            (mtk.DFMMachining_SquareEndKeywayIssue, MTKConverter_Report.__AddDFMMachiningSquareEndKeywayIssue),
+            (mtk.DFMMachining_NonSymmetricalAxialSlotIssue, MTKConverter_Report.__AddDFMMachiningNonSymmetricalAxialSlotIssue),
+        )
+
+    @staticmethod
+    def __AddDFMMachiningLargeTurnedPartIssue(theManager: FeatureGroupManager, theLTSIssue: mtk.DFMMachining_LargeTurnedPartIssue, theCount: int, theShapeIdVector):
+        anExpectedSize = theLTSIssue.ExpectedMaxTurnedPartSize()
+        anActualSize = theLTSIssue.ActualTurnedPartSize()
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Size (LxR)", "mm", Pair(anExpectedSize.Length(), anExpectedSize.Radius()),
+            "Actual Size (LxR)", "mm", Pair(anActualSize.Length(), anActualSize.Radius()),
+            theShapeIdVector)
+        theManager.AddGroupData("Large Turned Part(s)", "(195, 195, 195)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningLongSlenderTurnedPartIssue(theManager: FeatureGroupManager, theLSTIssue: mtk.DFMMachining_LongSlenderTurnedPartIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Maximum Length", "mm", theLSTIssue.ExpectedMaxLength(),
+            "Actual Length", "mm", theLSTIssue.ActualLength(),
+            "Actual Minimum Diameter", "mm", theLSTIssue.ActualMinDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Long-Slender Turned Part(s)", "(195, 195, 195)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSmallDepthBlindBoredHoleReliefIssue(theManager: FeatureGroupManager, theBBHRIssue: mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Minimum Relief Depth", "mm", theBBHRIssue.ExpectedMinReliefDepth(),
+            "Actual Relief Depth", "mm", theBBHRIssue.ActualReliefDepth(),
+            "Actual Diameter", "mm", theBBHRIssue.ActualDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Depth Blind Bored Hole Relief(s)", "(88, 19, 94)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningDeepBoredHoleIssue(theManager: FeatureGroupManager, theISBHIssue: mtk.DFMMachining_DeepBoredHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Maximum Depth", "mm", theISBHIssue.ExpectedMaxDepth(),
+            "Actual Depth", "mm", theISBHIssue.ActualDepth(),
+            "Actual Diameter", "mm", theISBHIssue.ActualDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Deep Bored Hole(s)", "(161, 251, 142)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningIrregularTurnedPartOuterDiameterProfileReliefIssue(theManager: FeatureGroupManager, theODPRIssue: mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Face Incline Angle", "deg", theODPRIssue.ExpectedMaxFaceInclineAngle() * 180 / math.pi,
+            "Actual Face Incline Angle", "deg", theODPRIssue.ActualFaceInclineAngle() * 180 / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Turned Part Outer Diameter Profile Relief(s)", "(239, 136, 190)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSmallRadiusTurnedPartInternalCornerIssue(theManager: FeatureGroupManager, theTSICRIssue: mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Radius", "mm", theTSICRIssue.ExpectedMinRadius(),
+            "Actual Radius", "mm", theTSICRIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Radius Turned Part Internal Corner(s)", "(127, 130, 187)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningSquareEndKeywayIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_SquareEndKeywayIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Square End Keyway(s)", "(157, 160, 207)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMachiningNonSymmetricalAxialSlotIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMachining_NonSymmetricalAxialSlotIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Non Symmetrical Axial Slot(s)", "(130, 170, 200)", aFeatureData, theCount)
+
+    @staticmethod
+    def __MoldingIssueWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            (mtk.DFMMolding_HighRibIssue, MTKConverter_Report.__AddDFMMoldingHighRibIssue),
+            (mtk.DFMMolding_HighScrewBossIssue, MTKConverter_Report.__AddDFMMoldingHighScrewBossIssue),
+            (mtk.DFMMolding_IrregularCoreDepthScrewBossIssue, MTKConverter_Report.__AddDFMMoldingIrregularCoreDepthScrewBossIssue),
+            (mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue, MTKConverter_Report.__AddDFMMoldingIrregularCoreDiameterScrewBossIssue),
+            (mtk.DFMMolding_IrregularThicknessRibIssue, MTKConverter_Report.__AddDFMMoldingIrregularThicknessRibIssue),
+            (mtk.DFMMolding_IrregularWallThicknessIssue, MTKConverter_Report.__AddDFMMoldingIrregularWallThicknessIssue),
+            (mtk.DFMMolding_IrregularWallThicknessScrewBossIssue, MTKConverter_Report.__AddDFMMoldingIrregularWallThicknessScrewBossIssue),
+            (mtk.DFMMolding_LargeWallThicknessIssue, MTKConverter_Report.__AddDFMMoldingLargeWallThicknessIssue),
+            (mtk.DFMMolding_SmallBaseRadiusRibIssue, MTKConverter_Report.__AddDFMMoldingSmallBaseRadiusRibIssue),
+            (mtk.DFMMolding_SmallBaseRadiusScrewBossIssue, MTKConverter_Report.__AddDFMMoldingSmallBaseRadiusScrewBossIssue),
+            (mtk.DFMMolding_SmallDraftAngleRibIssue, MTKConverter_Report.__AddDFMMoldingSmallDraftAngleRibIssue),
+            (mtk.DFMMolding_SmallDistanceBetweenRibsIssue, MTKConverter_Report.__AddDFMMoldingSmallDistanceBetweenRibsIssue),
+            (mtk.DFMMolding_SmallDraftAngleScrewBossIssue, MTKConverter_Report.__AddDFMMoldingSmallDraftAngleScrewBossIssue),
+            (mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue, MTKConverter_Report.__AddDFMMoldingSmallHoleBaseRadiusScrewBossIssue),
+            (mtk.DFMMolding_SmallDraftAngleWallIssue, MTKConverter_Report.__AddDFMMoldingSmallDraftAngleWallIssue),
+            (mtk.DFMMolding_NonChamferedScrewBossIssue, MTKConverter_Report.__AddDFMMoldingNonChamferedScrewBossIssue),
+            (mtk.DFMMolding_SmallWallThicknessIssue, MTKConverter_Report.__AddDFMMoldingSmallWallThicknessIssue),
+            (mtk.DFMMolding_SmallDistanceBetweenBossesIssue, MTKConverter_Report.__AddDFMMoldingSmallDistanceBetweenBossesIssue),
+        )
+
+    @staticmethod
+    def __AddDFMMoldingHighRibIssue(theManager: FeatureGroupManager, theHRIssue: mtk.DFMMolding_HighRibIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Height", "mm", theHRIssue.ExpectedMaxHeight(),
+            "Actual Height", "mm", theHRIssue.ActualHeight(),
+            theShapeIdVector)
+        theManager.AddGroupData("High Rib(s)", "(284, 36, 12)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingHighScrewBossIssue(theManager: FeatureGroupManager, theHSBIssue: mtk.DFMMolding_HighScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Height", "mm", theHSBIssue.ExpectedMaxHeight(),
+            "Actual Height", "mm", theHSBIssue.ActualHeight(),
+            theShapeIdVector)
+        theManager.AddGroupData("High Screw Boss(es)", "(16, 75, 95)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingIrregularCoreDepthScrewBossIssue(theManager: FeatureGroupManager, theICDSBIssue: mtk.DFMMolding_IrregularCoreDepthScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Actual Height", "mm", theICDSBIssue.ActualHeight(),
+            "Actual Core Depth", "mm", theICDSBIssue.ActualCoreDepth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Core Depth Screw Boss(es)", "(56, 176, 95)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingIrregularCoreDiameterScrewBossIssue(theManager: FeatureGroupManager, theICDSBIssue: mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Minimum Outer Diameter", "mm", theICDSBIssue.ExpectedMinCoreDiameter(),
+            "Expected Maximum Outer Diameter", "mm", theICDSBIssue.ExpectedMaxCoreDiameter(),
+            "actual core diameter", "mm", theICDSBIssue.ActualCoreDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Core Diameter Screw Boss(es)", "(195, 195, 195)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingIrregularThicknessRibIssue(theManager: FeatureGroupManager, theITRIssue: mtk.DFMMolding_IrregularThicknessRibIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Minimum Thickness", "mm", theITRIssue.ExpectedMinThickness(),
+            "Expected Maximum Thickness", "mm", theITRIssue.ExpectedMaxThickness(),
+            "Actual Thickness", "mm", theITRIssue.ActualThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Thickness Rib(s)", "(68, 114, 250)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingIrregularWallThicknessIssue(theManager: FeatureGroupManager, theIWTIssue: mtk.DFMMolding_IrregularWallThicknessIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Maximum Wall Thickness", "mm", theIWTIssue.ExpectedMaxThickness(),
+            "Expected Minimum Wall Thickness", "mm", theIWTIssue.ExpectedMinThickness(),
+            "Actual Wall Thickness", "mm", theIWTIssue.ActualThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Irregular Wall(s)", "(23, 11, 19)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingIrregularWallThicknessScrewBossIssue(theManager: FeatureGroupManager, theIWTSBIssue: mtk.DFMMolding_IrregularWallThicknessScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Maximum Thickness", "mm", theIWTSBIssue.ExpectedMaxThickness(),
+            "Expected Minimum Thickness", "mm", theIWTSBIssue.ExpectedMinThickness(),
+            "Actual Thickness", "mm", theIWTSBIssue.ActualThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Wall Thickness Screw Boss(es)", "(13, 12, 245)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingLargeWallThicknessIssue(theManager: FeatureGroupManager, theLWTIssue: mtk.DFMMolding_LargeWallThicknessIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Wall Thickness", "mm", theLWTIssue.ExpectedMaxThickness(),
+            "Actual Wall Thickness", "mm", theLWTIssue.ActualThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Large Wall(s)", "(101, 22, 129)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallBaseRadiusRibIssue(theManager: FeatureGroupManager, theSBRRIssue: mtk.DFMMolding_SmallBaseRadiusRibIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Base Radius", "mm", theSBRRIssue.ExpectedMinBaseRadius(),
+            "Actual Base Radius", "mm", theSBRRIssue.ActualBaseRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Small Base Radius Rib(s)", "(13, 12, 90)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallBaseRadiusScrewBossIssue(theManager: FeatureGroupManager, theSBRSBIssue: mtk.DFMMolding_SmallBaseRadiusScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Base Radius", "mm", theSBRSBIssue.ExpectedMinBaseRadius(),
+            "Actual Base Radius", "mm", theSBRSBIssue.ActualBaseRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Small Base Radius Screw Boss(es)", "(56, 18, 23)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallDraftAngleRibIssue(theManager: FeatureGroupManager, theSDARIssue: mtk.DFMMolding_SmallDraftAngleRibIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Draft Angle", "deg", theSDARIssue.ExpectedMinDraftAngle() * 180. / math.pi,
+            "Actual Draft Angle", "deg", theSDARIssue.ActualDraftAngle() * 180. / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Small Draft Angle Rib(s)", "(189, 200, 13)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallDistanceBetweenRibsIssue(theManager: FeatureGroupManager, theSDBRIssue: mtk.DFMMolding_SmallDistanceBetweenRibsIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Distance", "mm", theSDBRIssue.ExpectedMinDistanceBetweenRibs(),
+            "Actual Distance", "mm", theSDBRIssue.ActualDistanceBetweenRibs(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Distance Between Ribs Issue(s)", "(11, 90, 111)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallDraftAngleScrewBossIssue(theManager: FeatureGroupManager, theSDASBIssue: mtk.DFMMolding_SmallDraftAngleScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Draft Angle", "deg", theSDASBIssue.ExpectedMinDraftAngle() * 180. / math.pi,
+            "Actual Draft Angle", "deg", theSDASBIssue.ActualDraftAngle() * 180. / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Small Draft Angle Screw Boss(es)", "(27, 101, 27)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallHoleBaseRadiusScrewBossIssue(theManager: FeatureGroupManager, theSHBRSBIssue: mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Hole Base Radius", "mm", theSHBRSBIssue.ExpectedMinHoleBaseRadius(),
+            "Actual Hole Base Radius", "mm", theSHBRSBIssue.ActualHoleBaseRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Hole Base Radius Screw Boss(es)", "(98, 8, 2)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallDraftAngleWallIssue(theManager: FeatureGroupManager, theSDAWIssue: mtk.DFMMolding_SmallDraftAngleWallIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Draft Angle", "deg", theSDAWIssue.ExpectedMinDraftAngle() * 180. / math.pi,
+            "Actual Draft Angle", "deg", theSDAWIssue.ActualDraftAngle() * 180. / math.pi,
+            theShapeIdVector)
+        theManager.AddGroupData("Small Draft Angle Wall(s)", "(101, 67, 33)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingNonChamferedScrewBossIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMMolding_NonChamferedScrewBossIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Non Chamfered Screw Boss(es)", "(38, 38, 10)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallWallThicknessIssue(theManager: FeatureGroupManager, theSWTIssue: mtk.DFMMolding_SmallWallThicknessIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Wall Thickness", "mm", theSWTIssue.ExpectedMinThickness(),
+            "Actual Wall Thickness", "mm", theSWTIssue.ActualThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData ("Small Wall(s)", "(14, 209, 199)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMMoldingSmallDistanceBetweenBossesIssue(theManager: FeatureGroupManager, theSDBBIssue: mtk.DFMMolding_SmallDistanceBetweenBossesIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Distance Between Bosses", "mm", theSDBBIssue.ExpectedMinDistanceBetweenBosses(),
+            "Actual Distance Between Bosses", "mm", theSDBBIssue.ActualDistanceBetweenBosses(), 
+            theShapeIdVector)
+        theManager.AddGroupData ("Small Distance Between Bosses Issue(s)", "(255, 102, 0)", aFeatureData, theCount)
+
+    @staticmethod
+    def __SheetMetalIssueWriters():
+        # (feature type, function adding a feature cast to it to a FeatureGroupManager), checked in order
+        return (
+            (mtk.DFMSheetMetal_FlatPatternInterferenceIssue, MTKConverter_Report.__AddDFMSheetMetalFlatPatternInterferenceIssue),
+            (mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularCornerFilletRadiusNotchIssue),
+            (mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularDepthExtrudedHoleIssue),
+            (mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularRadiusOpenHemBendIssue),
+            (mtk.DFMSheetMetal_InconsistentRadiusBendIssue, MTKConverter_Report.__AddDFMSheetMetalInconsistentRadiusBendIssue),
+            (mtk.DFMSheetMetal_IrregularSizeBendReliefIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularSizeBendReliefIssue),
+            (mtk.DFMSheetMetal_IrregularSizeNotchIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularSizeNotchIssue),
+            (mtk.DFMSheetMetal_IrregularSizeTabIssue, MTKConverter_Report.__AddDFMSheetMetalIrregularSizeTabIssue),
+            (mtk.DFMSheetMetal_LargeDepthBeadIssue, MTKConverter_Report.__AddDFMSheetMetalLargeDepthBeadIssue),
+            (mtk.DFMSheetMetal_SmallDepthLouverIssue, MTKConverter_Report.__AddDFMSheetMetalSmallDepthLouverIssue),
+            (mtk.DFMSheetMetal_NonStandardSheetSizeIssue, MTKConverter_Report.__AddDFMSheetMetalNonStandardSheetSizeIssue),
+            (mtk.DFMSheetMetal_NonStandardSheetThicknessIssue, MTKConverter_Report.__AddDFMSheetMetalNonStandardSheetThicknessIssue),
+            (mtk.DFMSheetMetal_SmallDiameterHoleIssue, MTKConverter_Report.__AddDFMSheetMetalSmallDiameterHoleIssue),
+            (mtk.DFMSheetMetal_SmallLengthFlangeIssue, MTKConverter_Report.__AddDFMSheetMetalSmallLengthFlangeIssue),
+            (mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue, MTKConverter_Report.__AddDFMSheetMetalSmallLengthHemBendFlangeIssue),
+            (mtk.DFMSheetMetal_SmallRadiusBendIssue, MTKConverter_Report.__AddDFMSheetMetalSmallRadiusBendIssue),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue, MTKConverter_Report.__AddDFMSheetMetalSmallDistanceBetweenFeaturesIssue),
+        )
+
+    @staticmethod
+    def __AddDFMSheetMetalFlatPatternInterferenceIssue(theManager: FeatureGroupManager, theIssue: mtk.DFMSheetMetal_FlatPatternInterferenceIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData0(theShapeIdVector)
+        theManager.AddGroupData("Flat Pattern Interference(s)", "(115, 251, 253)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalIrregularCornerFilletRadiusNotchIssue(theManager: FeatureGroupManager, theICFRNIssue: mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Corner Fillet Radius", "mm", theICFRNIssue.ExpectedCornerFilletRadius(),
+            "Actual Corner Fillet Radius", "mm", theICFRNIssue.ActualCornerFilletRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Corner Fillet Radius Notch(es)", "(239, 136, 190)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalIrregularDepthExtrudedHoleIssue(theManager: FeatureGroupManager, theIDEHIssue: mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData3(
+            "Expected Minimum Extruded Height", "mm", theIDEHIssue.ExpectedMinExtrudedHeight(),
+            "Expected Maximum Extruded Height", "mm", theIDEHIssue.ExpectedMaxExtrudedHeight(),
+            "Actual Extruded Height",           "mm", theIDEHIssue.ActualExtrudedHeight(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Depth Extruded Hole(s)", "(50, 120, 210)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalIrregularRadiusOpenHemBendIssue(theManager: FeatureGroupManager, theIROHBIssue: mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Radius", "mm", theIROHBIssue.ExpectedRadius(),
+            "Actual Radius", "mm", theIROHBIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Radius Open Hem Bend(s)", "(188, 121, 11)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalInconsistentRadiusBendIssue(theManager: FeatureGroupManager, theIRBIssue: mtk.DFMSheetMetal_InconsistentRadiusBendIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Radius", "mm", theIRBIssue.ExpectedRadius(),
+            "Actual Radius",   "mm", theIRBIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Inconsistent Radius Bend(s)", "(0, 35, 245)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalIrregularSizeBendReliefIssue(theManager: FeatureGroupManager, theISBRIssue: mtk.DFMSheetMetal_IrregularSizeBendReliefIssue, theCount: int, theShapeIdVector):
+        anExpectedRelief = theISBRIssue.ExpectedMinBendRelief()
+        aFirstActualRelief = theISBRIssue.FirstActualRelief()
+        aSecondActualRelief = theISBRIssue.SecondActualRelief()
+        aFeatureData = ""
+        if (not aFirstActualRelief.IsNull()) and (not aSecondActualRelief.IsNull()):
+            aFeatureData = MTKConverter_Report.__FeatureData3(
+                "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
+                "First Actual Relief Size (LxW)",     "mm", Pair(aFirstActualRelief.Length(), aFirstActualRelief.Width()),
+                "Second Actual Relief Size (LxW)",    "mm", Pair(aSecondActualRelief.Length(), aSecondActualRelief.Width()),
+                theShapeIdVector)
+        elif aFirstActualRelief.IsNull():
+            aFeatureData = MTKConverter_Report.__FeatureData2(
+                "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
+                "Actual Relief Size (LxW)",           "mm", Pair(aSecondActualRelief.Length(), aSecondActualRelief.Width()),
                 theShapeIdVector)
-            theManager.AddGroupData("Small Radius Bend(s)", "(161, 251, 142)", aFeatureData, theCount)
-        elif mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue.CompareType(theIssue):
-            aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue.Cast(theIssue)
-            aFeatureData = MTKConverter_Report.__WriteFeatureDataToString2(
-                "Expected Minimum Distance", "mm", aSDIssue.ExpectedMinDistanceBetweenFeatures(),
-                "Actual Distance",           "mm", aSDIssue.ActualDistanceBetweenFeatures(),
+        else:
+            aFeatureData = MTKConverter_Report.__FeatureData2(
+                "Expected Minimum Relief Size (LxW)", "mm", Pair(anExpectedRelief.Length(), anExpectedRelief.Width()),
+                "Actual Relief Size (LxW)",           "mm", Pair(aFirstActualRelief.Length(), aFirstActualRelief.Width()),
                 theShapeIdVector)
-            theManager.AddGroupData(MTKConverter_Report.__SmallDistanceIssueName(aSDIssue),
-                                    MTKConverter_Report.__SmallDistanceIssueColor(aSDIssue),
-                                    aFeatureData, theCount)
+        theManager.AddGroupData("Irregular Size Bend Relief(s)", "(22, 65, 124)", aFeatureData, theCount)
 
     @staticmethod
-    def __GetShapesId(theShape: mtk.ModelData_Shape, theType):
-        aShapeIdVector = []
-        aShapeIt = mtk.ModelData_ShapeIterator(theShape, theType)
-        for aShape in aShapeIt:
-            aShapeIdVector.append(aShape.Id())
-        return aShapeIdVector
+    def __AddDFMSheetMetalIrregularSizeNotchIssue(theManager: FeatureGroupManager, theISNIssue: mtk.DFMSheetMetal_IrregularSizeNotchIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Size (LxW)", "mm", Pair(theISNIssue.ExpectedLength(), theISNIssue.ExpectedWidth()),
+            "Actual Size (LxW)",   "mm", Pair(theISNIssue.ActualLength(), theISNIssue.ActualWidth()),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Size Notch(s)", "(255, 254, 145)", aFeatureData, theCount)
 
     @staticmethod
-    def __AddShapesId(theShape: mtk.ModelData_Shape, theType, theShapesIdVec):
-        aShapeIt = mtk.ModelData_ShapeIterator(theShape, theType)
-        for aShape in aShapeIt:
-            theShapesIdVec.append(aShape.Id())
+    def __AddDFMSheetMetalIrregularSizeTabIssue(theManager: FeatureGroupManager, theISTIssue: mtk.DFMSheetMetal_IrregularSizeTabIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Size (LxW)", "mm", Pair(theISTIssue.ExpectedLength(), theISTIssue.ExpectedWidth()),
+            "Actual Size (LxW)",   "mm", Pair(theISTIssue.ActualLength(), theISTIssue.ActualWidth()),
+            theShapeIdVector)
+        theManager.AddGroupData("Irregular Size Tab(s)", "(240, 155, 89)", aFeatureData, theCount)
 
     @staticmethod
-    def __SortFeatures(theFeatures: mtk.MTKBase_FeatureList, theOrderedFeatureList: OrderedFeatureList):
-        for aFeature in theFeatures:
-            #features
-            if mtk.MTKBase_ShapeFeature.CompareType(aFeature):
-                aShapeFeature = mtk.MTKBase_ShapeFeature.Cast(aFeature)
-                aShapeType = mtk.ShapeType_Face
-                if (mtk.SheetMetal_Cutout.CompareType(aFeature)
-                    or (mtk.SheetMetal_Hole.CompareType(aFeature) and not mtk.SheetMetal_ComplexHole.CompareType(aFeature))
-                    or mtk.SheetMetal_Notch.CompareType(aFeature) or mtk.SheetMetal_Tab.CompareType(aFeature)):
-                    aShapeType = mtk.ShapeType_Edge
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aShapeFeature.Shape(), aShapeType)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.Machining_SteppedHole.CompareType(aFeature):
-                aCompositeIdVector = []
-                aSteppedHole = mtk.Machining_SteppedHole.Cast(aFeature);
-                for aHole in aSteppedHole.FeatureList():
-                    aHoleShape = mtk.Machining_Hole.Cast(aHole).Shape()
-                    aShapeIdVector = MTKConverter_Report.__GetShapesId(aHoleShape, mtk.ShapeType_Face)
-                    aCompositeIdVector += aShapeIdVector
-                theOrderedFeatureList.Append(aFeature, aCompositeIdVector)
-            elif mtk.MTKBase_CompositeFeature.CompareType(aFeature):
-                aCompositeFeature = mtk.MTKBase_CompositeFeature.Cast(aFeature)
-                MTKConverter_Report.__SortFeatures(aCompositeFeature.FeatureList(), theOrderedFeatureList)
-                continue
+    def __AddDFMSheetMetalLargeDepthBeadIssue(theManager: FeatureGroupManager, theLDBIssue: mtk.DFMSheetMetal_LargeDepthBeadIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Maximum Depth", "mm", theLDBIssue.ExpectedMaxDepth(),
+            "Actual Depth",           "mm", theLDBIssue.ActualDepth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Large Depth Bead(s)", "(129, 127, 38)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalSmallDepthLouverIssue(theManager: FeatureGroupManager, theSDLIssue: mtk.DFMSheetMetal_SmallDepthLouverIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Depth", "mm", theSDLIssue.ExpectedMinDepth(),
+            "Actual Depth",           "mm", theSDLIssue.ActualDepth(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Depth Louver(s)", "(190, 127, 58)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalNonStandardSheetSizeIssue(theManager: FeatureGroupManager, theNSSSIssue: mtk.DFMSheetMetal_NonStandardSheetSizeIssue, theCount: int, theShapeIdVector):
+        aNesrestStandardSize = theNSSSIssue.NearestStandardSheetSize()
+        anActualSize = theNSSSIssue.ActualSheetSize()
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Nearest Standard Size (LxW)", "mm", Pair(aNesrestStandardSize.Length(), aNesrestStandardSize.Width()),
+            "Actual Size (LxW)",           "mm", Pair(anActualSize.Length(), anActualSize.Width()),
+            theShapeIdVector)
+        theManager.AddGroupData("Non Standard Sheet Size(s)", "(0, 0, 0)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalNonStandardSheetThicknessIssue(theManager: FeatureGroupManager, theNSSTIssue: mtk.DFMSheetMetal_NonStandardSheetThicknessIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Nearest Standard Thickness", "mm", theNSSTIssue.NearestStandardSheetThickness(),
+            "Actual Thickness",           "mm", theNSSTIssue.ActualSheetThickness(),
+            theShapeIdVector)
+        theManager.AddGroupData("Non Standard Sheet Thickness(s)", "(0, 0, 0)", aFeatureData, theCount)
 
+    @staticmethod
+    def __AddDFMSheetMetalSmallDiameterHoleIssue(theManager: FeatureGroupManager, theSDHIssue: mtk.DFMSheetMetal_SmallDiameterHoleIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Diameter", "mm", theSDHIssue.ExpectedMinDiameter(),
+            "Actual Diameter",           "mm", theSDHIssue.ActualDiameter(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Diameter Hole(s)", "(115, 43, 245)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalSmallLengthFlangeIssue(theManager: FeatureGroupManager, theSLFIssue: mtk.DFMSheetMetal_SmallLengthFlangeIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Length", "mm", theSLFIssue.ExpectedMinLength(),
+            "Actual Length",           "mm", theSLFIssue.ActualLength(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Length Flange(s)", "(88, 19, 94)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalSmallLengthHemBendFlangeIssue(theManager: FeatureGroupManager, theSLHBFIssue: mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Length", "mm", theSLHBFIssue.ExpectedMinLength(),
+            "Actual Length",           "mm", theSLHBFIssue.ActualLength(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Length Hem Bend Flange(s)", "(70, 139, 51)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalSmallRadiusBendIssue(theManager: FeatureGroupManager, theSRBIssue: mtk.DFMSheetMetal_SmallRadiusBendIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Radius", "mm", theSRBIssue.ExpectedMinRadius(),
+            "Actual Radius",           "mm", theSRBIssue.ActualRadius(),
+            theShapeIdVector)
+        theManager.AddGroupData("Small Radius Bend(s)", "(161, 251, 142)", aFeatureData, theCount)
+
+    @staticmethod
+    def __AddDFMSheetMetalSmallDistanceBetweenFeaturesIssue(theManager: FeatureGroupManager, theSDIssue: mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue, theCount: int, theShapeIdVector):
+        aFeatureData = MTKConverter_Report.__FeatureData2(
+            "Expected Minimum Distance", "mm", theSDIssue.ExpectedMinDistanceBetweenFeatures(),
+            "Actual Distance",           "mm", theSDIssue.ActualDistanceBetweenFeatures(),
+            theShapeIdVector)
+        theManager.AddGroupData(MTKConverter_Report.__SmallDistanceIssueName(theSDIssue),
+                                MTKConverter_Report.__SmallDistanceIssueColor(theSDIssue),
+                                aFeatureData, theCount)
+
+    @staticmethod
+    def __FlangeShapesId(theFlange: mtk.MTKBase_CompositeFeature, theShapeIdCache: ShapeIdCache):
+        aSources = []
+        for aFlangeFace in theFlange.FeatureList():
+            if mtk.MTKBase_ShapeFeature.CompareType(aFlangeFace):
+                aShapeFeature = mtk.MTKBase_ShapeFeature.Cast(aFlangeFace)
+                aSources.append((aShapeFeature.Shape(), mtk.ShapeType_Face))
+        return theShapeIdCache.Collect(*aSources) if aSources else []
+
+    @staticmethod
+    def __IssueShapesIdGetters():
+        # (issue type, function returning the shape ids of a cast issue from a ShapeIdCache), checked in order
+        aFace = mtk.ShapeType_Face
+        anEdge = mtk.ShapeType_Edge
+        return (
             #dfm machining drilling
-            elif mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue.CompareType(aFeature):
-                anIssue = mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(anIssue.Hole().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(anIssue.Edge(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_DrillingIssue.CompareType(aFeature):
-                anIssue = mtk.DFMMachining_DrillingIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(anIssue.Hole().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
+            (mtk.DFMMachining_SmallDistanceBetweenThreadedHoleAndEdgeIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), aFace), (theIssue.Edge(), anEdge))),
+            (mtk.DFMMachining_DrillingIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), aFace))),
 
             #dfm machining milling
-            elif mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue.CompareType(aFeature):
-                aNSRMPFFIssue = mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aNSRMPFFIssue.FloorFillet(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_DeepPocketIssue.CompareType(aFeature):
-                aDCIssue = mtk.DFMMachining_DeepPocketIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aDCIssue.Pocket().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_HighBossIssue.CompareType(aFeature):
-                aHBIssue = mtk.DFMMachining_HighBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aHBIssue.Boss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_LargeMilledPartIssue.CompareType(aFeature):
-                aShapeIdVector = []
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue.CompareType(aFeature):
-                aMSICRIssue = mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aMSICRIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue.CompareType(aFeature):
-                aNPMPSIssue = mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aNPMPSIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_MilledPartExternalEdgeFilletIssue.CompareType(aFeature):
-                aMPEEFIssue = mtk.DFMMachining_MilledPartExternalEdgeFilletIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aMPEEFIssue.Fillet(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue.CompareType(aFeature):
-                aIRMPFFIssue = mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIRMPFFIssue.FloorFillet(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_NarrowRegionInPocketIssue.CompareType(aFeature):
-                aNRIPIssue = mtk.DFMMachining_NarrowRegionInPocketIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aNRIPIssue.InnerFeature(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aNRIPIssue.NarrowRegionSidewall(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue.CompareType(aFeature):
-                aLDRSIPIssue = mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aLDRSIPIssue.InnerFeature(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aLDRSIPIssue.MinRegionPocketSidewall(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aLDRSIPIssue.MaxRegionPocketSidewall(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_SmallWallThicknessIssue.CompareType(aFeature):
-                aSWTIssue = mtk.DFMMachining_SmallWallThicknessIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSWTIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
+            (mtk.DFMMachining_NonStandardRadiusMilledPartFloorFilletIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FloorFillet(), aFace))),
+            (mtk.DFMMachining_DeepPocketIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Pocket().Shape(), aFace))),
+            (mtk.DFMMachining_HighBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Boss().Shape(), aFace))),
+            (mtk.DFMMachining_LargeMilledPartIssue,
+             lambda theIssue, theCache: []),
+            (mtk.DFMMachining_SmallRadiusMilledPartInternalCornerIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMachining_NonPerpendicularMilledPartShapeIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMachining_MilledPartExternalEdgeFilletIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Fillet(), aFace))),
+            (mtk.DFMMachining_InconsistentRadiusMilledPartFloorFilletIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FloorFillet(), aFace))),
+            (mtk.DFMMachining_NarrowRegionInPocketIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.InnerFeature(), aFace), (theIssue.NarrowRegionSidewall(), aFace))),
+            (mtk.DFMMachining_LargeDifferenceRegionsSizeInPocketIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.InnerFeature(), aFace),
+                                                         (theIssue.MinRegionPocketSidewall(), aFace),
+                                                         (theIssue.MaxRegionPocketSidewall(), aFace))),
+            (mtk.DFMMachining_SmallWallThicknessIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
 
             #dfm machining turning
-            elif mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue.CompareType(aFeature):
-                aBBHRIssue = mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aBBHRIssue.BlindBoredHole(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_DeepBoredHoleIssue.CompareType(aFeature):
-                aISBHIssue = mtk.DFMMachining_DeepBoredHoleIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aISBHIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue.CompareType(aFeature):
-                aODPRIssue = mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aODPRIssue.Face(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue.CompareType(aFeature):
-                aTSICRIssue = mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aTSICRIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_SquareEndKeywayIssue.CompareType(aFeature):
-                aSEKIssue = mtk.DFMMachining_SquareEndKeywayIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSEKIssue.Keyway().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_NonSymmetricalAxialSlotIssue.CompareType(aFeature):
-                aNSASIssue = mtk.DFMMachining_NonSymmetricalAxialSlotIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aNSASIssue.AxialSlot().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_LargeTurnedPartIssue.CompareType(aFeature):
-                aShapeIdVector = []
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMachining_LongSlenderTurnedPartIssue.CompareType(aFeature):
-                aShapeIdVector = []
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
+            (mtk.DFMMachining_SmallDepthBlindBoredHoleReliefIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.BlindBoredHole(), aFace))),
+            (mtk.DFMMachining_DeepBoredHoleIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMachining_IrregularTurnedPartOuterDiameterProfileReliefIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Face(), aFace))),
+            (mtk.DFMMachining_SmallRadiusTurnedPartInternalCornerIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMachining_SquareEndKeywayIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Keyway().Shape(), aFace))),
+            (mtk.DFMMachining_NonSymmetricalAxialSlotIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.AxialSlot().Shape(), aFace))),
+            (mtk.DFMMachining_LargeTurnedPartIssue,
+             lambda theIssue, theCache: []),
+            (mtk.DFMMachining_LongSlenderTurnedPartIssue,
+             lambda theIssue, theCache: []),
 
             #dfm molding
-            elif mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.CompareType(aFeature):
-                aICDSBIssue  = mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aICDSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.CompareType(aFeature):
-                aICDSBIssue  = mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aICDSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_IrregularThicknessRibIssue.CompareType(aFeature):
-                aITRIssue  = mtk.DFMMolding_IrregularThicknessRibIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aITRIssue.Rib().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_IrregularWallThicknessIssue.CompareType(aFeature):
-                aIWTIssue  = mtk.DFMMolding_IrregularWallThicknessIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIWTIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.CompareType(aFeature):
-                aIWTSBIssue  = mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIWTSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallBaseRadiusRibIssue.CompareType(aFeature):
-                aSBRRIssue  = mtk.DFMMolding_SmallBaseRadiusRibIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSBRRIssue.Rib().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.CompareType(aFeature):
-                aSBRSBIssue  = mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSBRSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_LargeWallThicknessIssue.CompareType(aFeature):
-                aLWTssue   = mtk.DFMMolding_LargeWallThicknessIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aLWTssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_HighScrewBossIssue.CompareType(aFeature):
-                aHRIssue   = mtk.DFMMolding_HighScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aHRIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_HighRibIssue.CompareType(aFeature):
-                aHRIssue   = mtk.DFMMolding_HighRibIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aHRIssue.Rib().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallDraftAngleRibIssue.CompareType(aFeature):
-                aSMARIssue   = mtk.DFMMolding_SmallDraftAngleRibIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSMARIssue.Rib().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallDraftAngleScrewBossIssue.CompareType(aFeature):
-                aSDASBIssue = mtk.DFMMolding_SmallDraftAngleScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSDASBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallDistanceBetweenRibsIssue.CompareType(aFeature):
-                aSDBRIssue = mtk.DFMMolding_SmallDistanceBetweenRibsIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDBRIssue.FirstRib().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDBRIssue.SecondRib().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.CompareType(aFeature):
-                aSHBRSBIssue   = mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSHBRSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallDraftAngleWallIssue.CompareType(aFeature):
-                aSDAWIssue = mtk.DFMMolding_SmallDraftAngleWallIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSDAWIssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_NonChamferedScrewBossIssue.CompareType(aFeature):
-                aWTCSBIssue   = mtk.DFMMolding_NonChamferedScrewBossIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aWTCSBIssue.ScrewBoss().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallWallThicknessIssue.CompareType(aFeature):
-                aSWTssue   = mtk.DFMMolding_SmallWallThicknessIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSWTssue.Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMMolding_SmallDistanceBetweenBossesIssue.CompareType(aFeature):
-                aSDBBIssue   = mtk.DFMMolding_SmallDistanceBetweenBossesIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDBBIssue.FirstBoss().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDBBIssue.SecondBoss().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
+            (mtk.DFMMolding_IrregularCoreDepthScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_IrregularThicknessRibIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Rib().Shape(), aFace))),
+            (mtk.DFMMolding_IrregularWallThicknessIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMolding_IrregularWallThicknessScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_SmallBaseRadiusRibIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Rib().Shape(), aFace))),
+            (mtk.DFMMolding_SmallBaseRadiusScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_LargeWallThicknessIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMolding_HighScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_HighRibIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Rib().Shape(), aFace))),
+            (mtk.DFMMolding_SmallDraftAngleRibIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Rib().Shape(), aFace))),
+            (mtk.DFMMolding_SmallDraftAngleScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_SmallDistanceBetweenRibsIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstRib().Shape(), aFace), (theIssue.SecondRib().Shape(), aFace))),
+            (mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_SmallDraftAngleWallIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMolding_NonChamferedScrewBossIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.ScrewBoss().Shape(), aFace))),
+            (mtk.DFMMolding_SmallWallThicknessIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Shape(), aFace))),
+            (mtk.DFMMolding_SmallDistanceBetweenBossesIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstBoss().Shape(), aFace), (theIssue.SecondBoss().Shape(), aFace))),
 
             #dfm sheet metal
-            elif mtk.DFMSheetMetal_FlatPatternInterferenceIssue.CompareType(aFeature):
-                aFPIIssue = mtk.DFMSheetMetal_FlatPatternInterferenceIssue.Cast(aFeature)
-                aShapeIdVector = [aFPIIssue.FirstFace().Id(), aFPIIssue.SecondFace().Id()]
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.CompareType(aFeature):
-                aICFRNIssue = mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aICFRNIssue.Notch().Shape(), mtk.ShapeType_Edge)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.CompareType(aFeature):
-                aIDEHIssue = mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIDEHIssue.Hole().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue.CompareType(aFeature):
-                aIROHBIssue = mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIROHBIssue.Bend().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_InconsistentRadiusBendIssue.CompareType(aFeature):
-                aIRBIssue = mtk.DFMSheetMetal_InconsistentRadiusBendIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aIRBIssue.Bend().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularSizeBendReliefIssue.CompareType(aFeature):
-                aISBRIssue = mtk.DFMSheetMetal_IrregularSizeBendReliefIssue.Cast(aFeature)
-                aFirstActualRelief = aISBRIssue.FirstActualRelief()
-                aSecondActualRelief = aISBRIssue.SecondActualRelief()
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aISBRIssue.Bend().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                if not aFirstActualRelief.IsNull():
-                    MTKConverter_Report.__AddShapesId(aFirstActualRelief.Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                if not aSecondActualRelief.IsNull():
-                    MTKConverter_Report.__AddShapesId(aSecondActualRelief.Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularSizeNotchIssue.CompareType(aFeature):
-                aISNIssue = mtk.DFMSheetMetal_IrregularSizeNotchIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aISNIssue.Notch().Shape(), mtk.ShapeType_Edge)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_IrregularSizeTabIssue.CompareType(aFeature):
-                aISTIssue = mtk.DFMSheetMetal_IrregularSizeTabIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aISTIssue.Tab().Shape(), mtk.ShapeType_Edge)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_LargeDepthBeadIssue.CompareType(aFeature):
-                aLDBIssue = mtk.DFMSheetMetal_LargeDepthBeadIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aLDBIssue.Bead().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDepthLouverIssue.CompareType(aFeature):
-                aSDLIssue = mtk.DFMSheetMetal_SmallDepthLouverIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSDLIssue.Louver().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_NonStandardSheetSizeIssue.CompareType(aFeature):
-                aShapeIdVector = []
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_NonStandardSheetThicknessIssue.CompareType(aFeature):
-                aShapeIdVector = []
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDiameterHoleIssue.CompareType(aFeature):
-                aSDHIssue = mtk.DFMSheetMetal_SmallDiameterHoleIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSDHIssue.Hole().Shape(), mtk.ShapeType_Edge)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallLengthFlangeIssue.CompareType(aFeature):
-                aSLFIssue = mtk.DFMSheetMetal_SmallLengthFlangeIssue.Cast(aFeature)
-                aFlange = aSLFIssue.Flange().FeatureList()
-                aShapeIdVector = []
-                for aFlangeFace in aFlange:
-                    if mtk.MTKBase_ShapeFeature.CompareType(aFlangeFace):
-                        aShapeFeature = mtk.MTKBase_ShapeFeature.Cast(aFlangeFace)
-                        MTKConverter_Report.__AddShapesId(aShapeFeature.Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue.CompareType(aFeature):
-                aSLHBFIssue = mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue.Cast(aFeature)
-                aFlange = aSLHBFIssue.Flange().FeatureList()
-                aShapeIdVector = []
-                for aFlangeFace in aFlange:
-                    if mtk.MTKBase_ShapeFeature.CompareType(aFlangeFace):
-                        aShapeFeature = mtk.MTKBase_ShapeFeature.Cast(aFlangeFace)
-                        MTKConverter_Report.__AddShapesId(aShapeFeature.Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallRadiusBendIssue.CompareType(aFeature):
-                aSRBIssue = mtk.DFMSheetMetal_SmallRadiusBendIssue.Cast(aFeature)
-                aShapeIdVector = MTKConverter_Report.__GetShapesId(aSRBIssue.Bend().Shape(), mtk.ShapeType_Face)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenBendAndLouverIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenBendAndLouverIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Bend().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Louver().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndBendIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndBendIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Bend().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndEdgeIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndEdgeIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                aShapeIdVector.append(aSDIssue.Edge().Id())
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHolesIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHolesIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.FirstHole().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.SecondHole().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndBendIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndBendIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Bend().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndCutoutIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndCutoutIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Cutout().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndEdgeIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndEdgeIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                aShapeIdVector.append(aSDIssue.Edge().Id())
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndLouverIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndNotchIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Louver().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)    
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndNotchIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndNotchIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Hole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Notch().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenHolesIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenHolesIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.FirstHole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.SecondHole().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenNotchAndBendIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenNotchAndBendIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.Notch().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.Bend().Shape(), mtk.ShapeType_Face, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenNotchesIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenNotchesIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.FirstNotch().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.SecondNotch().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-            elif mtk.DFMSheetMetal_SmallDistanceBetweenTabsIssue.CompareType(aFeature):
-                aSDIssue = mtk.DFMSheetMetal_SmallDistanceBetweenTabsIssue.Cast(aFeature)
-                aShapeIdVector = []
-                MTKConverter_Report.__AddShapesId(aSDIssue.FirstTab().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                MTKConverter_Report.__AddShapesId(aSDIssue.SecondTab().Shape(), mtk.ShapeType_Edge, aShapeIdVector)
-                theOrderedFeatureList.Append(aFeature, aShapeIdVector)
-
-    @staticmethod
-    def __WriteFeatures(theWriter: JSONWriter, theGroupName: str, theSubgroupName: str,
-                        theFeatures: mtk.MTKBase_FeatureList, theMessageForEmptyList: str):
-        theWriter.OpenSection(theSubgroupName)
-        theWriter.WriteData("name", theGroupName)
+            (mtk.DFMSheetMetal_FlatPatternInterferenceIssue,
+             lambda theIssue, theCache: [theIssue.FirstFace().Id(), theIssue.SecondFace().Id()]),
+            (mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Notch().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), aFace))),
+            (mtk.DFMSheetMetal_IrregularRadiusOpenHemBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_InconsistentRadiusBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_IrregularSizeBendReliefIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bend().Shape(), aFace),
+                                                         *[(i.Shape(), anEdge)
+                                                           for i in (theIssue.FirstActualRelief(), theIssue.SecondActualRelief())
+                                                           if not i.IsNull()])),
+            (mtk.DFMSheetMetal_IrregularSizeNotchIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Notch().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_IrregularSizeTabIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Tab().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_LargeDepthBeadIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bead().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDepthLouverIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Louver().Shape(), aFace))),
+            (mtk.DFMSheetMetal_NonStandardSheetSizeIssue,
+             lambda theIssue, theCache: []),
+            (mtk.DFMSheetMetal_NonStandardSheetThicknessIssue,
+             lambda theIssue, theCache: []),
+            (mtk.DFMSheetMetal_SmallDiameterHoleIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_SmallLengthFlangeIssue,
+             lambda theIssue, theCache: MTKConverter_Report.__FlangeShapesId(theIssue.Flange(), theCache)),
+            (mtk.DFMSheetMetal_SmallLengthHemBendFlangeIssue,
+             lambda theIssue, theCache: MTKConverter_Report.__FlangeShapesId(theIssue.Flange(), theCache)),
+            (mtk.DFMSheetMetal_SmallRadiusBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenBendAndLouverIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Bend().Shape(), aFace), (theIssue.Louver().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), aFace), (theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHoleAndEdgeIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), aFace)) + [theIssue.Edge().Id()]),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenExtrudedHolesIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstHole().Shape(), aFace), (theIssue.SecondHole().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge), (theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndCutoutIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge), (theIssue.Cutout().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndEdgeIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge)) + [theIssue.Edge().Id()]),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndLouverIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge), (theIssue.Louver().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHoleAndNotchIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Hole().Shape(), anEdge), (theIssue.Notch().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenHolesIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstHole().Shape(), anEdge), (theIssue.SecondHole().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenNotchAndBendIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.Notch().Shape(), anEdge), (theIssue.Bend().Shape(), aFace))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenNotchesIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstNotch().Shape(), anEdge), (theIssue.SecondNotch().Shape(), anEdge))),
+            (mtk.DFMSheetMetal_SmallDistanceBetweenTabsIssue,
+             lambda theIssue, theCache: theCache.Collect((theIssue.FirstTab().Shape(), anEdge), (theIssue.SecondTab().Shape(), anEdge))),
+        )
+
+    # Sheet metal features whose shape ids are those of their edges
+    @staticmethod
+    def __EdgeShapeFeatureTypes():
+        return (mtk.SheetMetal_Cutout, mtk.SheetMetal_Hole, mtk.SheetMetal_Notch, mtk.SheetMetal_Tab)
+
+    @staticmethod
+    def __ShapesIdCollectorTypes():
+        aTypes = [mtk.MTKBase_ShapeFeature, mtk.SheetMetal_ComplexHole, mtk.Machining_SteppedHole,
+                  mtk.MTKBase_CompositeFeature]
+        aTypes.extend(MTKConverter_Report.__EdgeShapeFeatureTypes())
+        aTypes.extend(aType for aType, _ in MTKConverter_Report.__IssueShapesIdGetters())
+        return aTypes
+
+    # (type resolved to, function appending a feature with its shape ids to an
+    # OrderedFeatureList), None for features that aren't reported
+    @staticmethod
+    def __ResolveShapesIdCollector(theFeature: mtk.MTKBase_Feature):
+        #features
+        if mtk.MTKBase_ShapeFeature.CompareType(theFeature):
+            aType = mtk.MTKBase_ShapeFeature
+            aShapeType = mtk.ShapeType_Face
+            if mtk.SheetMetal_ComplexHole.CompareType(theFeature):
+                aType = mtk.SheetMetal_ComplexHole
+            else:
+                for anEdgeType in MTKConverter_Report.__EdgeShapeFeatureTypes():
+                    if anEdgeType.CompareType(theFeature):
+                        aType = anEdgeType
+                        aShapeType = mtk.ShapeType_Edge
+                        break
+            return aType, lambda theFeature, theOrderedFeatureList, theShapeIdCache: theOrderedFeatureList.Append(
+                theFeature, LazyShapeIDs(lambda: theShapeIdCache.Get(mtk.MTKBase_ShapeFeature.Cast(theFeature).Shape(),
+                                                                     aShapeType)))
+        if mtk.Machining_SteppedHole.CompareType(theFeature):
+            return mtk.Machining_SteppedHole, MTKConverter_Report.__CollectSteppedHole
+        if mtk.MTKBase_CompositeFeature.CompareType(theFeature):
+            return mtk.MTKBase_CompositeFeature, lambda theFeature, theOrderedFeatureList, theShapeIdCache: MTKConverter_Report.__SortFeatures(
+                mtk.MTKBase_CompositeFeature.Cast(theFeature).FeatureList(), theOrderedFeatureList, theShapeIdCache)
+
+        for aType, aGetShapesId in MTKConverter_Report.__IssueShapesIdGetters():
+            if aType.CompareType(theFeature):
+                return aType, lambda theFeature, theOrderedFeatureList, theShapeIdCache: theOrderedFeatureList.Append(
+                    theFeature, LazyShapeIDs(lambda: aGetShapesId(aType.Cast(theFeature), theShapeIdCache)))
+        return None
+
+    @staticmethod
+    def __CollectSteppedHole(theFeature: mtk.MTKBase_Feature, theOrderedFeatureList: OrderedFeatureList,
+                             theShapeIdCache: ShapeIdCache):
+        def CompositeIdVector():
+            aSteppedHole = mtk.Machining_SteppedHole.Cast(theFeature)
+            aSources = [(mtk.Machining_Hole.Cast(aHole).Shape(), mtk.ShapeType_Face) for aHole in aSteppedHole.FeatureList()]
+            return theShapeIdCache.Collect(*aSources) if aSources else []
+        theOrderedFeatureList.Append(theFeature, LazyShapeIDs(CompositeIdVector))
+
+    # Writers of the feature group of theFeature
+    @staticmethod
+    def __GroupWriters(theFeature: mtk.MTKBase_Feature):
+        if mtk.MTKBase_ShapeFeature.CompareType(theFeature) or mtk.Machining_SteppedHole.CompareType(theFeature):
+            return MTKConverter_Report.__ShapeFeatureWriters()
+        elif mtk.DFMMachining_DrillingIssue.CompareType(theFeature):
+            return MTKConverter_Report.__DrillingIssueWriters()
+        elif mtk.DFMMachining_MillingIssue.CompareType(theFeature):
+            return MTKConverter_Report.__MillingIssueWriters()
+        elif (mtk.DFMSheetMetal_BendIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_FlatPatternInterferenceIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_HoleIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_IrregularSizeNotchIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_IrregularSizeTabIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_LargeDepthBeadIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_SmallDepthLouverIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_NonStandardSheetSizeIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_NonStandardSheetThicknessIssue.CompareType(theFeature)
+              or mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue.CompareType(theFeature)):
+            return MTKConverter_Report.__SheetMetalIssueWriters()
+        elif (mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_IrregularThicknessRibIssue.CompareType(theFeature)
+              or mtk.DFMMolding_IrregularWallThicknessIssue.CompareType(theFeature)
+              or mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallBaseRadiusRibIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_LargeWallThicknessIssue.CompareType(theFeature)
+              or mtk.DFMMolding_HighRibIssue.CompareType(theFeature)
+              or mtk.DFMMolding_HighScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallDraftAngleRibIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallDraftAngleScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallDistanceBetweenRibsIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallDraftAngleWallIssue.CompareType(theFeature)
+              or mtk.DFMMolding_NonChamferedScrewBossIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallWallThicknessIssue.CompareType(theFeature)
+              or mtk.DFMMolding_SmallDistanceBetweenBossesIssue.CompareType(theFeature)):
+            return MTKConverter_Report.__MoldingIssueWriters()
+        elif mtk.DFMBase_Issue.CompareType(theFeature):
+            return MTKConverter_Report.__TurningIssueWriters()
+        return ()
+
+    @staticmethod
+    def __GroupWriterTypes():
+        aTypes = []
+        for aWriters in (MTKConverter_Report.__ShapeFeatureWriters(), MTKConverter_Report.__DrillingIssueWriters(),
+                         MTKConverter_Report.__MillingIssueWriters(), MTKConverter_Report.__SheetMetalIssueWriters(),
+                         MTKConverter_Report.__MoldingIssueWriters(), MTKConverter_Report.__TurningIssueWriters()):
+            aTypes.extend(aType for aType, _ in aWriters)
+        return aTypes
+
+    # (concrete type, writer of a feature cast to it), None for features that
+    # aren't reported
+    @staticmethod
+    def __ResolveGroupWriter(theFeature: mtk.MTKBase_Feature):
+        for aType, anAdd in MTKConverter_Report.__GroupWriters(theFeature):
+            if aType.CompareType(theFeature):
+                return aType, anAdd
+        return None
+
+    __theShapesIdCollectors = FeatureTypeDispatcher(lambda theFeature: MTKConverter_Report.__ResolveShapesIdCollector(theFeature),
+                                                    lambda: MTKConverter_Report.__ShapesIdCollectorTypes())
+    __theGroupWriters = FeatureTypeDispatcher(lambda theFeature: MTKConverter_Report.__ResolveGroupWriter(theFeature),
+                                              lambda: MTKConverter_Report.__GroupWriterTypes())
+
+    @staticmethod
+    def __SortFeatures(theFeatures: mtk.MTKBase_FeatureList, theOrderedFeatureList: OrderedFeatureList,
+                       theShapeIdCache: ShapeIdCache):
+        for aFeature in theFeatures:
+            aCollector = MTKConverter_Report.__theShapesIdCollectors.Find(aFeature)
+            if aCollector:
+                _, aCollect = aCollector
+                aCollect(aFeature, theOrderedFeatureList, theShapeIdCache)
 
+    @staticmethod
+    def __BuildFeatures(theGroupName: str, theSubgroupName: str, theFeatures: mtk.MTKBase_FeatureList,
+                        theMessageForEmptyList: str, theShapeIdCache: ShapeIdCache):
         if theFeatures.IsEmpty():
-            theWriter.WriteData("message", theMessageForEmptyList)
-        else:
-            aSortedFeatures = OrderedFeatureList()
-            MTKConverter_Report.__SortFeatures(theFeatures, aSortedFeatures)
-
-            aFGManager = FeatureGroupManager()
-            for i in range(aSortedFeatures.Size()):
-                aFeature = aSortedFeatures.GetFeature(i)
-                aCount = aSortedFeatures.GetFeatureCount(i)
-                aShapeIDVec = aSortedFeatures.GetFeatureShapeIDs(i)
-
-                if mtk.MTKBase_ShapeFeature.CompareType(aFeature) or mtk.Machining_SteppedHole.CompareType(aFeature):
-                    MTKConverter_Report.__AddShapeFeature(aFGManager, mtk.MTKBase_ShapeFeature.Cast(aFeature),
-                                                          aCount, aShapeIDVec)
-                elif mtk.DFMMachining_DrillingIssue.CompareType(aFeature):
-                    MTKConverter_Report.__AddDrillingIssue(aFGManager, mtk.DFMMachining_DrillingIssue.Cast(aFeature),
-                                                           aCount, aShapeIDVec)
-                elif mtk.DFMMachining_MillingIssue.CompareType(aFeature):
-                    MTKConverter_Report.__AddMillingIssue(aFGManager, mtk.DFMMachining_MillingIssue.Cast(aFeature),
-                                                          aCount, aShapeIDVec)
-                elif (mtk.DFMSheetMetal_BendIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_FlatPatternInterferenceIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_HoleIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_IrregularCornerFilletRadiusNotchIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_IrregularDepthExtrudedHoleIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_IrregularSizeNotchIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_IrregularSizeTabIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_LargeDepthBeadIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_SmallDepthLouverIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_NonStandardSheetSizeIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_NonStandardSheetThicknessIssue.CompareType(aFeature)
-                      or mtk.DFMSheetMetal_SmallDistanceBetweenFeaturesIssue.CompareType(aFeature)):
-                    MTKConverter_Report.__AddSheetMetalIssue(aFGManager, mtk.DFMBase_Issue.Cast(aFeature),
-                                                             aCount, aShapeIDVec)
-                elif (mtk.DFMMolding_IrregularCoreDiameterScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_IrregularCoreDepthScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_IrregularThicknessRibIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_IrregularWallThicknessIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_IrregularWallThicknessScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallBaseRadiusRibIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallBaseRadiusScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_LargeWallThicknessIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_HighRibIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_HighScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallDraftAngleRibIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallDraftAngleScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallDistanceBetweenRibsIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallHoleBaseRadiusScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallDraftAngleWallIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_NonChamferedScrewBossIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallWallThicknessIssue.CompareType(aFeature)
-                      or mtk.DFMMolding_SmallDistanceBetweenBossesIssue.CompareType(aFeature)):
-                    MTKConverter_Report.__AddMoldingIssue(aFGManager, mtk.DFMBase_Issue.Cast(aFeature),
-                                                          aCount, aShapeIDVec)
-                elif mtk.DFMBase_Issue.CompareType(aFeature):
-                    MTKConverter_Report.__AddTurningIssue(aFGManager, mtk.DFMBase_Issue.Cast(aFeature),
-                                                          aCount, aShapeIDVec)
-
-            theWriter.WriteData("totalFeatureCount", aFGManager.TotalFeatureCount())
-            theWriter.OpenArraySection("featureGroups")
-            aFGManager.Write(theWriter)
-            theWriter.CloseArraySection()
+            return model.FeatureSection(theSubgroupName, theGroupName, theMessageForEmptyList)
 
-        theWriter.CloseSection()
+        aSortedFeatures = OrderedFeatureList()
+        MTKConverter_Report.__SortFeatures(theFeatures, aSortedFeatures, theShapeIdCache)
 
-        return True
+        aFGManager = FeatureGroupManager()
+        for i in range(aSortedFeatures.Size()):
+            aFeature = aSortedFeatures.GetFeature(i)
+            aCount = aSortedFeatures.GetFeatureCount(i)
+            aShapeIDVec = aSortedFeatures.GetFeatureShapeIDs(i)
+
+            aGroupWriter = MTKConverter_Report.__theGroupWriters.Find(aFeature)
+            if aGroupWriter:
+                aType, anAdd = aGroupWriter
+                anAdd(aFGManager, aType.Cast(aFeature), aCount, aShapeIDVec)
+
+        return model.FeatureSection(theSubgroupName, theGroupName, None, aFGManager.Groups())
 
     @staticmethod
     def __MachiningProcessName(theOperation):
@@ -1798,82 +2167,75 @@ class MTKConverter_Report:
         return False
 
     @staticmethod
-    def __WriteThicknessNode(theWriter: JSONWriter, theParamName: str, theParamValue: int,
-                             thePoints: wt_proc.PointPair, theNodeName: str):
+    def __BuildThicknessNode(theParamName: str, theParamValue: int, thePoints: wt_proc.PointPair, theNodeName: str):
         aFirstPoint = thePoints.First
         aSecondPoint = thePoints.Second
-        theWriter.OpenSection(theNodeName)
-        theWriter.WriteData("name", theParamName)
-        theWriter.WriteData("units", "mm")
-        theWriter.WriteData("value", theParamValue)
-        theWriter.WriteData("firstPoint",  Point(aFirstPoint.X(), aFirstPoint.Y(), aFirstPoint.Z()))
-        theWriter.WriteData("secondPoint", Point(aSecondPoint.X(), aSecondPoint.Y(), aSecondPoint.Z()))
-        theWriter.CloseSection()
+        return model.ThicknessSection(theNodeName, theParamName, "mm", theParamValue,
+                                      Point(aFirstPoint.X(), aFirstPoint.Y(), aFirstPoint.Z()),
+                                      Point(aSecondPoint.X(), aSecondPoint.Y(), aSecondPoint.Z()))
 
     @staticmethod
-    def __WriteUnfoldedPartFeatures(theWriter: JSONWriter, theData: sm_proc.MTKConverter_UnfoldedPartData):
-        theWriter.OpenSection("featureRecognitionUnfolded")
-        theWriter.WriteData("name", "Feature Recognition")
-
+    def __BuildUnfoldedPartFeatures(theData: sm_proc.MTKConverter_UnfoldedPartData):
+        aSection = model.UnfoldedPartSection("featureRecognitionUnfolded", "Feature Recognition")
         if theData.myIsInit:
-            aStream = io.StringIO()
-            aWriter = JSONWriter(aStream, 4)
-
-            aWriter.WriteData("parametersCount", 3)
-            aWriter.OpenArraySection("parameters")
-            MTKConverter_Report.__WriteParameter(aWriter, "Length",    "mm", theData.myLength)
-            MTKConverter_Report.__WriteParameter(aWriter, "Width",     "mm", theData.myWidth)
-            MTKConverter_Report.__WriteParameter(aWriter, "Thickness", "mm", theData.myThickness)
-            MTKConverter_Report.__WriteParameter(aWriter, "Perimeter", "mm", theData.myPerimeter)
-            aWriter.CloseArraySection()
-
-            theWriter.WriteRawData(aStream.getvalue())
-            aStream.close()
+            aSection.Parameters = [model.Parameter("Length",    "mm", theData.myLength),
+                                   model.Parameter("Width",     "mm", theData.myWidth),
+                                   model.Parameter("Thickness", "mm", theData.myThickness),
+                                   model.Parameter("Perimeter", "mm", theData.myPerimeter)]
         else:
-            theWriter.WriteData("message", "Unfolded part wasn't generated.")
-
-        theWriter.CloseSection()
+            aSection.Message = "Unfolded part wasn't generated."
+        return aSection
 
+    # Results of theProcessData as a model.PartReport without PartId, which
+    # is all a worker process has to send back for its part. The part is
+    # measured through theMeasurementsService if given.
     @staticmethod
-    def __WritePartProcessData(theWriter: JSONWriter, theProcessData):
+    def BuildPartReport(theProcessData, theMeasurementsService: measurements.MeasurementsService = None):
+        aPartReport = model.PartReport()
+        if theMeasurementsService is not None:
+            aPartReport.Measurements = theMeasurementsService.Part(theProcessData.myPart)
+        aSections = aPartReport.Sections
+        aShapeIdCache = ShapeIdCache()
         aRes = False
-        theWriter.WriteData("partId", theProcessData.myPart.Uuid())
-
         anErrorMsg = "An error occurred while processing the part."
         if type(theProcessData) is mach_proc.MTKConverter_MachiningData:
-            theWriter.WriteData("process", MTKConverter_Report.__MachiningProcessName(theProcessData.myOperation))
+            aPartReport.Process = MTKConverter_Report.__MachiningProcessName(theProcessData.myOperation)
             if not theProcessData.myFeatureList.IsEmpty():
-                MTKConverter_Report.__WriteFeatures(theWriter, "Feature Recognition", "featureRecognition",
-                                                    theProcessData.myFeatureList, "")
-                MTKConverter_Report.__WriteFeatures(theWriter, "Design for Manufacturing", "dfm", theProcessData.myIssueList,
-                                                    "Part contains no DFM improvement suggestions.")
+                aSections.append(MTKConverter_Report.__BuildFeatures("Feature Recognition", "featureRecognition",
+                                                                     theProcessData.myFeatureList, "", aShapeIdCache))
+                aSections.append(MTKConverter_Report.__BuildFeatures("Design for Manufacturing", "dfm",
+                                                                     theProcessData.myIssueList,
+                                                                     "Part contains no DFM improvement suggestions.", aShapeIdCache))
                 aRes = True
             elif not MTKConverter_Report.__HasShapes(theProcessData.myPart, mtk.ShapeType_Solid):
                 anErrorMsg = "The part can't be analyzed due to lack of: BRep representation or solids in BRep representation."
         elif type(theProcessData) is mold_proc.MTKConverter_MoldingData:
-            theWriter.WriteData("process", "Molding Analysis")
+            aPartReport.Process = "Molding Analysis"
             if not theProcessData.myFeatureList.IsEmpty():
-                MTKConverter_Report.__WriteFeatures(theWriter, "Feature Recognition", "featureRecognition",
-                                                    theProcessData.myFeatureList, "")
-                MTKConverter_Report.__WriteFeatures(theWriter, "Design for Manufacturing", "dfm", theProcessData.myIssueList,
-                                                    "Part contains no DFM improvement suggestions.")
+                aSections.append(MTKConverter_Report.__BuildFeatures("Feature Recognition", "featureRecognition",
+                                                                     theProcessData.myFeatureList, "", aShapeIdCache))
+                aSections.append(MTKConverter_Report.__BuildFeatures("Design for Manufacturing", "dfm",
+                                                                     theProcessData.myIssueList,
+                                                                     "Part contains no DFM improvement suggestions.", aShapeIdCache))
                 aRes = True
             elif not MTKConverter_Report.__HasShapes(theProcessData.myPart, mtk.ShapeType_Solid):
                 anErrorMsg = "The part can't be analyzed due to lack of: BRep representation or solids in BRep representation."
         elif type(theProcessData) is sm_proc.MTKConverter_SheetMetalData:
-            theWriter.WriteData("process", "Sheet Metal")
+            aPartReport.Process = "Sheet Metal"
             if theProcessData.myIsSheetMetalPart:
-                MTKConverter_Report.__WriteFeatures(theWriter, "Feature Recognition", "featureRecognition",
-                                                    theProcessData.myFeatureList, "Part contains no features.")
-                MTKConverter_Report.__WriteFeatures(theWriter, "Design for Manufacturing", "dfm", theProcessData.myIssueList,
-                                                    "Part contains no DFM improvement suggestions.")
+                aSections.append(MTKConverter_Report.__BuildFeatures("Feature Recognition", "featureRecognition",
+                                                                     theProcessData.myFeatureList,
+                                                                     "Part contains no features.", aShapeIdCache))
+                aSections.append(MTKConverter_Report.__BuildFeatures("Design for Manufacturing", "dfm",
+                                                                     theProcessData.myIssueList,
+                                                                     "Part contains no DFM improvement suggestions.", aShapeIdCache))
 
                 anUnfoldedPartData = theProcessData.myUnfoldedPartData
-                MTKConverter_Report.__WriteUnfoldedPartFeatures(theWriter, anUnfoldedPartData)
+                aSections.append(MTKConverter_Report.__BuildUnfoldedPartFeatures(anUnfoldedPartData))
                 if anUnfoldedPartData.myIsInit:
-                    MTKConverter_Report.__WriteFeatures(theWriter, "Design for Manufacturing", "dfmUnfolded",
-                                                        anUnfoldedPartData.myIssueList,
-                                                        "Unfolded part contains no DFM improvement suggestions.")
+                    aSections.append(MTKConverter_Report.__BuildFeatures("Design for Manufacturing", "dfmUnfolded",
+                                                                         anUnfoldedPartData.myIssueList,
+                                                                         "Unfolded part contains no DFM improvement suggestions.", aShapeIdCache))
                 aRes = True
             elif (not MTKConverter_Report.__HasShapes(theProcessData.myPart, mtk.ShapeType_Solid)
                  and (not MTKConverter_Report.__HasShapes (theProcessData.myPart, mtk.ShapeType_Shell))):
@@ -1881,12 +2243,12 @@ class MTKConverter_Report:
             else:
                 anErrorMsg = "The part wasn't recognized as a sheet metal part."
         elif type(theProcessData) is wt_proc.MTKConverter_WallThicknessData:
-            theWriter.WriteData("process", "Wall Thickness Analysis")
+            aPartReport.Process = "Wall Thickness Analysis"
             if theProcessData.myIsInit:
-                MTKConverter_Report.__WriteThicknessNode (theWriter, "Minimum Thickness", theProcessData.myMinThickness,
-                                                          theProcessData.myMinThicknessPoints, "minThickness")
-                MTKConverter_Report.__WriteThicknessNode (theWriter, "Maximum Thickness", theProcessData.myMaxThickness,
-                                                          theProcessData.myMaxThicknessPoints, "maxThickness")
+                aSections.append(MTKConverter_Report.__BuildThicknessNode("Minimum Thickness", theProcessData.myMinThickness,
+                                                                          theProcessData.myMinThicknessPoints, "minThickness"))
+                aSections.append(MTKConverter_Report.__BuildThicknessNode("Maximum Thickness", theProcessData.myMaxThickness,
+                                                                          theProcessData.myMaxThicknessPoints, "maxThickness"))
                 aRes = True
             elif not MTKConverter_Report.__HasShapes (theProcessData.myPart.Bodies(), cadex.ModelData_ST_Solid):
                 anErrorMsg = "The part can't be analyzed due to lack of: BRep representation, solids in BRep representation."
@@ -1894,5 +2256,5 @@ class MTKConverter_Report:
             anErrorMsg = "Unrecognized process"
 
         if not aRes:
-            theWriter.WriteData("error", anErrorMsg)
-
+            aPartReport.Error = anErrorMsg
+        return aPartReport
@@ -0,0 +1,155 @@
+# MTKConverter_ReportModel.py
+#
+# Typed report, built once per run from the process data. The JSON and CBOR
+# reports are serialized from it, and in-process consumers read the values
+# from it directly. Values are kept as computed: rounding and formatting are
+# left to the serializers. Shape ids are Python ints; the shape ids of a
+# feature are a sequence, collected on first read, that features referring
+# to the same shape may share.
+
+from dataclasses import dataclass, field
+
+class Pair:
+    __slots__ = ("First", "Second")
+
+    def __init__(self, theFirst: float, theSecond: float):
+        self.First = theFirst
+        self.Second = theSecond
+
+    def __repr__(self):
+        return f"Pair({self.First}, {self.Second})"
+
+    def __str__(self):
+        return f"{self.First:.2f} x {self.Second:.2f}"
+
+class Dimension:
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, theX: float, theY: float, theZ: float):
+        self.X = theX
+        self.Y = theY
+        self.Z = theZ
+
+    def __repr__(self):
+        return f"Dimension({self.X}, {self.Y}, {self.Z})"
+
+    def __str__(self):
+        return f"{self.X:.2f} x {self.Y:.2f} x {self.Z:.2f}"
+
+class Direction:
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, theX: float, theY: float, theZ: float):
+        self.X = theX
+        self.Y = theY
+        self.Z = theZ
+
+    def __repr__(self):
+        return f"Direction({self.X}, {self.Y}, {self.Z})"
+
+    def __str__(self):
+        return f"({self.X:.2f}, {self.Y:.2f}, {self.Z:.2f})"
+
+class Point:
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, theX: float, theY: float, theZ: float):
+        self.X = theX
+        self.Y = theY
+        self.Z = theZ
+
+    def __repr__(self):
+        return f"Point({self.X}, {self.Y}, {self.Z})"
+
+    def __str__(self):
+        return f"({self.X:.2f}, {self.Y:.2f}, {self.Z:.2f})"
+
+@dataclass(slots=True)
+class Parameter:
+    Name: str
+    Units: str
+    Value: object
+
+# Features sharing the same parameters; every entry of ShapeIDs lists the
+# shape ids of one feature
+@dataclass(slots=True)
+class FeatureSubGroup:
+    Parameters: list
+    ShapeIDs: list
+
+    def ParameterValue(self, theName: str):
+        for aParameter in self.Parameters:
+            if aParameter.Name == theName:
+                return aParameter.Value
+        return None
+
+# Either Features (shape id lists of features without parameters) or
+# SubGroups is filled
+@dataclass(slots=True)
+class FeatureGroup:
+    Name: str
+    Color: str
+    FeatureCount: int = 0
+    Features: list = field(default_factory=list)
+    SubGroups: list = field(default_factory=list)
+
+# "featureRecognition", "dfm" or "dfmUnfolded". Message is set instead of
+# the groups if there was nothing to recognize.
+@dataclass(slots=True)
+class FeatureSection:
+    Key: str
+    Name: str
+    Message: str = None
+    Groups: list = field(default_factory=list)
+
+    def TotalFeatureCount(self):
+        return sum(aGroup.FeatureCount for aGroup in self.Groups)
+
+    def Group(self, theName: str):
+        for aGroup in self.Groups:
+            if aGroup.Name == theName:
+                return aGroup
+        return None
+
+# Flat pattern parameters, or Message if the part wasn't unfolded
+@dataclass(slots=True)
+class UnfoldedPartSection:
+    Key: str
+    Name: str
+    Parameters: list = None
+    Message: str = None
+
+@dataclass(slots=True)
+class ThicknessSection:
+    Key: str
+    Name: str
+    Units: str
+    Value: object
+    FirstPoint: Point
+    SecondPoint: Point
+
+# Results of one process for one part, sections in report order. PartId is
+# None for results computed in a worker until the parent assigns its part.
+# Measurements are the measurements.Measurements of the whole part, the same
+# for every process.
+@dataclass(slots=True)
+class PartReport:
+    PartId: str = None
+    Process: str = None
+    Sections: list = field(default_factory=list)
+    Error: str = None
+    Measurements: object = None
+
+    def Section(self, theKey: str):
+        for aSection in self.Sections:
+            if aSection.Key == theKey:
+                return aSection
+        return None
+
+@dataclass(slots=True)
+class Report:
+    Parts: list = field(default_factory=list)
+
+    # With several processes a part has an entry per process
+    def PartReports(self, thePartId: str):
+        return [i for i in self.Parts if i.PartId == thePartId]
@@ -30,6 +30,7 @@
 import manufacturingtoolkit.CadExMTK as mtk
 
 import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Timings as timings
 
 class MTKConverter_UnfoldedPartData:
     def __init__(self):
@@ -83,7 +84,8 @@ class MTKConverter_SheetMetalProcessor(part_proc.MTKConverter_VoidPartProcessor)
                 anUnfoldedData.myPerimeter = aFlatPattern.Perimeter()
 
         aDFMAnalyzer = mtk.DFMSheetMetal_Analyzer()
-        anIssueList = aDFMAnalyzer.Perform(theData)
+        with timings.Stage("dfm"):
+            anIssueList = aDFMAnalyzer.Perform(theData)
         for anIssue in anIssueList:
             if (anUnfoldedData.myIsInit
                 and (mtk.DFMSheetMetal_FlatPatternInterferenceIssue.CompareType(anIssue)
@@ -93,12 +95,15 @@ class MTKConverter_SheetMetalProcessor(part_proc.MTKConverter_VoidPartProcessor)
             else:
                 anSMData.myIssueList.Append(anIssue)
 
+    # Feature recognition and unfolding are one analyzer run
     def ProcessSolid (self, thePart: mtk.ModelData_Part, theSolid: mtk.ModelData_Solid):
-        anSMData = self.myAnalyzer.Perform(theSolid)
+        with timings.Stage("featureRecognition"):
+            anSMData = self.myAnalyzer.Perform(theSolid)
         self.__UpdateProcessData(anSMData, thePart)
 
     def ProcessShell (self, thePart: mtk.ModelData_Part, theShell: mtk.ModelData_Shell):
-        anSMData = self.myAnalyzer.Perform(theShell)
+        with timings.Stage("featureRecognition"):
+            anSMData = self.myAnalyzer.Perform(theShell)
         self.__UpdateProcessData(anSMData, thePart)
 
     def PostPartProcess(self, thePart: mtk.ModelData_Part):
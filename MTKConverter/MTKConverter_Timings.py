@@ -0,0 +1,250 @@
+# MTKConverter_Timings.py
+#
+# Stage instrumentation of converter runs. For every stage the tracer records
+# its wall time, the CPU time of the process and the peak resident set size
+# reached while it was open, sampled in a background thread. Stages nest: a
+# new stage is a child of the stage open on the same thread, or of the
+# parent it is given when it runs on another thread.
+#
+# Code below the application opens stages through Stage(), which records into
+# the tracer activated for the run and does nothing otherwise. Stages of
+# worker processes are recorded by a tracer of their own and attached to the
+# parent's tree with Attach().
+
+import itertools
+import json
+import os
+import threading
+import time
+
+import MTKConverter_Memory as memory
+
+class MTKConverter_Span:
+    __slots__ = ("Name", "Attributes", "Children", "Id", "ParentId", "StartNs", "Wall", "Cpu", "PeakRss",
+                 "myStartTime", "myStartCpu")
+
+    def __init__(self, theName: str, theAttributes: dict = None):
+        self.Name = theName
+        self.Attributes = dict(theAttributes) if theAttributes else {}
+        self.Children = []
+        self.Id = 0
+        self.ParentId = 0
+        self.StartNs = time.time_ns()
+        self.Wall = 0.0
+        self.Cpu = 0.0
+        self.PeakRss = memory.CurrentRss()
+        self.myStartTime = time.perf_counter()
+        self.myStartCpu = time.process_time()
+
+    def Close(self):
+        self.Wall = time.perf_counter() - self.myStartTime
+        self.Cpu = time.process_time() - self.myStartCpu
+        self.PeakRss = max(self.PeakRss, memory.CurrentRss())
+
+    def EndNs(self):
+        return self.StartNs + int(self.Wall * 1e9)
+
+    def Walk(self):
+        yield self
+        for aChild in self.Children:
+            yield from aChild.Walk()
+
+    # theOriginNs is the start of the run, offsets are in seconds from it
+    def ToDict(self, theOriginNs: int):
+        aDict = {"name": self.Name}
+        if self.Attributes:
+            aDict["attributes"] = self.Attributes
+        aDict["start"] = (self.StartNs - theOriginNs) / 1e9
+        aDict["wall"] = self.Wall
+        aDict["cpu"] = self.Cpu
+        aDict["peakRss"] = self.PeakRss
+        if self.Children:
+            aDict["stages"] = [i.ToDict(theOriginNs) for i in self.Children]
+        return aDict
+
+class MTKConverter_Tracer:
+    def __init__(self, theSampleInterval: float = 0.05):
+        self.myRoots = []
+        self.mySampleInterval = theSampleInterval
+        self.__myIds = itertools.count(1)
+        self.__myOpenSpans = set()
+        self.__myLock = threading.Lock()
+        self.__myLocal = threading.local()
+        self.__myStopEvent = threading.Event()
+        self.__mySampler = None
+
+    # Opens a stage under theParent, or under the stage open on this thread
+    def Stage(self, theName: str, theAttributes: dict = None, theParent: MTKConverter_Span = None):
+        return _StageContext(self, theName, theAttributes, theParent)
+
+    # Makes this the tracer of Stage() and samples the RSS until deactivated
+    def Activate(self):
+        return _ActivationContext(self)
+
+    def Current(self):
+        aStack = self.__Stack()
+        return aStack[-1] if aStack else None
+
+    def Attach(self, theSpan: MTKConverter_Span, theParent: MTKConverter_Span = None):
+        aParent = theParent if theParent is not None else self.Current()
+        with self.__myLock:
+            # Ids of another tracer are renumbered into this one
+            for aSpan in theSpan.Walk():
+                aSpan.Id = next(self.__myIds)
+                for aChild in aSpan.Children:
+                    aChild.ParentId = aSpan.Id
+            theSpan.ParentId = aParent.Id if aParent is not None else 0
+            (aParent.Children if aParent is not None else self.myRoots).append(theSpan)
+
+    def ToDict(self):
+        anOriginNs = min((i.StartNs for i in self.myRoots), default=0)
+        return {
+            "version": 1,
+            "pid": os.getpid(),
+            "stages": [i.ToDict(anOriginNs) for i in self.myRoots],
+        }
+
+    def WriteJSON(self, thePath: str):
+        with open(thePath, "w", encoding="utf-8") as f:
+            json.dump(self.ToDict(), f, indent=4)
+
+    # OTLP/JSON trace, as accepted by OpenTelemetry collectors; span ids are
+    # derived from the stage ids, the trace id is random
+    def WriteTrace(self, thePath: str, theServiceName: str = "MTKConverter"):
+        aTraceId = os.urandom(16).hex()
+        aSpans = []
+        for aRoot in self.myRoots:
+            for aSpan in aRoot.Walk():
+                anAttributes = [_OtlpAttribute("mtk.cpu_seconds", aSpan.Cpu),
+                                _OtlpAttribute("mtk.peak_rss_bytes", aSpan.PeakRss)]
+                anAttributes.extend(_OtlpAttribute(k, v) for k, v in aSpan.Attributes.items())
+                anOtlpSpan = {
+                    "traceId": aTraceId,
+                    "spanId": f"{aSpan.Id:016x}",
+                    "name": aSpan.Name,
+                    "kind": 1,
+                    "startTimeUnixNano": str(aSpan.StartNs),
+                    "endTimeUnixNano": str(aSpan.EndNs()),
+                    "attributes": anAttributes,
+                }
+                if aSpan.ParentId:
+                    anOtlpSpan["parentSpanId"] = f"{aSpan.ParentId:016x}"
+                aSpans.append(anOtlpSpan)
+
+        aTrace = {"resourceSpans": [{
+            "resource": {"attributes": [_OtlpAttribute("service.name", theServiceName)]},
+            "scopeSpans": [{"scope": {"name": theServiceName}, "spans": aSpans}],
+        }]}
+        with open(thePath, "w", encoding="utf-8") as f:
+            json.dump(aTrace, f)
+
+    def _Open(self, theName: str, theAttributes: dict, theParent: MTKConverter_Span):
+        aSpan = MTKConverter_Span(theName, theAttributes)
+        aStack = self.__Stack()
+        aParent = theParent if theParent is not None else (aStack[-1] if aStack else None)
+        with self.__myLock:
+            aSpan.Id = next(self.__myIds)
+            if aParent is not None:
+                aSpan.ParentId = aParent.Id
+                aParent.Children.append(aSpan)
+            else:
+                self.myRoots.append(aSpan)
+            self.__myOpenSpans.add(aSpan)
+        aStack.append(aSpan)
+        return aSpan
+
+    def _Close(self, theSpan: MTKConverter_Span):
+        theSpan.Close()
+        with self.__myLock:
+            self.__myOpenSpans.discard(theSpan)
+        aStack = self.__Stack()
+        if aStack and aStack[-1] is theSpan:
+            aStack.pop()
+
+    def _StartSampling(self):
+        self.__myStopEvent.clear()
+        self.__mySampler = threading.Thread(target=self.__Sample, daemon=True)
+        self.__mySampler.start()
+
+    def _StopSampling(self):
+        self.__myStopEvent.set()
+        self.__mySampler.join()
+
+    def __Sample(self):
+        while not self.__myStopEvent.wait(self.mySampleInterval):
+            aRss = memory.CurrentRss()
+            with self.__myLock:
+                for aSpan in self.__myOpenSpans:
+                    if aSpan.PeakRss < aRss:
+                        aSpan.PeakRss = aRss
+
+    def __Stack(self):
+        aStack = getattr(self.__myLocal, "myStack", None)
+        if aStack is None:
+            aStack = []
+            self.__myLocal.myStack = aStack
+        return aStack
+
+class _StageContext:
+    def __init__(self, theTracer: MTKConverter_Tracer, theName: str, theAttributes: dict,
+                 theParent: MTKConverter_Span):
+        self.myTracer = theTracer
+        self.myName = theName
+        self.myAttributes = theAttributes
+        self.myParent = theParent
+        self.mySpan = None
+
+    def __enter__(self):
+        if self.myTracer is not None:
+            self.mySpan = self.myTracer._Open(self.myName, self.myAttributes, self.myParent)
+        return self.mySpan
+
+    def __exit__(self, theType, theValue, theTraceback):
+        if self.mySpan is not None:
+            if theType is not None:
+                self.mySpan.Attributes["error"] = theType.__name__
+            self.myTracer._Close(self.mySpan)
+        return False
+
+class _ActivationContext:
+    def __init__(self, theTracer: MTKConverter_Tracer):
+        self.myTracer = theTracer
+        self.myPrevTracer = None
+
+    def __enter__(self):
+        global _ActiveTracer
+        self.myPrevTracer = _ActiveTracer
+        _ActiveTracer = self.myTracer
+        self.myTracer._StartSampling()
+        return self.myTracer
+
+    def __exit__(self, theType, theValue, theTraceback):
+        global _ActiveTracer
+        self.myTracer._StopSampling()
+        _ActiveTracer = self.myPrevTracer
+        return False
+
+_ActiveTracer = None
+
+def Stage(theName: str, theAttributes: dict = None, theParent: MTKConverter_Span = None):
+    """Opens a stage of the active tracer; the context value is None if there is no tracer."""
+    return _StageContext(_ActiveTracer, theName, theAttributes, theParent)
+
+def Current():
+    return _ActiveTracer.Current() if _ActiveTracer is not None else None
+
+def Attach(theSpan: MTKConverter_Span):
+    """Adds a stage recorded by another tracer under the current stage of the active tracer."""
+    if _ActiveTracer is not None and theSpan is not None:
+        _ActiveTracer.Attach(theSpan)
+
+def _OtlpAttribute(theKey: str, theValue):
+    if type(theValue) is bool:
+        aValue = {"boolValue": theValue}
+    elif type(theValue) is int:
+        aValue = {"intValue": str(theValue)}
+    elif type(theValue) is float:
+        aValue = {"doubleValue": theValue}
+    else:
+        aValue = {"stringValue": str(theValue)}
+    return {"key": theKey, "value": aValue}
@@ -0,0 +1,157 @@
+# MTKConverter_WallThicknessCache.py
+#
+# Wall thickness results kept on disk between runs. Every result of a solid
+# has a JSON file named after the solid's geometry hash (see
+# shape_key.GeometryHash) and the resolution of the result. A request is
+# answered by the finest result at the resolution asked for or above, so a
+# part analyzed again, or analyzed in a changed model whose solid stayed the
+# same, costs a lookup. Solids the analyzer finds no thickness in are kept as
+# empty results. Results of another toolkit version are ignored and replaced.
+#
+# A result is only ever written to its own file, replaced as a whole, so
+# processes sharing the cache never lose each other's results and read either
+# the old or the new result at a resolution.
+
+import glob
+import importlib.metadata
+import json
+import os
+import uuid
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+# Version of the cache files
+FORMAT_VERSION = 3
+
+class MTKConverter_WallThicknessResult:
+    __slots__ = ("Resolution", "MinThickness", "MaxThickness", "MinPoints", "MaxPoints")
+
+    # theMinPoints and theMaxPoints are pairs of (x, y, z) tuples; a result
+    # without thickness, see Empty(), has neither
+    def __init__(self, theResolution: int, theMinThickness: float, theMaxThickness: float, theMinPoints,
+                 theMaxPoints):
+        self.Resolution = theResolution
+        self.MinThickness = theMinThickness
+        self.MaxThickness = theMaxThickness
+        self.MinPoints = theMinPoints
+        self.MaxPoints = theMaxPoints
+
+    # Kept so that a solid the analyzer finds no thickness in isn't analyzed
+    # again
+    @staticmethod
+    def Empty(theResolution: int):
+        return MTKConverter_WallThicknessResult(theResolution, None, None, (), ())
+
+    def IsEmpty(self):
+        return self.MinThickness is None
+
+    # None if the analyzer found no thickness
+    @staticmethod
+    def FromData(theData: mtk.WallThickness_Data, theResolution: int):
+        if theData.IsEmpty():
+            return None
+        aMinPoints = (mtk.Geom_Point(), mtk.Geom_Point())
+        aMaxPoints = (mtk.Geom_Point(), mtk.Geom_Point())
+        theData.PointsOfMinThickness(*aMinPoints)
+        theData.PointsOfMaxThickness(*aMaxPoints)
+        return MTKConverter_WallThicknessResult(theResolution, theData.MinThickness(), theData.MaxThickness(),
+                                                tuple((i.X(), i.Y(), i.Z()) for i in aMinPoints),
+                                                tuple((i.X(), i.Y(), i.Z()) for i in aMaxPoints))
+
+    def ToDict(self):
+        if self.IsEmpty():
+            return {"resolution": self.Resolution, "empty": True}
+        return {
+            "resolution": self.Resolution,
+            "minThickness": self.MinThickness,
+            "maxThickness": self.MaxThickness,
+            "minPoints": [list(i) for i in self.MinPoints],
+            "maxPoints": [list(i) for i in self.MaxPoints],
+        }
+
+    @staticmethod
+    def FromDict(theDict: dict):
+        if theDict.get("empty"):
+            return MTKConverter_WallThicknessResult.Empty(int(theDict["resolution"]))
+        return MTKConverter_WallThicknessResult(int(theDict["resolution"]), float(theDict["minThickness"]),
+                                                float(theDict["maxThickness"]),
+                                                tuple(tuple(float(k) for k in i) for i in theDict["minPoints"]),
+                                                tuple(tuple(float(k) for k in i) for i in theDict["maxPoints"]))
+
+class MTKConverter_WallThicknessCache:
+    def __init__(self, theRoot: str):
+        self.myRoot = theRoot
+        self.myHits = 0
+        self.myMisses = 0
+        self.__myToolkitVersion = MTKConverter_WallThicknessCache.__ToolkitVersion()
+        os.makedirs(theRoot, exist_ok=True)
+
+    # The finest result of the solid with theKey at theResolution or above
+    def Find(self, theKey: str, theResolution: int):
+        aResolutions = [i for i in self.__Resolutions(theKey) if i >= theResolution]
+        for aResolution in sorted(aResolutions, reverse=True):
+            aResult = self.__Load(theKey, aResolution)
+            if aResult is not None:
+                self.myHits += 1
+                return aResult
+        self.myMisses += 1
+        return None
+
+    def Store(self, theKey: str, theResult: MTKConverter_WallThicknessResult):
+        aContent = {
+            "version": FORMAT_VERSION,
+            "toolkit": self.__myToolkitVersion,
+            "result": theResult.ToDict(),
+        }
+
+        aPath = self.__Path(theKey, theResult.Resolution)
+        aTempPath = aPath + "." + uuid.uuid4().hex + ".tmp"
+        try:
+            with open(aTempPath, "w", encoding="utf-8") as f:
+                json.dump(aContent, f)
+            os.replace(aTempPath, aPath)
+        except OSError as anE:
+            print(f"[WARNING] Failed to cache wall thickness results: {anE}")
+            if os.path.exists(aTempPath):
+                os.remove(aTempPath)
+
+    def __Path(self, theKey: str, theResolution: int):
+        return os.path.join(self.myRoot, f"{theKey}.{theResolution}.json")
+
+    # Resolutions of the results kept for the solid with theKey
+    def __Resolutions(self, theKey: str):
+        aResolutions = []
+        for aPath in glob.glob(os.path.join(glob.escape(self.myRoot), glob.escape(theKey) + ".*.json")):
+            aResolution = os.path.basename(aPath)[len(theKey) + 1:-len(".json")]
+            if aResolution.isdigit():
+                aResolutions.append(int(aResolution))
+        return aResolutions
+
+    # None if there is no usable result at theResolution
+    def __Load(self, theKey: str, theResolution: int):
+        try:
+            with open(self.__Path(theKey, theResolution), "r", encoding="utf-8") as f:
+                aContent = json.load(f)
+            if (aContent.get("version") != FORMAT_VERSION or not self.__myToolkitVersion
+                or aContent.get("toolkit") != self.__myToolkitVersion):
+                return None
+            return MTKConverter_WallThicknessResult.FromDict(aContent["result"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as anE:
+            print(f"[WARNING] Ignoring unreadable wall thickness cache entry {theKey}: {anE}")
+            return None
+
+    # As MTKConverter_Pipeline.ToolkitVersion(), which can't be imported here
+    @staticmethod
+    def __ToolkitVersion():
+        try:
+            return importlib.metadata.version("manufacturingtoolkit")
+        except importlib.metadata.PackageNotFoundError:
+            pass
+        if hasattr(mtk, "__version__"):
+            return mtk.__version__
+        try:
+            return f"unknown-{os.path.getmtime(mtk.__file__):.0f}"
+        except (AttributeError, OSError):
+            return ""
@@ -27,11 +27,22 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import math
+import time
+
 from sys import float_info
 
 import manufacturingtoolkit.CadExMTK as mtk
 
+import MTKConverter_Memory as memory
 import MTKConverter_PartProcessor as part_proc
+import MTKConverter_Timings as timings
+
+from MTKConverter_WallThicknessCache import MTKConverter_WallThicknessCache, MTKConverter_WallThicknessResult
+
+import measurements
+
+from shape_key import GeometryHash
 
 class PointPair:
     def __init__(self, theFirst: mtk.Geom_Point, theSecond: mtk.Geom_Point):
@@ -46,30 +57,194 @@ class MTKConverter_WallThicknessData(part_proc.MTKConverter_ProcessData):
         self.myMaxThickness = -float_info.max
         self.myMinThicknessPoints = PointPair(mtk.Geom_Point(), mtk.Geom_Point())
         self.myMaxThicknessPoints = PointPair(mtk.Geom_Point(), mtk.Geom_Point())
+        # Resolution the thickness was computed at
+        self.myResolution = 0
+
+# Settings of the adaptive analysis. A solid is analyzed at myCoarseResolution
+# first, and at twice the resolution of the previous run while it needs to be:
+# until its min and max thickness change by less than myTolerance (relative)
+# from one run to the next, unless they are clear of the thresholds. The next
+# run is skipped if its time or peak RSS, extrapolated from the previous runs,
+# would exceed the budgets of the solid (seconds, bytes).
+class MTKConverter_WallThicknessRefinement:
+    def __init__(self):
+        self.myCoarseResolution = 200
+        self.myMaxResolution = 1600
+        self.myTolerance = 0.01
+        # DFM limits in mm; a thickness is clear of its limit when it is
+        # further from it than myThresholdMargin (relative) and than the change
+        # of the last refinement. Without limits every solid is refined.
+        self.myMinThreshold = None
+        self.myMaxThreshold = None
+        self.myThresholdMargin = 0.2
+        self.myTimeBudget = None
+        self.myMemoryBudget = None
+
+# theResult is None if the analyzer found no thickness. Steps answered from
+# the cache have no cost.
+class MTKConverter_WallThicknessStep:
+    def __init__(self, theResult: MTKConverter_WallThicknessResult, theWall: float = 0.0, theStartRss: int = 0,
+                 thePeakRss: int = 0):
+        self.Result = theResult
+        self.Wall = theWall
+        self.StartRss = theStartRss
+        self.PeakRss = thePeakRss
+
+class MTKConverter_WallThicknessAnalyzer:
+    # With theCache, results are looked up by the geometry hash of the solid
+    # before it is analyzed and stored after
+    def __init__(self, theCache: MTKConverter_WallThicknessCache = None):
+        self.myAnalyzer = mtk.WallThickness_Analyzer()
+        self.myCache = theCache
+
+    # theKey is the geometry hash of theSolid if there is a cache
+    def Step(self, theSolid: mtk.ModelData_Solid, theResolution: int, theKey: str = None):
+        if self.myCache is not None:
+            aResult = self.myCache.Find(theKey, theResolution)
+            if aResult is not None:
+                aSpan = timings.Current()
+                if aSpan is not None:
+                    aSpan.Attributes["cachedResolution"] = aResult.Resolution
+                return MTKConverter_WallThicknessStep(None if aResult.IsEmpty() else aResult)
+
+        with timings.Stage("wallThickness:step", {"resolution": theResolution}):
+            with memory.MTKConverter_PeakRssSampler() as aSampler:
+                aStartRss = aSampler.myPeak
+                aStartTime = time.perf_counter()
+                aData = self.myAnalyzer.Perform(theSolid, theResolution)
+                aWall = time.perf_counter() - aStartTime
+        aResult = MTKConverter_WallThicknessResult.FromData(aData, theResolution)
+        if self.myCache is not None:
+            if aResult is None:
+                self.myCache.Store(theKey, MTKConverter_WallThicknessResult.Empty(theResolution))
+            else:
+                self.myCache.Store(theKey, aResult)
+        return MTKConverter_WallThicknessStep(aResult, aWall, aStartRss, aSampler.myPeak)
+
+class MTKConverter_AdaptiveWallThicknessAnalyzer:
+    def __init__(self, theRefinement: MTKConverter_WallThicknessRefinement,
+                 theAnalyzer: MTKConverter_WallThicknessAnalyzer):
+        self.myRefinement = theRefinement
+        self.myAnalyzer = theAnalyzer
+
+    # Returns the runs made for theSolid, the last one at the finest
+    # resolution, and the reason the refinement stopped
+    def Perform(self, theSolid: mtk.ModelData_Solid, theKey: str = None):
+        aSteps = []
+        aResolution = self.myRefinement.myCoarseResolution
+        while True:
+            aSteps.append(self.myAnalyzer.Step(theSolid, aResolution, theKey))
+            aReason = self.__StopReason(aSteps)
+            if aReason is not None:
+                return aSteps, aReason
+            aResolution = min(aSteps[-1].Result.Resolution * 2, self.myRefinement.myMaxResolution)
+
+    def __StopReason(self, theSteps):
+        aLast = theSteps[-1].Result
+        if aLast is None:
+            return "empty"
+
+        aPrevious = theSteps[-2].Result if len(theSteps) > 1 else None
+        if aPrevious is not None:
+            aMinChange = abs(aLast.MinThickness - aPrevious.MinThickness)
+            aMaxChange = abs(aLast.MaxThickness - aPrevious.MaxThickness)
+            if (aMinChange <= self.myRefinement.myTolerance * aLast.MinThickness
+                and aMaxChange <= self.myRefinement.myTolerance * aLast.MaxThickness):
+                return "converged"
+        else:
+            aMinChange = aMaxChange = 0.0
+
+        if (self.myRefinement.myMinThreshold is not None or self.myRefinement.myMaxThreshold is not None) and not (
+                self.__IsNear(aLast.MinThickness, self.myRefinement.myMinThreshold, aMinChange)
+                or self.__IsNear(aLast.MaxThickness, self.myRefinement.myMaxThreshold, aMaxChange)):
+            return "clear"
+
+        aNextResolution = min(aLast.Resolution * 2, self.myRefinement.myMaxResolution)
+        if aNextResolution <= aLast.Resolution:
+            return "maxResolution"
+
+        aGrowth = MTKConverter_AdaptiveWallThicknessAnalyzer.__Growth(theSteps, aNextResolution)
+        aLastStep = theSteps[-1]
+        if self.myRefinement.myTimeBudget is not None:
+            aSpent = sum(i.Wall for i in theSteps)
+            if aSpent + aLastStep.Wall * aGrowth(lambda theStep: theStep.Wall) > self.myRefinement.myTimeBudget:
+                return "timeBudget"
+        if self.myRefinement.myMemoryBudget is not None and aLastStep.PeakRss > 0:
+            anIncrease = aLastStep.PeakRss - aLastStep.StartRss
+            aPeak = memory.CurrentRss() + anIncrease * aGrowth(lambda theStep: theStep.PeakRss - theStep.StartRss)
+            if aPeak > self.myRefinement.myMemoryBudget:
+                return "memoryBudget"
+        return None
+
+    def __IsNear(self, theThickness: float, theThreshold: float, theChange: float):
+        if theThreshold is None:
+            return False
+        return abs(theThickness - theThreshold) <= max(self.myRefinement.myThresholdMargin * theThreshold, theChange)
+
+    # Factor by which a cost of the last step grows at theNextResolution: a
+    # power of the resolution ratio, fitted to the last two steps if they
+    # tell, quadratic otherwise
+    @staticmethod
+    def __Growth(theSteps, theNextResolution: int):
+        aLast = theSteps[-1]
+        aRatio = theNextResolution / aLast.Result.Resolution
+
+        def Growth(theCost):
+            anExponent = 2.0
+            if len(theSteps) > 1:
+                aPrevious = theSteps[-2]
+                if (theCost(aPrevious) > 0 and theCost(aLast) > 0
+                    and aLast.Result.Resolution > aPrevious.Result.Resolution):
+                    anExponent = (math.log(theCost(aLast) / theCost(aPrevious))
+                                  / math.log(aLast.Result.Resolution / aPrevious.Result.Resolution))
+                    anExponent = min(max(anExponent, 1.0), 3.0)
+            return aRatio ** anExponent
+        return Growth
 
 class MTKConverter_WallThicknessProcessor(part_proc.MTKConverter_VoidPartProcessor):
-    def __init__(self, theResolution: int):
+    # With theRefinement the solids are analyzed adaptively and theResolution
+    # isn't used. With theCacheFolder results are reused from and kept in a
+    # MTKConverter_WallThicknessCache there; the geometry hashes of the solids
+    # use the volume and area of theMeasurements, shared with the report.
+    def __init__(self, theResolution: int, theRefinement: MTKConverter_WallThicknessRefinement = None,
+                 theCacheFolder: str = None, theMeasurements: measurements.MeasurementsService = None):
         super().__init__()
-        self.myAnalyzer = mtk.WallThickness_Analyzer()
+        self.myMeasurements = theMeasurements if theMeasurements is not None else measurements.MeasurementsService()
+        aCache = MTKConverter_WallThicknessCache(theCacheFolder) if theCacheFolder else None
+        self.myAnalyzer = MTKConverter_WallThicknessAnalyzer(aCache)
         self.myResolution = theResolution
+        self.myAdaptiveAnalyzer = None
+        if theRefinement is not None:
+            self.myAdaptiveAnalyzer = MTKConverter_AdaptiveWallThicknessAnalyzer(theRefinement, self.myAnalyzer)
 
-    def __UpdateProcessData(self, theData: mtk.WallThickness_Data, thePart: mtk.ModelData_Part):
+    def __UpdateProcessData(self, theResult: MTKConverter_WallThicknessResult, thePart: mtk.ModelData_Part):
         aWTData = MTKConverter_WallThicknessData(thePart)
         self.myData.append(aWTData)
 
-        if theData.IsEmpty():
+        if theResult is None:
             return
 
         aWTData.myIsInit = True
-        if aWTData.myMinThickness > theData.MinThickness():
-            aWTData.myMinThickness = theData.MinThickness()
-            theData.PointsOfMinThickness(aWTData.myMinThicknessPoints.First, aWTData.myMinThicknessPoints.Second)
-
-        if aWTData.myMaxThickness < theData.MaxThickness():
-            aWTData.myMaxThickness = theData.MaxThickness()
-            theData.PointsOfMaxThickness(aWTData.myMaxThicknessPoints.First, aWTData.myMaxThicknessPoints.Second)
+        aWTData.myResolution = theResult.Resolution
+        aWTData.myMinThickness = theResult.MinThickness
+        aWTData.myMinThicknessPoints = PointPair(*(mtk.Geom_Point(*i) for i in theResult.MinPoints))
+        aWTData.myMaxThickness = theResult.MaxThickness
+        aWTData.myMaxThicknessPoints = PointPair(*(mtk.Geom_Point(*i) for i in theResult.MaxPoints))
 
     def ProcessSolid(self, thePart: mtk.ModelData_Part, theSolid: mtk.ModelData_Solid):
-        aWTData = self.myAnalyzer.Perform(theSolid, self.myResolution)
-        self.__UpdateProcessData(aWTData, thePart)
+        aKey = None
+        if self.myAnalyzer.myCache is not None:
+            aMeasurements = self.myMeasurements.Solid(theSolid)
+            aKey = GeometryHash(theSolid, aMeasurements.Volume, aMeasurements.SurfaceArea)
+        if self.myAdaptiveAnalyzer is None:
+            with timings.Stage("wallThickness", {"resolution": self.myResolution}):
+                aStep = self.myAnalyzer.Step(theSolid, self.myResolution, aKey)
+            self.__UpdateProcessData(aStep.Result, thePart)
+            return
 
+        with timings.Stage("wallThickness", {"adaptive": True}) as aSpan:
+            aSteps, aReason = self.myAdaptiveAnalyzer.Perform(theSolid, aKey)
+            if aSpan is not None:
+                aSpan.Attributes["resolution"] = aSteps[-1].Result.Resolution if aSteps[-1].Result else 0
+                aSpan.Attributes["stopReason"] = aReason
+        self.__UpdateProcessData(aSteps[-1].Result, thePart)
@@ -0,0 +1,135 @@
+# MTKConverter_Worker.py
+#
+# Long-lived analysis worker. The toolkit is imported and the license is
+# activated once at startup, then jobs are read from stdin as JSON lines:
+#
+#   {"id": "...", "source": "...", "target": "...", "process": "machining_milling", "screenshot": true,
+#    "reportVersion": 1, "cbor": false, "concurrentDfm": false, "wallThicknessCache": "..."}
+#
+# and for each job a single JSON line is written back:
+#
+#   {"id": "...", "rc": 0, "output": "...", "elapsed": 1.23, "timings": {"import": 0.4, ...},
+#    "rss": 123456789, "retire": false}
+#
+# The worker exits after replying with "retire": true, either when it has served
+# its job quota or when its resident memory is above the high-water mark, so
+# the owner can start a fresh one.
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import traceback
+
+from pathlib import Path
+
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../"))
+
+import MTKConverter_Memory as memory
+import MTKConverter_Pipeline as pipeline
+
+def PrintUsage():
+    print ("Usage:")
+    print ("MTKConverter_Worker [--max-jobs <count>] [--max-rss-mb <size>]\n")
+    print ("Arguments:")
+    print ("  <count> - number of jobs after which the worker exits, 0 for no limit (default: 0)")
+    print ("  <size> - resident memory in MB above which the worker exits, 0 for no limit (default: 0)")
+
+def _OpenProtocolStream():
+    # Replies go to a private copy of the original stdout, and fd 1 is pointed at
+    # stderr, so that anything printed by native code can't corrupt the protocol
+    aProtocolFd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    return os.fdopen(aProtocolFd, "w", encoding="utf-8", buffering=1)
+
+def _Reply(theStream, theMessage: dict):
+    theStream.write(json.dumps(theMessage) + "\n")
+    theStream.flush()
+
+def _RunJob(theJob: dict):
+    aScreenshotFlag = "" if theJob.get("screenshot", True) else "--no-screenshot"
+    aBuffer = io.StringIO()
+    aTimings = {}
+    aStartTime = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(aBuffer):
+            aRes = pipeline.Analyze(theJob["source"], theJob["target"],
+                                    theJob.get("process", "machining_milling"), aScreenshotFlag, aTimings,
+                                    theReportVersion=theJob.get("reportVersion", 1),
+                                    theToWriteCBOR=theJob.get("cbor", False),
+                                    theToAnalyzeConcurrently=theJob.get("concurrentDfm", False),
+                                    theWallThicknessCache=theJob.get("wallThicknessCache"))
+    except Exception:
+        aBuffer.write(traceback.format_exc())
+        aRes = None
+
+    return {
+        "id": theJob.get("id"),
+        "rc": aRes,
+        "output": aBuffer.getvalue(),
+        "elapsed": time.perf_counter() - aStartTime,
+        "timings": aTimings,
+    }
+
+def main(theMaxJobs: int = 0, theMaxRssMb: int = 0):
+    aProtocol = _OpenProtocolStream()
+
+    # Activate up front so that the first job doesn't pay for it
+    aBuffer = io.StringIO()
+    with contextlib.redirect_stdout(aBuffer):
+        isActivated = pipeline.ActivateLicense()
+    if not isActivated:
+        _Reply(aProtocol, {"ready": False, "error": aBuffer.getvalue().strip()})
+        return 1
+    _Reply(aProtocol, {"ready": True, "pid": os.getpid()})
+
+    aJobCount = 0
+    for aLine in sys.stdin:
+        aLine = aLine.strip()
+        if not aLine:
+            continue
+
+        try:
+            aJob = json.loads(aLine)
+        except ValueError as e:
+            _Reply(aProtocol, {"id": None, "rc": None, "output": f"Invalid job: {e}", "retire": False})
+            continue
+
+        aReply = _RunJob(aJob)
+        aJobCount += 1
+
+        aRss = memory.CurrentRss()
+        aReply["rss"] = aRss
+        aReply["retire"] = ((theMaxJobs > 0 and aJobCount >= theMaxJobs)
+                            or (theMaxRssMb > 0 and aRss > theMaxRssMb * 1024 * 1024))
+        _Reply(aProtocol, aReply)
+
+        if aReply["retire"]:
+            break
+
+    return 0
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("-?", "/?", "-h", "--help"):
+        PrintUsage()
+        sys.exit()
+
+    aMaxJobs = 0
+    aMaxRssMb = 0
+    anArgs = sys.argv[1:]
+    try:
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "--max-jobs":
+                aMaxJobs = int(anArgs.pop(0))
+            elif anOption == "--max-rss-mb":
+                aMaxRssMb = int(anArgs.pop(0))
+            else:
+                raise ValueError(anOption)
+    except (IndexError, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(1)
+
+    sys.exit(main(aMaxJobs, aMaxRssMb))
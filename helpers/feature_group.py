@@ -125,26 +125,20 @@ class FeatureGroupManager:
         print("          ", theName, ": ", theValue, " ", theUnits, sep = "")
 
     class OrderedFeatureList:
+        # Features are collected as they come and sorted once, on first access.
+        # The sort is stable and equal features end up next to each other, so
+        # merging neighbours gives the same list and counts as inserting every
+        # feature at its place.
         def __init__(self):
             self.__myList = []
+            self.__myIsSorted = True
 
         def Append(self, theFeature: mtk.MTKBase_Feature):
-            anInsertIndex = 0
-            for i in self.__myList:
-                aRes = CompareFeatures(theFeature, i.Feature)
-                if aRes == 0:
-                    i.Count += 1
-                    anInsertIndex = -1
-                    break
-                elif aRes < 0:
-                    break
-
-                anInsertIndex += 1
-
-            if anInsertIndex >= 0:
-                self.__myList.insert(anInsertIndex, self.FeatureAndCountPair(theFeature))
+            self.__myList.append(self.FeatureAndCountPair(theFeature))
+            self.__myIsSorted = False
 
         def Size(self):
+            self.__Sort()
             return len(self.__myList)
 
         def GetFeature(self, theIndex: int):
@@ -154,8 +148,37 @@ class FeatureGroupManager:
             return self.__GetFeatureAndCountPair(theIndex).Count
 
         def __GetFeatureAndCountPair(self, theIndex: int):
+            self.__Sort()
             return self.__myList[theIndex]
 
+        def __Sort(self):
+            if self.__myIsSorted:
+                return
+
+            aComparator = mtk.MTKBase_FeatureComparator()
+            aSortKey = FeatureGroupManager.OrderedFeatureList.SortKey
+            self.__myList.sort(key=lambda thePair: aSortKey(thePair.Feature, aComparator))
+
+            aMergedList = []
+            for i in self.__myList:
+                # Sorted, so i is equal to the previous entry unless it's greater
+                if aMergedList and not aComparator(aMergedList[-1].Feature, i.Feature):
+                    aMergedList[-1].Count += i.Count
+                else:
+                    aMergedList.append(i)
+
+            self.__myList = aMergedList
+            self.__myIsSorted = True
+
+        class SortKey:
+            # list.sort() only asks "less than", one comparator call per comparison
+            def __init__(self, theFeature: mtk.MTKBase_Feature, theComparator: mtk.MTKBase_FeatureComparator):
+                self.Feature = theFeature
+                self.Comparator = theComparator
+
+            def __lt__(self, theOther):
+                return self.Comparator(self.Feature, theOther.Feature)
+
         class FeatureAndCountPair:
             def __init__(self, theFeature: mtk.MTKBase_Feature):
                 self.Feature = theFeature
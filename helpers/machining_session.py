@@ -0,0 +1,97 @@
+# machining_session.py
+#
+# Machining analysis of one solid. Features are recognized on first use and
+# every result is kept, so the DFM analyzers share the same Machining_Data
+# and any combination of features and issues runs the recognizer once.
+# Measurements are taken by measurements.MeasurementsService.
+#
+# With theToAnalyzeConcurrently the DFM analyzers run on threads of their own
+# after the recognition. It only pays off if the toolkit releases the GIL in
+# its native calls; the issues are merged in the same order either way.
+
+from concurrent.futures import ThreadPoolExecutor
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+class MachiningSession:
+    def __init__(self, theSolid: mtk.ModelData_Solid, theOperation, theToAnalyzeConcurrently: bool = False):
+        self.mySolid = theSolid
+        self.myOperation = theOperation
+        self.myToAnalyzeConcurrently = theToAnalyzeConcurrently
+        self.__myData = None
+        self.__myFeatures = None
+        self.__myDrillingIssues = None
+        self.__myMillingIssues = None
+        self.__myTurningIssues = None
+        self.__myIssues = None
+
+    def Data(self):
+        if self.__myData is None:
+            aParams = mtk.Machining_FeatureRecognizerParameters()
+            aParams.SetOperation(self.myOperation)
+            aFeatureRecognizer = mtk.Machining_FeatureRecognizer(aParams)
+            anAnalyzer = mtk.Machining_Analyzer()
+            anAnalyzer.AddTool(aFeatureRecognizer)
+            self.__myData = anAnalyzer.Perform(self.mySolid)
+        return self.__myData
+
+    def IsEmpty(self):
+        return self.Data().IsEmpty()
+
+    def Features(self):
+        if self.__myFeatures is None:
+            self.__myFeatures = self.Data().FeatureList()
+        return self.__myFeatures
+
+    def DrillingIssues(self):
+        if self.__myDrillingIssues is None:
+            self.__myDrillingIssues = self.__Analyze(mtk.DFMMachining_DrillingAnalyzerParameters())
+        return self.__myDrillingIssues
+
+    # Only deep pocket issues are relevant for lathe+milling
+    def MillingIssues(self):
+        if self.__myMillingIssues is None:
+            anIssueList = self.__Analyze(mtk.DFMMachining_MillingAnalyzerParameters())
+            if self.myOperation == mtk.Machining_OT_LatheMilling:
+                aFilteredList = mtk.MTKBase_FeatureList()
+                for anIssue in anIssueList:
+                    if mtk.DFMMachining_DeepPocketIssue.CompareType(anIssue):
+                        aFilteredList.Append(anIssue)
+                anIssueList = aFilteredList
+            self.__myMillingIssues = anIssueList
+        return self.__myMillingIssues
+
+    # Empty unless the operation is lathe+milling
+    def TurningIssues(self):
+        if self.__myTurningIssues is None:
+            if self.myOperation == mtk.Machining_OT_LatheMilling:
+                self.__myTurningIssues = self.__Analyze(mtk.DFMMachining_TurningAnalyzerParameters())
+            else:
+                self.__myTurningIssues = mtk.MTKBase_FeatureList()
+        return self.__myTurningIssues
+
+    # Drilling, milling and turning issues in this order
+    def Issues(self):
+        if self.__myIssues is None:
+            if self.myToAnalyzeConcurrently:
+                self.__AnalyzeConcurrently()
+            anIssueList = mtk.MTKBase_FeatureList()
+            for aList in (self.DrillingIssues(), self.MillingIssues(), self.TurningIssues()):
+                for anIssue in aList:
+                    anIssueList.Append(anIssue)
+            self.__myIssues = anIssueList
+        return self.__myIssues
+
+    # Every analyzer fills its own result, the recognized data is only read
+    def __AnalyzeConcurrently(self):
+        self.Data()
+        aGetters = [self.DrillingIssues, self.MillingIssues]
+        if self.myOperation == mtk.Machining_OT_LatheMilling:
+            aGetters.append(self.TurningIssues)
+        with ThreadPoolExecutor(len(aGetters)) as anExecutor:
+            for aFuture in [anExecutor.submit(i) for i in aGetters]:
+                aFuture.result()
+
+    def __Analyze(self, theParameters):
+        anAnalyzer = mtk.DFMMachining_Analyzer(theParameters)
+        return anAnalyzer.Perform(self.mySolid, self.Data())
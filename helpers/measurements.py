@@ -0,0 +1,86 @@
+# measurements.py
+#
+# Whole-part measurements: volume, surface area and centroid. Every solid of
+# a part is measured in one pass over its bodies and the results are kept by
+# shape, so a solid asked for by several processes or consumers is measured
+# once. A measurement the toolkit fails to compute is left as None and the
+# part totals are made of the solids that have it.
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+from shape_key import UnorientedShapeKey
+
+class Measurements:
+    __slots__ = ("SolidCount", "Volume", "SurfaceArea", "Centroid")
+
+    def __init__(self):
+        self.SolidCount = 0
+        self.Volume = None
+        self.SurfaceArea = None
+        self.Centroid = None
+
+class MeasurementsService:
+    def __init__(self):
+        self.__mySolids = {}
+
+    # Solids are shapes of this process, so a service passed to another one
+    # arrives empty
+    def __reduce__(self):
+        return MeasurementsService, ()
+
+    def Solid(self, theSolid: mtk.ModelData_Solid):
+        aKey = UnorientedShapeKey(theSolid)
+        aMeasurements = self.__mySolids.get(aKey)
+        if aMeasurements is None:
+            aMeasurements = MeasurementsService.__Measure(theSolid)
+            self.__mySolids[aKey] = aMeasurements
+        return aMeasurements
+
+    def Part(self, thePart: mtk.ModelData_Part):
+        aSolids = []
+        for aBody in thePart.Bodies():
+            for aShape in mtk.ModelData_ShapeIterator(aBody, mtk.ShapeType_Solid):
+                aSolids.append(self.Solid(mtk.ModelData_Solid.Cast(aShape)))
+        return Combine(aSolids)
+
+    # Only failures of the toolkit itself, which the bindings raise as
+    # RuntimeError, are caught; a misused API isn't hidden
+    @staticmethod
+    def __Measure(theSolid: mtk.ModelData_Solid):
+        aMeasurements = Measurements()
+        aMeasurements.SolidCount = 1
+        try:
+            aMeasurements.Volume = mtk.Measurements_Volume.Compute(theSolid)
+        except RuntimeError as anE:
+            print(f"[WARNING] Volume computation failed: {anE}")
+        try:
+            aMeasurements.SurfaceArea = mtk.Measurements_SurfaceArea.Compute(theSolid)
+        except RuntimeError as anE:
+            print(f"[WARNING] Surface area computation failed: {anE}")
+        try:
+            aCentroid = mtk.Measurements_ValidationProperties.ComputeCentroid(theSolid)
+            aMeasurements.Centroid = (aCentroid.X(), aCentroid.Y(), aCentroid.Z())
+        except RuntimeError as anE:
+            print(f"[WARNING] Centroid computation failed: {anE}")
+        return aMeasurements
+
+def Combine(theSolids):
+    """Returns the Measurements of a part made of theSolids."""
+    aRes = Measurements()
+    aRes.SolidCount = len(theSolids)
+
+    aVolumes = [i.Volume for i in theSolids if i.Volume is not None]
+    if aVolumes:
+        aRes.Volume = sum(aVolumes)
+
+    anAreas = [i.SurfaceArea for i in theSolids if i.SurfaceArea is not None]
+    if anAreas:
+        aRes.SurfaceArea = sum(anAreas)
+
+    aWeighted = [i for i in theSolids if i.Volume is not None and i.Centroid is not None]
+    aWeight = sum(i.Volume for i in aWeighted)
+    if len(aWeighted) == 1:
+        aRes.Centroid = aWeighted[0].Centroid
+    elif aWeighted and aWeight > 0:
+        aRes.Centroid = tuple(sum(i.Volume * i.Centroid[k] for i in aWeighted) / aWeight for k in range(3))
+    return aRes
@@ -0,0 +1,46 @@
+# shape_key.py
+#
+# Dictionary key of a shape that ignores its orientation, so that a face or
+# a solid reached through differently oriented references is found once, and
+# a hash of the geometry of a shape that stays the same between runs, for
+# keys of results kept on disk.
+
+import hashlib
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+class UnorientedShapeKey:
+    def __init__(self, theShape: mtk.ModelData_Shape):
+        self.myShape = theShape
+
+    def __hash__(self):
+        aHasher = mtk.ModelData_UnorientedShapeHash()
+        return int(aHasher(self.myShape))
+
+    def __eq__(self, other):
+        if id(other) == id(self):
+            return True
+        if isinstance(other, UnorientedShapeKey):
+            anEqualityChecker = mtk.ModelData_UnorientedShapeEqual()
+            return anEqualityChecker(other.myShape, self.myShape)
+        return False
+
+def GeometryHash(theShape: mtk.ModelData_Shape, theVolume: float, theSurfaceArea: float):
+    """Returns a hex digest of the vertices and the face and edge counts of theShape, and of theVolume and theSurfaceArea, None if not computed."""
+    aVertices = []
+    for aShape in mtk.ModelData_ShapeIterator(theShape, mtk.ShapeType_Vertex):
+        aPoint = mtk.ModelData_Vertex.Cast(aShape).Point()
+        aVertices.append(f"{aPoint.X():.6f} {aPoint.Y():.6f} {aPoint.Z():.6f}")
+    # Shared vertices are reached once per edge, and the order may change
+    aVertices = sorted(set(aVertices))
+
+    aFaceCount = sum(1 for i in mtk.ModelData_ShapeIterator(theShape, mtk.ShapeType_Face))
+    anEdgeCount = sum(1 for i in mtk.ModelData_ShapeIterator(theShape, mtk.ShapeType_Edge))
+    aHash = hashlib.sha256(f"{aFaceCount} {anEdgeCount} {len(aVertices)}\n".encode("ascii"))
+    for aVertex in aVertices:
+        aHash.update(aVertex.encode("ascii") + b"\n")
+
+    # Vertices alone don't tell apart shapes with none, such as spheres
+    for aMeasure in (theVolume, theSurfaceArea):
+        aHash.update(f"{aMeasure:.6g}\n".encode("ascii") if aMeasure is not None else b"-\n")
+    return aHash.hexdigest()
@@ -41,6 +41,7 @@ sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/..
 import mtk_license as license
 
 import feature_group
+import machining_session
 import shape_processor
 
 def ToDegrees(theAngleRad: float):
@@ -248,44 +249,11 @@ class PartProcessor(shape_processor.SolidProcessor):
         super().__init__()
         self.myOperation = theOperation
 
-    def CombineFeatureLists(self, theFirst: mtk.MTKBase_FeatureList, theSecond: mtk.MTKBase_FeatureList):
-        for anElement in theSecond:
-            if (self.myOperation == mtk.Machining_OT_LatheMilling
-                and mtk.DFMMachining_MillingIssue.CompareType(anElement)
-                and not mtk.DFMMachining_DeepPocketIssue.CompareType(anElement)):
-                continue
-            theFirst.Append(anElement)
-
     def ProcessSolid(self, theSolid: mtk.ModelData_Solid):
-        # Find features
-        aData = mtk.Machining_Data()
-        aRecognizer = mtk.Machining_FeatureRecognizer()
-        aRecognizer.Parameters().SetOperation(self.myOperation)
-        aRecognizer.Perform (theSolid, aData)
-
-        # Run drilling analyzer for found features
-        aDrillingParameters = mtk.DFMMachining_DrillingAnalyzerParameters()
-        aDrillingAnalyzer = mtk.DFMMachining_Analyzer(aDrillingParameters)
-        anIssueList = aDrillingAnalyzer.Perform(theSolid, aData)
-
-        # Run milling analyzer for found features
-        aMillingParameters = mtk.DFMMachining_MillingAnalyzerParameters()
-        aMillingAnalyzer = mtk.DFMMachining_Analyzer(aMillingParameters)
-        aMillingIssueList = aMillingAnalyzer.Perform(theSolid, aData)
-        # Combine issue lists
-        self.CombineFeatureLists(anIssueList, aMillingIssueList)
-
-        aTurningIssueList = mtk.MTKBase_FeatureList()
-        if self.myOperation == mtk.Machining_OT_LatheMilling:
-            # Run turning analyzer for found features
-            aTurninigParameters = mtk.DFMMachining_TurningAnalyzerParameters()
-            aTurningAnalyzer = mtk.DFMMachining_Analyzer(aTurninigParameters)
-            aTurningIssueList = aTurningAnalyzer.Perform(theSolid, aData)
-
-            # Combine issue lists
-            self.CombineFeatureLists(anIssueList, aTurningIssueList)
-
-        PrintIssues(anIssueList)
+        # Find features, then run the drilling, milling and (for lathe+milling)
+        # turning analyzers for them
+        aSession = machining_session.MachiningSession(theSolid, self.myOperation)
+        PrintIssues(aSession.Issues())
 
 def PrintSupportedOperations():
     print("Supported operations:")
@@ -43,46 +43,34 @@ sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/..
 import mtk_license as license
 import shape_processor
 import feature_group
+import machining_session
+import measurements
 
-def compute_whole_part_measurements(theSolid):
-    measurements = {
+def compute_whole_part_measurements(theMeasurements):
+    """Formats measurements.Measurements of a part for process_metrics.json."""
+    result = {
         "volume": {"name": "Volume", "units": "mm³", "value": "N/A"},
         "surfaceArea": {"name": "Surface Area", "units": "mm²", "value": "N/A"},
         "centroid": {"name": "Centroid", "units": "mm", "value": "N/A"},
     }
-    try:
-        shape = theSolid
-        if not shape:
-            print("[WARNING] No solid shape available for whole-part measurements")
-            return measurements
+    if theMeasurements is None or theMeasurements.SolidCount == 0:
+        print("[WARNING] No solid shape available for whole-part measurements")
+        return result
 
-        try:
-            volume = mtk.Measurements_Volume.Compute(shape)
-            if volume > 0:
-                measurements["volume"]["value"] = round(volume, 3)
-                print(f"[SUCCESS] Computed volume: {measurements['volume']['value']} mm^3")
-        except Exception as e:
-            print(f"[WARNING] Volume computation failed: {e}")
-
-        try:
-            area = mtk.Measurements_SurfaceArea.Compute(shape)
-            if area > 0:
-                measurements["surfaceArea"]["value"] = round(area, 3)
-                print(f"[SUCCESS] Computed surface area: {measurements['surfaceArea']['value']} mm^2")
-        except Exception as e:
-            print(f"[WARNING] Surface area computation failed: {e}")
+    if theMeasurements.Volume is not None and theMeasurements.Volume > 0:
+        result["volume"]["value"] = round(theMeasurements.Volume, 3)
+        print(f"[SUCCESS] Computed volume: {result['volume']['value']} mm^3")
 
-        try:
-            centroid = mtk.Measurements_ValidationProperties.ComputeCentroid(shape)
-            measurements["centroid"]["value"] = f"({centroid.X():.3f}, {centroid.Y():.3f}, {centroid.Z():.3f})"
-            print(f"[SUCCESS] Computed centroid: {measurements['centroid']['value']}")
-        except Exception as e:
-            print(f"[WARNING] Centroid computation failed: {e}")
+    if theMeasurements.SurfaceArea is not None and theMeasurements.SurfaceArea > 0:
+        result["surfaceArea"]["value"] = round(theMeasurements.SurfaceArea, 3)
+        print(f"[SUCCESS] Computed surface area: {result['surfaceArea']['value']} mm^2")
 
-    except Exception as e:
-        print(f"[WARNING] Error accessing solid shape for measurements: {e}")
+    if theMeasurements.Centroid is not None:
+        x, y, z = theMeasurements.Centroid
+        result["centroid"]["value"] = f"({x:.3f}, {y:.3f}, {z:.3f})"
+        print(f"[SUCCESS] Computed centroid: {result['centroid']['value']}")
 
-    return measurements
+    return result
 
 def FaceTypeToString(theType):
     aFaceTypeMap = {
@@ -238,24 +226,27 @@ class PartProcessor(shape_processor.SolidProcessor):
         self._output = Path(outputFolder)
         self._partId = partId
         self._features = []
-        self._solids = []
+        self._measurementsService = measurements.MeasurementsService()
+        self._partMeasurements = []
+
+    def VisitPart(self, thePart: mtk.ModelData_Part):
+        super().VisitPart(thePart)
+        self._partMeasurements.append(self._measurementsService.Part(thePart))
 
     def ProcessSolid(self, theSolid: mtk.ModelData_Solid):
         print("[INFO] Processing solid for feature recognition...")
-        recog = mtk.Machining_FeatureRecognizer()
-        recog.Parameters().SetOperation(self._op)
-        aFeatureList = recog.Perform(theSolid)
+        session = machining_session.MachiningSession(theSolid, self._op)
+        aFeatureList = session.Features()
         print("[SUCCESS] Feature recognition completed")
         PrintFeatures(aFeatureList)
         self._features.append(aFeatureList)
-        self._solids.append(theSolid)
 
     def ExportMeasurementsOnly(self):
-        if not self._solids:
+        if not self._features:
             print("[WARNING] No solids found; skipping measurements export")
             return
-        # Compute once from first processed solid
-        meas = compute_whole_part_measurements(self._solids[0])
+        # All solids of the first part
+        meas = compute_whole_part_measurements(self._partMeasurements[0])
 
         # Write separate, non-breaking file
         out = {
@@ -0,0 +1,366 @@
+# benchmark.py
+#
+# Performance benchmark of the analysis entry points over a corpus of models.
+# Every (model, case) pair runs in a fresh worker process, one after another,
+# so that the peak resident set size of a case isn't inflated by the memory
+# the toolkit kept from earlier ones and cases don't compete for cores. The
+# model is imported before each measured run and the import isn't measured,
+# except by the import case itself.
+#
+# "run" writes the per-run wall time, CPU time, peak RSS and output size with
+# their median and 95th percentile to a results file; "compare" checks such a
+# file against a baseline and fails if a median got worse than a threshold.
+
+import importlib.metadata
+import json
+import math
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../helpers/"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../MTKConverter/"))
+
+import mtk_license as license
+
+import MTKConverter_Application as app
+import MTKConverter_Batch as batch
+import MTKConverter_Memory as memory
+import MTKConverter_Parallel as parallel
+
+from MTKConverter_MachiningProcessor import MTKConverter_MachiningProcessor
+from MTKConverter_MoldingProcessor import MTKConverter_MoldingProcessor
+from MTKConverter_SheetMetalProcessor import MTKConverter_SheetMetalProcessor
+from MTKConverter_WallThicknessProcessor import MTKConverter_WallThicknessProcessor
+from MTKConverter_Report import MTKConverter_Report
+
+import machining_session
+
+# Relative change of a median above which compare reports a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Smaller absolute changes are noise whatever their relative size
+MIN_DELTAS = {"wall": 0.05, "cpu": 0.05, "peakRss": 16 * 1024 * 1024, "outputSize": 1024}
+
+def PrintUsage():
+    print ("Usage:")
+    print ("benchmark run <corpus> [-c <case>[,<case>...]] [-r <repeats>] [--warmup <runs>] [-o <results>]")
+    print ("benchmark compare <baseline> <results> [-t <threshold>]\n")
+    print ("Arguments:")
+    print ("  <corpus> - directory, glob pattern, or .csv/.jsonl manifest of models (as for MTKConverter_Batch)")
+    print ("  <case> - case to run (default: all of them)")
+    print ("  <repeats> - measured runs per model and case (default: 5)")
+    print ("  <runs> - unmeasured runs before them (default: 1)")
+    print ("  <results> - results file (default: benchmark_results.json)")
+    print ("  <baseline> - results file to compare against")
+    print ("  <threshold> - relative change of a median reported as a regression (default: 0.10)")
+    print ("\nCases:")
+    for aName, (aFunction, aDescription) in CASES.items():
+        print ("  ", f"{aName:<16}", ":\t ", aDescription, sep="")
+
+def _Solids(theModel: mtk.ModelData_Model):
+    aSolids = []
+    for aPart in parallel.CollectParts(theModel):
+        for aBody in aPart.Bodies():
+            for aShape in mtk.ModelData_ShapeIterator(aBody, mtk.ShapeType_Solid):
+                aSolids.append(mtk.ModelData_Solid.Cast(aShape))
+    return aSolids
+
+def _FolderSize(thePath: str):
+    return sum(i.stat().st_size for i in Path(thePath).rglob("*") if i.is_file())
+
+def _Import(theSource: str):
+    aModel = mtk.ModelData_Model()
+    if not mtk.ModelData_ModelReader().Read(mtk.UTF16String(theSource), aModel):
+        raise RuntimeError("Failed to import " + theSource)
+    return aModel
+
+def _ApplyProcessor(theProcessor, theModel: mtk.ModelData_Model):
+    theModel.Accept(mtk.ModelData_ModelElementUniqueVisitor(theProcessor))
+    return theProcessor.myData
+
+# Every case has a setup, run before the clock starts, and a measured part;
+# the measured part returns the size in bytes of what it wrote, or None
+
+def _SetupImport(theSource: str):
+    return theSource
+
+def _RunImport(theSource: str, theWorkDir: str):
+    _Import(theSource)
+    return None
+
+def _SetupModel(theSource: str):
+    return _Import(theSource)
+
+def _RecognitionCase(theOperation):
+    def Run(theModel: mtk.ModelData_Model, theWorkDir: str):
+        for aSolid in _Solids(theModel):
+            machining_session.MachiningSession(aSolid, theOperation).Features()
+        return None
+    return Run
+
+# DFM on features recognized during the setup
+def _SetupMachiningDfm(theSource: str):
+    aSessions = [machining_session.MachiningSession(i, mtk.Machining_OT_Milling) for i in _Solids(_Import(theSource))]
+    for aSession in aSessions:
+        aSession.Data()
+    return aSessions
+
+def _RunMachiningDfm(theSessions, theWorkDir: str):
+    for aSession in theSessions:
+        aSession.Issues()
+    return None
+
+def _RunMolding(theModel: mtk.ModelData_Model, theWorkDir: str):
+    _ApplyProcessor(MTKConverter_MoldingProcessor(mtk.ModelData_Model()), theModel)
+    return None
+
+def _RunSheetMetal(theModel: mtk.ModelData_Model, theWorkDir: str):
+    _ApplyProcessor(MTKConverter_SheetMetalProcessor(mtk.ModelData_Model()), theModel)
+    return None
+
+def _RunWallThickness(theModel: mtk.ModelData_Model, theWorkDir: str):
+    _ApplyProcessor(MTKConverter_WallThicknessProcessor(800), theModel)
+    return None
+
+# Same parameters as the meshing sample
+def _RunMeshing(theModel: mtk.ModelData_Model, theWorkDir: str):
+    aParams = mtk.ModelAlgo_MeshGeneratorParameters()
+    aParams.SetAngularDeflection(math.pi * 10 / 180)
+    aParams.SetChordalDeflection(0.003)
+    mtk.ModelAlgo_MeshGenerator(aParams).Generate(theModel)
+    return None
+
+# Report of machining milling results, built and written as JSON and CBOR
+def _SetupReport(theSource: str):
+    aModel = _Import(theSource)
+    aModel.AssignUuids()
+    aReport = MTKConverter_Report(1, True)
+    for i in _ApplyProcessor(MTKConverter_MachiningProcessor(mtk.Machining_OT_Milling), aModel):
+        aReport.AddData(i)
+    return aReport
+
+def _RunReport(theReport: MTKConverter_Report, theWorkDir: str):
+    aJsonPath = os.path.join(theWorkDir, "process_data.json")
+    aCborPath = os.path.join(theWorkDir, "process_data.cbor")
+    theReport.WriteToJSON(aJsonPath)
+    theReport.WriteToCBOR(aCborPath)
+    return os.path.getsize(aJsonPath) + os.path.getsize(aCborPath)
+
+# Whole converter run, export included, as the web viewer does it
+def _RunConverter(theSource: str, theWorkDir: str):
+    aTarget = os.path.join(theWorkDir, "converted")
+    aRes = app.MTKConverter_Application().Run(theSource, "machining_milling", aTarget, "--no-screenshot")
+    if aRes != app.MTKConverter_ReturnCode.MTKConverter_RC_OK:
+        raise RuntimeError("Converter failed with " + aRes.name)
+    return _FolderSize(aTarget)
+
+CASES = {
+    "import":         ((_SetupImport, _RunImport), "model import"),
+    "milling":        ((_SetupModel, _RecognitionCase(mtk.Machining_OT_Milling)), "CNC milling feature recognition"),
+    "turning":        ((_SetupModel, _RecognitionCase(mtk.Machining_OT_LatheMilling)),
+                       "CNC lathe+milling feature recognition"),
+    "machining_dfm":  ((_SetupMachiningDfm, _RunMachiningDfm), "CNC milling DFM analysis of recognized features"),
+    "molding":        ((_SetupModel, _RunMolding), "molding feature recognition and DFM analysis"),
+    "sheet_metal":    ((_SetupModel, _RunSheetMetal), "sheet metal recognition, unfolding and DFM analysis"),
+    "wall_thickness": ((_SetupModel, _RunWallThickness), "wall thickness analysis"),
+    "meshing":        ((_SetupModel, _RunMeshing), "mesh generation"),
+    "report":         ((_SetupReport, _RunReport), "JSON and CBOR report of machining milling results"),
+    "converter":      ((_SetupImport, _RunConverter), "MTKConverter machining_milling run with export"),
+}
+
+def _InitWorker():
+    if not mtk.LicenseManager.Activate(license.Value()):
+        raise RuntimeError("Failed to activate Manufacturing Toolkit license.")
+
+def _RunCase(theTask):
+    aSource, aCase, aRepeats, aWarmup = theTask
+    (aSetup, aRun), _ = CASES[aCase]
+    aRuns = []
+    aWorkDir = tempfile.mkdtemp(prefix="mtk_benchmark_")
+    try:
+        for i in range(aWarmup + aRepeats):
+            anInput = aSetup(aSource)
+            with memory.MTKConverter_PeakRssSampler(0.01) as aSampler:
+                aStartTime = time.perf_counter()
+                aStartCpu = time.process_time()
+                anOutputSize = aRun(anInput, aWorkDir)
+                aWall = time.perf_counter() - aStartTime
+                aCpu = time.process_time() - aStartCpu
+            if i >= aWarmup:
+                aRuns.append({"wall": aWall, "cpu": aCpu, "peakRss": aSampler.myPeak, "outputSize": anOutputSize})
+            shutil.rmtree(aWorkDir)
+            os.mkdir(aWorkDir)
+    finally:
+        shutil.rmtree(aWorkDir, ignore_errors=True)
+    return aRuns
+
+def Percentile(theValues, theFraction: float):
+    """Linear interpolation between closest ranks."""
+    aValues = sorted(theValues)
+    if not aValues:
+        return None
+    aRank = (len(aValues) - 1) * theFraction
+    aLow = math.floor(aRank)
+    aHigh = min(aLow + 1, len(aValues) - 1)
+    return aValues[aLow] + (aValues[aHigh] - aValues[aLow]) * (aRank - aLow)
+
+def _Summarize(theRuns):
+    aSummary = {}
+    for aMetric in ("wall", "cpu", "peakRss", "outputSize"):
+        aValues = [i[aMetric] for i in theRuns if i[aMetric] is not None]
+        if aValues:
+            aSummary[aMetric] = {"median": Percentile(aValues, 0.5), "p95": Percentile(aValues, 0.95)}
+    return aSummary
+
+def _ToolkitVersion():
+    try:
+        return importlib.metadata.version("manufacturingtoolkit")
+    except importlib.metadata.PackageNotFoundError:
+        return getattr(mtk, "__version__", "unknown")
+
+def Run(theSources, theCases, theRepeats: int = 5, theWarmup: int = 1):
+    aResults = []
+    aContext = multiprocessing.get_context("spawn")
+    for aSource in theSources:
+        for aCase in theCases:
+            anEntry = {"model": os.path.basename(aSource), "case": aCase}
+            print(anEntry["model"], " ", aCase, "... ", sep="", end="", flush=True)
+            try:
+                with aContext.Pool(1, _InitWorker) as aPool:
+                    aRuns = aPool.apply(_RunCase, ((aSource, aCase, theRepeats, theWarmup),))
+                anEntry["runs"] = aRuns
+                anEntry.update(_Summarize(aRuns))
+                print(f"{anEntry['wall']['median']:.3f} s")
+            except Exception as anE:
+                anEntry["error"] = str(anE)
+                print("Failed.\nERROR: ", anE, sep="")
+            aResults.append(anEntry)
+
+    return {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+            "toolkit": _ToolkitVersion(),
+        },
+        "repeats": theRepeats,
+        "warmup": theWarmup,
+        "results": aResults,
+    }
+
+def Compare(theBaseline: dict, theResults: dict, theThreshold: float = DEFAULT_THRESHOLD):
+    """Returns the list of (model, case, metric, baseline, current) regressions."""
+    aBaseline = {(i["model"], i["case"]): i for i in theBaseline["results"]}
+    aRegressions = []
+    for anEntry in theResults["results"]:
+        aKey = (anEntry["model"], anEntry["case"])
+        aBase = aBaseline.get(aKey)
+        if aBase is None:
+            print("NEW  ", *aKey)
+            continue
+        if "error" in anEntry and "error" not in aBase:
+            print("FAIL ", *aKey, anEntry["error"])
+            aRegressions.append(aKey + ("error", None, None))
+            continue
+        for aMetric, aMinDelta in MIN_DELTAS.items():
+            if aMetric not in anEntry or aMetric not in aBase:
+                continue
+            aBaseValue = aBase[aMetric]["median"]
+            aValue = anEntry[aMetric]["median"]
+            aDelta = aValue - aBaseValue
+            aChange = aDelta / aBaseValue if aBaseValue else 0.0
+            anIsRegression = aChange > theThreshold and aDelta > aMinDelta
+            if anIsRegression or (aChange < -theThreshold and -aDelta > aMinDelta):
+                print("SLOW " if anIsRegression else "FAST ", *aKey, aMetric,
+                      f"{aBaseValue:.6g} -> {aValue:.6g} ({aChange:+.1%})")
+            if anIsRegression:
+                aRegressions.append(aKey + (aMetric, aBaseValue, aValue))
+
+    for aKey in aBaseline.keys() - {(i["model"], i["case"]) for i in theResults["results"]}:
+        print("GONE ", *aKey)
+    return aRegressions
+
+def main(theArgs):
+    anArgs = list(theArgs)
+    aCommand = anArgs.pop(0)
+    if aCommand == "run":
+        aCorpus = ""
+        aCases = list(CASES)
+        aRepeats = 5
+        aWarmup = 1
+        anOutput = "benchmark_results.json"
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-c":
+                aCases = [i.strip() for i in anArgs.pop(0).split(",") if i.strip()]
+            elif anOption == "-r":
+                aRepeats = int(anArgs.pop(0))
+            elif anOption == "--warmup":
+                aWarmup = int(anArgs.pop(0))
+            elif anOption == "-o":
+                anOutput = os.path.abspath(anArgs.pop(0))
+            elif not aCorpus:
+                aCorpus = anOption
+            else:
+                raise ValueError(anOption)
+        anUnknown = [i for i in aCases if i not in CASES]
+        if not aCorpus or anUnknown or aRepeats < 1:
+            raise ValueError(", ".join(anUnknown))
+
+        aSources = [i.mySource for i in batch.CollectItems(aCorpus, "")]
+        if not aSources:
+            print("No models found for ", aCorpus, ".", sep="")
+            return 1
+
+        aResults = Run(aSources, aCases, aRepeats, aWarmup)
+        with open(anOutput, "w", encoding="utf-8") as f:
+            json.dump(aResults, f, indent=4)
+        print("Results written to ", anOutput, sep="")
+        return 1 if any("error" in i for i in aResults["results"]) else 0
+
+    if aCommand == "compare":
+        aThreshold = DEFAULT_THRESHOLD
+        aPaths = []
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-t":
+                aThreshold = float(anArgs.pop(0))
+            else:
+                aPaths.append(anOption)
+        if len(aPaths) != 2:
+            raise ValueError(" ".join(aPaths))
+
+        with open(aPaths[0], "r", encoding="utf-8") as f:
+            aBaseline = json.load(f)
+        with open(aPaths[1], "r", encoding="utf-8") as f:
+            aResults = json.load(f)
+        aRegressions = Compare(aBaseline, aResults, aThreshold)
+        print(len(aRegressions), " regression(s) above ", f"{aThreshold:.0%}", sep="")
+        return 1 if aRegressions else 0
+
+    raise ValueError(aCommand)
+
+if __name__ == "__main__":
+    if (len(sys.argv) == 1
+        or sys.argv[1] == "-?" or sys.argv[1] == "/?"
+        or sys.argv[1] == "-h" or sys.argv[1] == "--help"):
+        PrintUsage()
+        sys.exit()
+
+    try:
+        sys.exit(main(sys.argv[1:]))
+    except (IndexError, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(app.MTKConverter_ReturnCode.MTKConverter_RC_InvalidArgument.value)
@@ -0,0 +1,268 @@
+# fake_mtk.py
+#
+# Stand-in for manufacturingtoolkit.CadExMTK with just enough of the feature,
+# issue and shape types for the report to be built and written without the
+# toolkit or a license. Features compare by a key of their type and
+# parameters, as MTKBase_FeatureComparator does, and shapes are lists of
+# subshapes with 64-bit ids. Any other name resolves to an empty type that no
+# feature is an instance of, so the type checks of the report fall through
+# as they would for a kind of feature the stream doesn't have.
+#
+# Install() must be called before any MTKConverter module is imported.
+
+import itertools
+import sys
+import types
+
+ShapeType_Solid = 2
+ShapeType_Shell = 3
+ShapeType_Face = 4
+ShapeType_Edge = 6
+
+_theTypeIds = itertools.count(1)
+
+class _FakeType:
+    def __init_subclass__(cls, **theKwargs):
+        super().__init_subclass__(**theKwargs)
+        cls.myTypeId = next(_theTypeIds)
+
+    def __init__(self, *theArgs, **theKwargs):
+        pass
+
+    @classmethod
+    def CompareType(cls, theObject):
+        return isinstance(theObject, cls)
+
+    @classmethod
+    def Cast(cls, theObject):
+        return theObject
+
+# Geometry
+
+class ModelData_Direction(_FakeType):
+    def __init__(self, theX: float, theY: float, theZ: float):
+        self.myCoord = (theX, theY, theZ)
+
+    def X(self):
+        return self.myCoord[0]
+
+    def Y(self):
+        return self.myCoord[1]
+
+    def Z(self):
+        return self.myCoord[2]
+
+class ModelData_Axis1Placement(_FakeType):
+    def __init__(self, theDirection: ModelData_Direction):
+        self.myDirection = theDirection
+
+    def Axis(self):
+        return self.myDirection
+
+    def Direction(self):
+        return self.myDirection
+
+# Shapes
+
+class ModelData_Shape(_FakeType):
+    def __init__(self, theId: int, theType: int, theSubshapes = ()):
+        self.myId = theId
+        self.myType = theType
+        self.mySubshapes = list(theSubshapes)
+
+    def Id(self):
+        return self.myId
+
+    def Type(self):
+        return self.myType
+
+class ModelData_Solid(ModelData_Shape):
+    pass
+
+class ModelData_ShapeIterator(_FakeType):
+    # Subshapes of theType, the shape itself if it is of that type
+    def __init__(self, theShape: ModelData_Shape, theType: int = None):
+        if theType is None:
+            self.myShapes = list(theShape.mySubshapes)
+        elif theShape.myType == theType:
+            self.myShapes = [theShape]
+        else:
+            self.myShapes = [i for i in theShape.mySubshapes if i.myType == theType]
+        self.myIndex = 0
+
+    def HasNext(self):
+        return self.myIndex < len(self.myShapes)
+
+    def Next(self):
+        self.myIndex += 1
+        return self.myShapes[self.myIndex - 1]
+
+    def __iter__(self):
+        return iter(self.myShapes)
+
+class ModelData_UnorientedShapeHash(_FakeType):
+    def __call__(self, theShape: ModelData_Shape):
+        return hash(theShape.myId)
+
+class ModelData_UnorientedShapeEqual(_FakeType):
+    def __call__(self, theShape1: ModelData_Shape, theShape2: ModelData_Shape):
+        return theShape1.myId == theShape2.myId
+
+class ModelData_Part(_FakeType):
+    def __init__(self, theName: str = "", theUuid: str = ""):
+        self.myName = theName
+        self.myUuid = theUuid
+
+    def Name(self):
+        return self.myName
+
+    def Uuid(self):
+        return self.myUuid
+
+    # No bodies, so that building the report doesn't measure anything
+    def Bodies(self):
+        return []
+
+# Features
+
+class MTKBase_Feature(_FakeType):
+    def __init__(self, *theParameters):
+        self.myKey = (self.myTypeId,) + theParameters
+
+    def TypeId(self):
+        return self.myTypeId
+
+class MTKBase_ShapeFeature(MTKBase_Feature):
+    def __init__(self, theShape: ModelData_Shape, *theParameters):
+        super().__init__(*theParameters)
+        self.myShape = theShape
+
+    def Shape(self):
+        return self.myShape
+
+class MTKBase_FeatureComparator(_FakeType):
+    def __call__(self, theFeature1: MTKBase_Feature, theFeature2: MTKBase_Feature):
+        return theFeature1.myKey < theFeature2.myKey
+
+class MTKBase_FeatureList(_FakeType, list):
+    def Append(self, theFeature: MTKBase_Feature):
+        self.append(theFeature)
+
+    def Size(self):
+        return len(self)
+
+    def IsEmpty(self):
+        return not self
+
+# theGeometry stands for what tells faces of the same type apart
+class Machining_Face(MTKBase_ShapeFeature):
+    def __init__(self, theShape: ModelData_Shape, theType, theGeometry: int = 0):
+        super().__init__(theShape, theType.myTypeId, theGeometry)
+        self.myFaceType = theType
+
+    def Type(self):
+        return self.myFaceType
+
+class Machining_Hole(MTKBase_ShapeFeature):
+    def __init__(self, theShape: ModelData_Shape, theType, theRadius: float, theDepth: float,
+                 theAxis: ModelData_Direction):
+        super().__init__(theShape, theType.myTypeId, theRadius, theDepth, theAxis.myCoord)
+        self.myHoleType = theType
+        self.myRadius = theRadius
+        self.myDepth = theDepth
+        self.myAxis = ModelData_Axis1Placement(theAxis)
+
+    def Type(self):
+        return self.myHoleType
+
+    def Radius(self):
+        return self.myRadius
+
+    def Depth(self):
+        return self.myDepth
+
+    def Axis(self):
+        return self.myAxis
+
+class Machining_Pocket(MTKBase_ShapeFeature):
+    def __init__(self, theShape: ModelData_Shape, theType, theLength: float, theWidth: float, theDepth: float,
+                 theAxis: ModelData_Direction):
+        super().__init__(theShape, theType.myTypeId, theLength, theWidth, theDepth, theAxis.myCoord)
+        self.myPocketType = theType
+        self.myLength = theLength
+        self.myWidth = theWidth
+        self.myDepth = theDepth
+        self.myAxis = ModelData_Axis1Placement(theAxis)
+
+    def Type(self):
+        return self.myPocketType
+
+    def Length(self):
+        return self.myLength
+
+    def Width(self):
+        return self.myWidth
+
+    def Depth(self):
+        return self.myDepth
+
+    def Axis(self):
+        return self.myAxis
+
+# Issues
+
+class DFMBase_Issue(MTKBase_Feature):
+    pass
+
+class DFMMachining_DrillingIssue(DFMBase_Issue):
+    def __init__(self, theHole: Machining_Hole, *theParameters):
+        super().__init__(*theParameters)
+        self.myHole = theHole
+
+    def Hole(self):
+        return self.myHole
+
+class DFMMachining_SmallDiameterHoleIssue(DFMMachining_DrillingIssue):
+    def __init__(self, theHole: Machining_Hole, theExpectedMinDiameter: float):
+        super().__init__(theHole, theExpectedMinDiameter, theHole.Radius() * 2)
+        self.myExpectedMinDiameter = theExpectedMinDiameter
+
+    def ExpectedMinDiameter(self):
+        return self.myExpectedMinDiameter
+
+    def ActualDiameter(self):
+        return self.myHole.Radius() * 2
+
+class DFMMachining_DeepHoleIssue(DFMMachining_DrillingIssue):
+    def __init__(self, theHole: Machining_Hole, theExpectedMaxDepth: float):
+        super().__init__(theHole, theExpectedMaxDepth, theHole.Depth())
+        self.myExpectedMaxDepth = theExpectedMaxDepth
+
+    def ExpectedMaxDepth(self):
+        return self.myExpectedMaxDepth
+
+    def ActualDepth(self):
+        return self.myHole.Depth()
+
+class DFMMachining_FlatBottomHoleIssue(DFMMachining_DrillingIssue):
+    pass
+
+_theOtherTypes = {}
+
+def __getattr__(theName: str):
+    if theName.startswith("__"):
+        raise AttributeError(theName)
+    aType = _theOtherTypes.get(theName)
+    if aType is None:
+        aType = type(theName, (_FakeType,), {})
+        _theOtherTypes[theName] = aType
+    return aType
+
+def Install():
+    """Makes this module the one imported as manufacturingtoolkit.CadExMTK."""
+    aThis = sys.modules[__name__]
+    aPackage = types.ModuleType("manufacturingtoolkit")
+    aPackage.__path__ = []
+    aPackage.CadExMTK = aThis
+    sys.modules["manufacturingtoolkit"] = aPackage
+    sys.modules["manufacturingtoolkit.CadExMTK"] = aThis
@@ -0,0 +1,426 @@
+# report_benchmark.py
+#
+# Micro-benchmark of the report, run on synthetic machining results instead
+# of analyzed models, so that it needs neither the toolkit nor a license. The
+# features and issues are those of fake_mtk; a stream has a given number of
+# features, a share of which duplicate another one and are merged by the
+# report, and a given number of drilling issues on its holes.
+#
+# Every stage of the report is timed on its own: sorting and merging the
+# features, adding them to feature groups, building the report model and
+# writing it as version 1 and 2 JSON and as CBOR. Throughput is the number
+# of features and issues in the stream per second of the median run. One
+# more run of every stage is traced with tracemalloc for the number of
+# blocks it left allocated, its result included, and the peak of traced
+# memory while it ran.
+#
+# "run" writes the results, "compare" checks them against a baseline in the
+# same way as benchmark.py does for models.
+
+import gc
+import io
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from pathlib import Path
+
+import fake_mtk
+
+fake_mtk.Install()
+
+import manufacturingtoolkit.CadExMTK as mtk
+
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../helpers/"))
+sys.path.append(os.path.abspath(os.path.dirname(Path(__file__).resolve()) + "/../../MTKConverter/"))
+
+import MTKConverter_CBOR as cbor
+import MTKConverter_MachiningProcessor as mach_proc
+import MTKConverter_Report as report
+
+# Relative change of a median above which compare reports a regression
+DEFAULT_THRESHOLD = 0.10
+
+# Smaller absolute changes are noise whatever their relative size
+MIN_DELTAS = {"wall": 0.002, "allocBlocks": 100, "allocPeak": 64 * 1024}
+
+def PrintUsage():
+    print ("Usage:")
+    print ("report_benchmark run [-n <features>[,<features>...]] [-d <ratio>[,<ratio>...]] [-i <issues>] [-s <stage>[,<stage>...]] [-r <repeats>] [--warmup <runs>] [--seed <seed>] [-o <results>]")
+    print ("report_benchmark compare <baseline> <results> [-t <threshold>]\n")
+    print ("Arguments:")
+    print ("  <features> - number of features in a stream (default: 1000,10000)")
+    print ("  <ratio> - share of the features equal to another one, from 0 to 1 (default: 0,0.5,0.9)")
+    print ("  <issues> - number of drilling issues per feature (default: 0.25)")
+    print ("  <stage> - stage to run (default: all of them)")
+    print ("  <repeats> - measured runs per stream and stage (default: 5)")
+    print ("  <runs> - unmeasured runs before them (default: 1)")
+    print ("  <seed> - seed of the streams (default: 0)")
+    print ("  <results> - results file (default: report_benchmark_results.json)")
+    print ("  <baseline> - results file to compare against")
+    print ("  <threshold> - relative change of a median reported as a regression (default: 0.10)")
+    print ("\nStages:")
+    for aName, (aFunction, aDescription) in STAGES.items():
+        print ("  ", f"{aName:<8}", ":\t ", aDescription, sep="")
+
+class Stream:
+    def __init__(self, theFeatureCount: int, theDuplication: float, theIssueRatio: float, theSeed: int):
+        self.myName = f"n{theFeatureCount}-d{theDuplication:g}-i{theIssueRatio:g}"
+        self.myFeatures = []
+        self.myIssues = []
+
+        aRandom = random.Random(theSeed)
+        aShapeIds = itertools.count(0x1000000000000001)
+
+        # Features of the same prototype have the same parameters and are
+        # merged, but every one of them has shapes of its own
+        aPrototypeCount = max(1, theFeatureCount - round(theFeatureCount * theDuplication))
+        aPrototypes = [Stream.__Prototype(aRandom, i) for i in range(aPrototypeCount)]
+        for i in range(theFeatureCount):
+            aPrototype = aPrototypes[i] if i < aPrototypeCount else aRandom.choice(aPrototypes)
+            self.myFeatures.append(aPrototype(aShapeIds))
+        aRandom.shuffle(self.myFeatures)
+
+        aHoles = [i for i in self.myFeatures if type(i) is mtk.Machining_Hole]
+        if aHoles:
+            for i in range(round(theFeatureCount * theIssueRatio)):
+                self.myIssues.append(Stream.__Issue(aRandom, aRandom.choice(aHoles)))
+
+    def Size(self):
+        return len(self.myFeatures) + len(self.myIssues)
+
+    def ProcessData(self):
+        aData = mach_proc.MTKConverter_MachiningData(mtk.ModelData_Part("benchmark", self.myName))
+        aData.myOperation = mtk.Machining_OT_Milling
+        aData.myFeatureList.extend(self.myFeatures)
+        aData.myIssueList.extend(self.myIssues)
+        return aData
+
+    @staticmethod
+    def __Faces(theShapeIds, theCount: int):
+        aFaces = [mtk.ModelData_Shape(next(theShapeIds), mtk.ShapeType_Face) for i in range(theCount)]
+        return mtk.ModelData_Shape(next(theShapeIds), mtk.ShapeType_Shell, aFaces)
+
+    @staticmethod
+    def __Prototype(theRandom: random.Random, theIndex: int):
+        # Parameters depend on theIndex so that no two prototypes are equal
+        anAxis = mtk.ModelData_Direction(*theRandom.choice(((0.0, 0.0, 1.0), (0.0, 1.0, 0.0), (1.0, 0.0, 0.0))))
+        aKind = theRandom.random()
+        if aKind < 0.4:
+            aType = theRandom.choice((mtk.Machining_FT_FlatFaceMilled, mtk.Machining_FT_FlatSideMilled,
+                                      mtk.Machining_FT_CurvedMilled, mtk.Machining_FT_CircularMilled))
+            aFaceCount = 1 + theIndex % 3
+            return lambda theShapeIds: mtk.Machining_Face(Stream.__Faces(theShapeIds, aFaceCount), aType, theIndex)
+        if aKind < 0.8:
+            aType = theRandom.choice((mtk.Machining_HT_Through, mtk.Machining_HT_FlatBottom, mtk.Machining_HT_Blind))
+            aRadius = 0.5 + theRandom.random() * 10
+            aDepth = 1.0 + theIndex * 0.001
+            return lambda theShapeIds: mtk.Machining_Hole(Stream.__Faces(theShapeIds, 2), aType, aRadius, aDepth,
+                                                          anAxis)
+        aType = theRandom.choice((mtk.Machining_PT_Closed, mtk.Machining_PT_Open, mtk.Machining_PT_Through))
+        aLength = 10.0 + theRandom.random() * 100
+        aWidth = 5.0 + theRandom.random() * 50
+        aDepth = 1.0 + theIndex * 0.001
+        return lambda theShapeIds: mtk.Machining_Pocket(Stream.__Faces(theShapeIds, 5), aType, aLength, aWidth, aDepth,
+                                                        anAxis)
+
+    @staticmethod
+    def __Issue(theRandom: random.Random, theHole: mtk.Machining_Hole):
+        aKind = theRandom.random()
+        if aKind < 0.4:
+            return mtk.DFMMachining_SmallDiameterHoleIssue(theHole, 1.0)
+        if aKind < 0.8:
+            return mtk.DFMMachining_DeepHoleIssue(theHole, theHole.Radius() * 20)
+        return mtk.DFMMachining_FlatBottomHoleIssue(theHole)
+
+# Every stage has a setup, run before the clock starts, and a measured part;
+# the measured part returns its result, kept alive until the allocations are
+# counted, and the size in bytes of what it wrote, or None
+
+def _ResolvedModel(theStream: Stream):
+    aReport = report.MTKConverter_Report()
+    aReport.AddData(theStream.ProcessData())
+    aModel = aReport.Model()
+    _ResolveShapeIDs(aModel)
+    return aModel
+
+# Shape ids are collected when the report is written, or here
+def _ResolveShapeIDs(theModel):
+    for aPartReport in theModel.Parts:
+        for aSection in aPartReport.Sections:
+            for aGroup in aSection.Groups:
+                for aShapeIDs in aGroup.Features:
+                    len(aShapeIDs)
+                for aSubGroup in aGroup.SubGroups:
+                    for aShapeIDs in aSubGroup.ShapeIDs:
+                        len(aShapeIDs)
+
+def _SetupSort(theStream: Stream):
+    return theStream
+
+def _RunSort(theStream: Stream):
+    aLists = []
+    for aFeatures in (theStream.myFeatures, theStream.myIssues):
+        aList = report.OrderedFeatureList()
+        for aFeature in aFeatures:
+            aList.Append(aFeature, None)
+        aList.Size()
+        aLists.append(aList)
+    return aLists, None
+
+class _RecordingGroupManager(report.FeatureGroupManager):
+    theCalls = []
+
+    def __init__(self):
+        super().__init__()
+        self.myCalls = []
+        _RecordingGroupManager.theCalls.append(self.myCalls)
+
+    def AddGroupData(self, *theArgs):
+        self.myCalls.append(theArgs)
+        super().AddGroupData(*theArgs)
+
+# The calls a report build makes, one list per feature section
+def _SetupGroups(theStream: Stream):
+    _RecordingGroupManager.theCalls = []
+    aManager = report.FeatureGroupManager
+    report.FeatureGroupManager = _RecordingGroupManager
+    try:
+        report.MTKConverter_Report.BuildPartReport(theStream.ProcessData())
+    finally:
+        report.FeatureGroupManager = aManager
+    return _RecordingGroupManager.theCalls
+
+def _RunGroups(theCalls):
+    aManagers = []
+    for aSectionCalls in theCalls:
+        aManager = report.FeatureGroupManager()
+        for aCall in aSectionCalls:
+            aManager.AddGroupData(*aCall)
+        aManagers.append(aManager)
+    return aManagers, None
+
+def _RunModel(theStream: Stream):
+    aReport = report.MTKConverter_Report()
+    aReport.AddData(theStream.ProcessData())
+    aModel = aReport.Model()
+    _ResolveShapeIDs(aModel)
+    return aModel, None
+
+def _JSONCase(theVersion: int):
+    def Run(theModel):
+        aStream = io.StringIO()
+        report.ReportSerializer.Write(report.JSONWriter(aStream, 0, theVersion >= 2), theModel, theVersion)
+        aText = aStream.getvalue()
+        return aText, len(aText.encode("utf-8"))
+    return Run
+
+def _RunCBOR(theModel):
+    aWriter = report.TreeWriter()
+    report.ReportSerializer.Write(aWriter, theModel, 2)
+    aData = cbor.Encode(aWriter.Root())
+    return aData, len(aData)
+
+STAGES = {
+    "sort":    ((_SetupSort, _RunSort), "OrderedFeatureList insertion, sort and merge"),
+    "groups":  ((_SetupGroups, _RunGroups), "FeatureGroupManager calls of a report build"),
+    "model":   ((_SetupSort, _RunModel), "report model, shape ids included"),
+    "json_v1": ((_ResolvedModel, _JSONCase(1)), "version 1 JSON of the report model"),
+    "json_v2": ((_ResolvedModel, _JSONCase(2)), "version 2 JSON of the report model"),
+    "cbor":    ((_ResolvedModel, _RunCBOR), "CBOR of the report model"),
+}
+
+def _RunStage(theStream: Stream, theStage: str, theRepeats: int, theWarmup: int):
+    (aSetup, aRun), _ = STAGES[theStage]
+    aRuns = []
+    for i in range(theWarmup + theRepeats):
+        anInput = aSetup(theStream)
+        gc.collect()
+        aStartTime = time.perf_counter()
+        aStartCpu = time.process_time()
+        aResult, anOutputSize = aRun(anInput)
+        aWall = time.perf_counter() - aStartTime
+        aCpu = time.process_time() - aStartCpu
+        del aResult
+        if i >= theWarmup:
+            aRuns.append({"wall": aWall, "cpu": aCpu, "outputSize": anOutputSize})
+
+    anInput = aSetup(theStream)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        aResult, _ = aRun(anInput)
+        aSnapshot = tracemalloc.take_snapshot()
+        _, aPeak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del aResult
+    aBlocks = sum(i.count for i in aSnapshot.statistics("filename"))
+    return aRuns, {"allocBlocks": aBlocks, "allocPeak": aPeak}
+
+def Percentile(theValues, theFraction: float):
+    """Linear interpolation between closest ranks."""
+    aValues = sorted(theValues)
+    if not aValues:
+        return None
+    aRank = (len(aValues) - 1) * theFraction
+    aLow = math.floor(aRank)
+    aHigh = min(aLow + 1, len(aValues) - 1)
+    return aValues[aLow] + (aValues[aHigh] - aValues[aLow]) * (aRank - aLow)
+
+def _Summarize(theRuns):
+    aSummary = {}
+    for aMetric in ("wall", "cpu", "outputSize"):
+        aValues = [i[aMetric] for i in theRuns if i[aMetric] is not None]
+        if aValues:
+            aSummary[aMetric] = {"median": Percentile(aValues, 0.5), "p95": Percentile(aValues, 0.95)}
+    return aSummary
+
+def Run(theStreams, theStages, theRepeats: int = 5, theWarmup: int = 1):
+    aResults = []
+    for aStream in theStreams:
+        for aStage in theStages:
+            anEntry = {"stream": aStream.myName, "stage": aStage, "features": aStream.Size()}
+            print(aStream.myName, " ", aStage, "... ", sep="", end="", flush=True)
+            aRuns, anAllocations = _RunStage(aStream, aStage, theRepeats, theWarmup)
+            anEntry["runs"] = aRuns
+            anEntry.update(_Summarize(aRuns))
+            aWall = anEntry["wall"]["median"]
+            anEntry["throughput"] = aStream.Size() / aWall if aWall > 0 else None
+            # Same shape as the timings, so that compare reads both alike
+            for aMetric, aValue in anAllocations.items():
+                anEntry[aMetric] = {"median": aValue, "p95": aValue}
+            print(f"{aWall * 1000:.2f} ms, {anEntry['throughput'] or 0:,.0f} features/s, "
+                  f"{anAllocations['allocBlocks']} blocks, {anAllocations['allocPeak'] / 1024:,.0f} KiB peak")
+            aResults.append(anEntry)
+
+    return {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpus": os.cpu_count(),
+        },
+        "repeats": theRepeats,
+        "warmup": theWarmup,
+        "results": aResults,
+    }
+
+def Compare(theBaseline: dict, theResults: dict, theThreshold: float = DEFAULT_THRESHOLD):
+    """Returns the list of (stream, stage, metric, baseline, current) regressions."""
+    aBaseline = {(i["stream"], i["stage"]): i for i in theBaseline["results"]}
+    aRegressions = []
+    for anEntry in theResults["results"]:
+        aKey = (anEntry["stream"], anEntry["stage"])
+        aBase = aBaseline.get(aKey)
+        if aBase is None:
+            print("NEW  ", *aKey)
+            continue
+        for aMetric, aMinDelta in MIN_DELTAS.items():
+            if aMetric not in anEntry or aMetric not in aBase:
+                continue
+            aBaseValue = aBase[aMetric]["median"]
+            aValue = anEntry[aMetric]["median"]
+            aDelta = aValue - aBaseValue
+            aChange = aDelta / aBaseValue if aBaseValue else 0.0
+            anIsRegression = aChange > theThreshold and aDelta > aMinDelta
+            if anIsRegression or (aChange < -theThreshold and -aDelta > aMinDelta):
+                print("SLOW " if anIsRegression else "FAST ", *aKey, aMetric,
+                      f"{aBaseValue:.6g} -> {aValue:.6g} ({aChange:+.1%})")
+            if anIsRegression:
+                aRegressions.append(aKey + (aMetric, aBaseValue, aValue))
+
+    for aKey in aBaseline.keys() - {(i["stream"], i["stage"]) for i in theResults["results"]}:
+        print("GONE ", *aKey)
+    return aRegressions
+
+def _ParseList(theValue: str, theType):
+    return [theType(i.strip()) for i in theValue.split(",") if i.strip()]
+
+def main(theArgs):
+    anArgs = list(theArgs)
+    aCommand = anArgs.pop(0)
+    if aCommand == "run":
+        aSizes = [1000, 10000]
+        aDuplications = [0.0, 0.5, 0.9]
+        anIssueRatio = 0.25
+        aStages = list(STAGES)
+        aRepeats = 5
+        aWarmup = 1
+        aSeed = 0
+        anOutput = "report_benchmark_results.json"
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-n":
+                aSizes = _ParseList(anArgs.pop(0), int)
+            elif anOption == "-d":
+                aDuplications = _ParseList(anArgs.pop(0), float)
+            elif anOption == "-i":
+                anIssueRatio = float(anArgs.pop(0))
+            elif anOption == "-s":
+                aStages = _ParseList(anArgs.pop(0), str)
+            elif anOption == "-r":
+                aRepeats = int(anArgs.pop(0))
+            elif anOption == "--warmup":
+                aWarmup = int(anArgs.pop(0))
+            elif anOption == "--seed":
+                aSeed = int(anArgs.pop(0))
+            elif anOption == "-o":
+                anOutput = os.path.abspath(anArgs.pop(0))
+            else:
+                raise ValueError(anOption)
+        anUnknown = [i for i in aStages if i not in STAGES]
+        if (anUnknown or aRepeats < 1 or anIssueRatio < 0
+            or any(i < 1 for i in aSizes) or any(i < 0 or i >= 1 for i in aDuplications)):
+            raise ValueError(", ".join(anUnknown))
+
+        aStreams = [Stream(n, d, anIssueRatio, aSeed) for n in aSizes for d in aDuplications]
+        aResults = Run(aStreams, aStages, aRepeats, aWarmup)
+        aResults["seed"] = aSeed
+        with open(anOutput, "w", encoding="utf-8") as f:
+            json.dump(aResults, f, indent=4)
+        print("Results written to ", anOutput, sep="")
+        return 0
+
+    if aCommand == "compare":
+        aThreshold = DEFAULT_THRESHOLD
+        aPaths = []
+        while anArgs:
+            anOption = anArgs.pop(0)
+            if anOption == "-t":
+                aThreshold = float(anArgs.pop(0))
+            else:
+                aPaths.append(anOption)
+        if len(aPaths) != 2:
+            raise ValueError(" ".join(aPaths))
+
+        with open(aPaths[0], "r", encoding="utf-8") as f:
+            aBaseline = json.load(f)
+        with open(aPaths[1], "r", encoding="utf-8") as f:
+            aResults = json.load(f)
+        aRegressions = Compare(aBaseline, aResults, aThreshold)
+        print(len(aRegressions), " regression(s) above ", f"{aThreshold:.0%}", sep="")
+        return 1 if aRegressions else 0
+
+    raise ValueError(aCommand)
+
+if __name__ == "__main__":
+    if (len(sys.argv) == 1
+        or sys.argv[1] == "-?" or sys.argv[1] == "/?"
+        or sys.argv[1] == "-h" or sys.argv[1] == "--help"):
+        PrintUsage()
+        sys.exit()
+
+    try:
+        sys.exit(main(sys.argv[1:]))
+    except (IndexError, ValueError):
+        print("Invalid arguments. Please use \"-h\" or \"--help\" for usage information.")
+        sys.exit(1)
@@ -1,11 +1,23 @@
 # app.py
-from flask import Flask, render_template, request, send_from_directory, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context
 from flask_cors import CORS
 import subprocess
 from pathlib import Path
 import os
 import json
 import base64
+import mimetypes
+import shutil
+import threading
+import time
+import uuid
+
+from worker_pool import WorkerPool, WorkerError
+from jobs import JobManager, QueueFullError
+from result_cache import ResultCache, file_sha256
+from model_files import build_manifest, content_hash, find_encoded_variant, is_encoded_variant, stream_tar, stream_zip
+from werkzeug.security import safe_join
+from werkzeug.utils import secure_filename
 
 app = Flask(__name__)
 CORS(app, resources={r"/*": {"origins": "*"}})
@@ -16,9 +28,40 @@ UPLOAD_FOLDER.mkdir(parents=True, exist_ok=True)
 app.config["UPLOAD_FOLDER"] = str(UPLOAD_FOLDER)
 
 PYTHON_EXE = r"C:\MTK\python_pilot\.venv\Scripts\python.exe"
-FEATURE_SCRIPT = r"C:\MTK\python\machining\feature_recognizer\feature_from_path.py"
-DFM_SCRIPT = r"C:\MTK\python\machining\dfm_analyzer\dfm_from_path.py"
-CONVERTER_SCRIPT = r"C:\MTK\python\MTKConverter\MTKConverter.py"
+PIPELINE_SCRIPT = r"C:\MTK\python\MTKConverter\MTKConverter_Pipeline.py"
+WORKER_SCRIPT = r"C:\MTK\python\MTKConverter\MTKConverter_Worker.py"
+
+# Pre-warmed MTK workers; MTK_POOL_SIZE=0 falls back to one interpreter per upload
+POOL_SIZE = int(os.getenv("MTK_POOL_SIZE", max(1, (os.cpu_count() or 2) // 2)))
+WORKER_MAX_JOBS = int(os.getenv("MTK_WORKER_MAX_JOBS", 50))
+WORKER_MAX_RSS_MB = int(os.getenv("MTK_WORKER_MAX_RSS_MB", 4096))
+# Seconds a conversion may take before its worker is killed and replaced, 0 for no limit
+WORKER_JOB_TIMEOUT = int(os.getenv("MTK_JOB_TIMEOUT", 1800))
+
+# Asynchronous jobs: how many run at once and how many may wait before uploads are refused
+JOB_CONCURRENCY = int(os.getenv("MTK_JOB_CONCURRENCY", max(1, POOL_SIZE)))
+JOB_QUEUE_SIZE = int(os.getenv("MTK_JOB_QUEUE_SIZE", 32))
+JOB_RETRY_AFTER = int(os.getenv("MTK_JOB_RETRY_AFTER", 30))
+
+# Converted results are reused for identical uploads; MTK_CACHE=0 disables the cache
+CACHE_ENABLED = os.getenv("MTK_CACHE", "1") != "0"
+CACHE_FOLDER = UPLOAD_FOLDER / ".cache"
+CACHE_MAX_MB = int(os.getenv("MTK_CACHE_MAX_MB", 2048))
+CACHE_MAX_ENTRIES = int(os.getenv("MTK_CACHE_MAX_ENTRIES", 200))
+
+# process_data.json schema; 2 is the compact schema, for viewers that read it
+REPORT_VERSION = int(os.getenv("MTK_REPORT_VERSION", 1))
+# Also write process_data.cbor, served instead of the JSON to clients asking for application/cbor
+REPORT_CBOR = os.getenv("MTK_REPORT_CBOR", "1") != "0"
+# Run the DFM analyzers of a machining solid on parallel threads; the report is the same
+CONCURRENT_DFM = os.getenv("MTK_CONCURRENT_DFM", "0") != "0"
+# Wall thickness results are kept per solid and reused for unchanged solids of other uploads; MTK_WT_CACHE=0 disables it
+WT_CACHE_FOLDER = UPLOAD_FOLDER / ".wt_cache" if os.getenv("MTK_WT_CACHE", "1") != "0" else None
+
+# Everything besides the file and process that changes the pipeline output
+PIPELINE_PARAMS = {"screenshot": True, "reportVersion": REPORT_VERSION, "cbor": REPORT_CBOR, "measurements": True}
+
+PROCESSES = ("machining_milling", "machining_turning", "molding", "sheet_metal", "wall_thickness")
 
 IS_RAILWAY = os.getenv("RAILWAY_ENVIRONMENT") is not None
 RAILWAY_DOMAIN = os.getenv("RAILWAY_PUBLIC_DOMAIN", "")
@@ -28,57 +71,183 @@ def get_base_url():
         return f"https://{RAILWAY_DOMAIN}"
     return "http://127.0.0.1:5000"
 
-def read_measurements_from_json(converted_folder: str) -> dict:
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+def get_worker_pool():
+    global _worker_pool
+    with _worker_pool_lock:
+        if _worker_pool is None:
+            _worker_pool = WorkerPool(PYTHON_EXE, WORKER_SCRIPT, POOL_SIZE,
+                                      WORKER_MAX_JOBS, WORKER_MAX_RSS_MB, WORKER_JOB_TIMEOUT)
+        return _worker_pool
+
+def execute_pipeline(source, target, process="machining_milling"):
     """
-    Prefer process_metrics.json (written by feature_recognizer),
-    fallback to process_data.json variants.
+    Runs the analysis pipeline without the cache and returns a dict with the
+    return code ("rc"), the console output ("output") and per-stage durations
+    ("timings").
     """
-    metrics_path = Path(converted_folder) / "process_metrics.json"
-    if metrics_path.exists():
+    if POOL_SIZE <= 0:
+        started = time.perf_counter()
         try:
-            with open(metrics_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            m = data.get("measurements", {})
-            return {
-                "volume": (m.get("volume") or {}).get("value", "N/A"),
-                "surface_area": (m.get("surfaceArea") or {}).get("value", "N/A"),
-                "centroid": (m.get("centroid") or {}).get("value", "N/A"),
-            }
-        except Exception as e:
-            print(f"[WARNING] Failed to parse {metrics_path}: {e}")
-
-    json_path = Path(converted_folder) / "process_data.json"
-    if not json_path.exists():
-        print(f"[INFO] process_data.json not found at {json_path}")
-        return {"volume": "N/A", "surface_area": "N/A", "centroid": "N/A"}
+            output = subprocess.check_output([
+                PYTHON_EXE, PIPELINE_SCRIPT,
+                str(source), str(target), process,
+                "--report-version", str(REPORT_VERSION)
+            ] + (["--cbor"] if REPORT_CBOR else []) + (["--concurrent-dfm"] if CONCURRENT_DFM else [])
+              + (["--wt-cache", str(WT_CACHE_FOLDER)] if WT_CACHE_FOLDER else []),
+                text=True, stderr=subprocess.STDOUT, timeout=WORKER_JOB_TIMEOUT or None)
+            rc = 0
+        except subprocess.CalledProcessError as e:
+            rc, output = e.returncode, e.output
+        except subprocess.TimeoutExpired as e:
+            rc, output = None, f"Pipeline didn't finish within {e.timeout} s"
+        return {"rc": rc, "output": output, "timings": {"pipeline": time.perf_counter() - started}}
 
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # Variant A: data["parts"][0]["measurements"] (if some pipeline still writes it)
-        if isinstance(data, dict) and "parts" in data and len(data["parts"]) > 0:
-            meas = data["parts"][0].get("measurements", {})
-            if meas:
-                return {
-                    "volume": (meas.get("volume") or {}).get("value", "N/A"),
-                    "surface_area": (meas.get("surfaceArea") or {}).get("value", "N/A"),
-                    "centroid": (meas.get("centroid") or {}).get("value", "N/A"),
-                }
-
-        # Variant B: top-level measurements dict
-        if "measurements" in data:
-            meas = data.get("measurements", {})
-            return {
-                "volume": (meas.get("volume") or {}).get("value", "N/A"),
-                "surface_area": (meas.get("surfaceArea") or {}).get("value", "N/A"),
-                "centroid": (meas.get("centroid") or {}).get("value", "N/A"),
-            }
+        reply = get_worker_pool().run(source, target, process, report_version=REPORT_VERSION, cbor=REPORT_CBOR,
+                                      concurrent_dfm=CONCURRENT_DFM, wall_thickness_cache=WT_CACHE_FOLDER)
+    except WorkerError as e:
+        return {"rc": None, "output": str(e), "timings": {}}
+    return {"rc": reply.get("rc"), "output": reply.get("output", ""), "timings": reply.get("timings", {})}
+
+_result_cache = None
+_toolkit_version = None
+_cache_lock = threading.Lock()
+# Separate from _cache_lock, so that the version query doesn't hold up get_result_cache()
+_toolkit_version_lock = threading.Lock()
+
+def get_result_cache():
+    global _result_cache
+    with _cache_lock:
+        if _result_cache is None:
+            _result_cache = ResultCache(CACHE_FOLDER, CACHE_MAX_MB * 1024 * 1024, CACHE_MAX_ENTRIES)
+        return _result_cache
+
+def get_toolkit_version():
+    """
+    Version of the toolkit installed next to PYTHON_EXE, queried once.
+    """
+    global _toolkit_version
+    with _toolkit_version_lock:
+        if _toolkit_version is None:
+            _toolkit_version = os.getenv("MTK_TOOLKIT_VERSION")
+        if _toolkit_version is None:
+            try:
+                _toolkit_version = subprocess.check_output(
+                    [PYTHON_EXE, PIPELINE_SCRIPT, "--version"], text=True, timeout=120).strip()
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"[WARNING] Failed to query toolkit version, caching disabled: {e}")
+                _toolkit_version = ""
+        return _toolkit_version
+
+def normalize_process(process):
+    """
+    The process list as the converter reads it: names stripped, empty and
+    repeated ones dropped, joined by commas.
+    """
+    names = []
+    for name in process.split(","):
+        name = name.strip()
+        if name and name not in names:
+            names.append(name)
+    return ",".join(names)
+
+def run_pipeline(source, target, process="machining_milling"):
+    """
+    Returns the cached result for an identical upload if there is one, otherwise
+    runs the pipeline and caches a successful result. The returned dict is the
+    same as for execute_pipeline(), with "cached" set on a hit.
+    """
+    toolkit_version = get_toolkit_version() if CACHE_ENABLED else None
+    if not toolkit_version:
+        return execute_pipeline(source, target, process)
+
+    started = time.perf_counter()
+    cache = get_result_cache()
+    key = cache.make_key(file_sha256(source), normalize_process(process), PIPELINE_PARAMS, toolkit_version)
+    model_name = Path(source).stem
+    entry = cache.restore(key, target, model_name)
+    if entry is not None:
+        print(f"[INFO] Cache hit for {Path(source).name} ({key[:12]})")
+        return {
+            "rc": 0,
+            "output": f"[Reused cached result {key[:12]}]\n" + entry.get("output", ""),
+            "timings": {"cache": time.perf_counter() - started},
+            "cached": True,
+        }
+
+    result = execute_pipeline(source, target, process)
+    if result["rc"] == 0:
+        try:
+            cache.store(key, target, model_name, result["output"])
+        except OSError as e:
+            print(f"[WARNING] Failed to cache result for {Path(source).name}: {e}")
+    return result
+
+_job_manager = None
+_job_manager_lock = threading.Lock()
+
+def get_job_manager():
+    global _job_manager
+    with _job_manager_lock:
+        if _job_manager is None:
+            _job_manager = JobManager(lambda job: run_pipeline(job.source, job.target, job.process),
+                                      JOB_CONCURRENCY, JOB_QUEUE_SIZE)
+        return _job_manager
+
+def save_upload(file):
+    """
+    Saves an uploaded CAD file and returns (saved path, converted folder).
+    Every upload gets a folder of its own under a fresh id, and a converted
+    folder named after the file and that id, so that uploads of the same name
+    never share either. The file name is sanitized.
+    """
+    upload_id = uuid.uuid4().hex[:12]
+    filename = secure_filename(file.filename or "") or "upload"
+    upload_dir = UPLOAD_FOLDER / upload_id
+    upload_dir.mkdir()
+    save_path = upload_dir / filename
+    file.save(str(save_path))
 
-    except Exception as e:
-        print(f"[ERROR] Failed to read measurements from process_data.json: {e}")
+    converted_folder = str(UPLOAD_FOLDER / f"{save_path.stem}_{upload_id}_mtk")
+    return save_path, converted_folder
+
+def discard_upload(save_path):
+    """Removes an upload saved by save_upload() that won't be converted."""
+    shutil.rmtree(Path(save_path).parent, ignore_errors=True)
+
+def get_viewer_url(process, model_name, converted_folder):
+    return (
+        f"http://localhost:5173/mtk-explorer/viewer/{process}/{model_name}"
+        f"?server={get_base_url()}/uploads/{os.path.basename(converted_folder)}"
+    )
 
-    return {"volume": "N/A", "surface_area": "N/A", "centroid": "N/A"}
+def read_measurements_from_json(converted_folder: str) -> dict:
+    """
+    Reads the whole-part measurements of the first part from process_data.json,
+    where the pipeline writes them into every part entry.
+    """
+    result = {"volume": "N/A", "surface_area": "N/A", "centroid": "N/A"}
+    json_path = Path(converted_folder) / "process_data.json"
+    try:
+        with open(json_path, "r", encoding="utf-8") as f:
+            parts = json.load(f).get("parts") or [{}]
+    except (OSError, ValueError) as e:
+        print(f"[WARNING] Failed to read {json_path}: {e}")
+        return result
+
+    meas = parts[0].get("measurements", {})
+    for key, name in (("volume", "volume"), ("surfaceArea", "surface_area"), ("centroid", "centroid")):
+        value = (meas.get(key) or {}).get("value")
+        if value is None:
+            continue
+        # Version 2 reports write the centroid as [x, y, z]
+        if isinstance(value, list):
+            value = "(" + ", ".join(f"{v:.3f}" for v in value) + ")"
+        result[name] = value
+    return result
 
 @app.route('/')
 def index():
@@ -90,57 +259,20 @@ def analyze():
     if not file:
         return "No file uploaded", 400
 
-    save_path = (UPLOAD_FOLDER / file.filename).resolve()
-    file.save(str(save_path))
-    stem = save_path.stem
-
-    converted_folder = str(save_path)
-    for ext in [".stp", ".STP", ".step", ".STEP"]:
-        if str(save_path).lower().endswith(ext.lower()):
-            converted_folder = str(save_path)[: -len(ext)] + "_mtk"
-            break
+    save_path, converted_folder = save_upload(file)
 
     print("\n" + "="*60)
-    print("[INFO] Running MTK Converter...")
+    print("[INFO] Running MTK analysis pipeline...")
     print("="*60)
-    try:
-        converter_out = subprocess.check_output([
-            PYTHON_EXE, CONVERTER_SCRIPT,
-            "-i", str(save_path),
-            "-p", "machining_milling",
-            "-e", converted_folder
-        ], text=True, stderr=subprocess.STDOUT)
-        print("[SUCCESS] MTK Converter completed")
-    except subprocess.CalledProcessError as e:
-        converter_out = f"[MTK Converter error]\n{e.output}"
-        print(f"[ERROR] MTK Converter failed: {e.output}")
-
-    print("\n" + "="*60)
-    print("[INFO] Running Feature Recognizer...")
-    print("="*60)
-    try:
-        # feature_from_path defaults to "milling" when operation omitted
-        features_out = subprocess.check_output(
-            [PYTHON_EXE, FEATURE_SCRIPT, str(save_path)],
-            text=True, stderr=subprocess.STDOUT
-        )
-        print("[SUCCESS] Feature Recognizer completed")
-    except subprocess.CalledProcessError as e:
-        features_out = f"[Feature recognizer error]\n{e.output}"
-        print(f"[ERROR] Feature Recognizer failed: {e.output}")
-
-    print("\n" + "="*60)
-    print("[INFO] Running DFM Analyzer...")
-    print("="*60)
-    try:
-        dfm_out = subprocess.check_output(
-            [PYTHON_EXE, DFM_SCRIPT, str(save_path)],
-            text=True, stderr=subprocess.STDOUT
-        )
-        print("[SUCCESS] DFM Analyzer completed")
-    except subprocess.CalledProcessError as e:
-        dfm_out = f"[DFM error]\n{e.output}"
-        print(f"[ERROR] DFM Analyzer failed: {e.output}")
+    # The pipeline imports the model once and produces the converted folder,
+    # the feature/DFM summaries and the report with the part measurements
+    result = run_pipeline(save_path, converted_folder, "machining_milling")
+    analysis_out = result["output"]
+    if result["rc"] == 0:
+        print("[SUCCESS] MTK analysis pipeline completed")
+    else:
+        analysis_out = f"[MTK analysis error]\n{analysis_out}"
+        print(f"[ERROR] MTK analysis pipeline failed: {analysis_out}")
 
     print("\n" + "="*60)
     print("[INFO] Reading measurements from JSON...")
@@ -154,21 +286,12 @@ def analyze():
 
     process = "machining_milling"
     model_name = Path(save_path).stem
-    base_url = get_base_url()
-
-    viewer_url = (
-        f"http://localhost:5173/mtk-explorer/viewer/{process}/{model_name}"
-        f"?server={base_url}/uploads/{model_name}_mtk"
-    )
+    viewer_url = get_viewer_url(process, model_name, converted_folder)
 
     html = f"""
     <h2>Analysis complete for: {file.filename}</h2>
-    <h3>MTK Converter Output</h3>
-    <pre style="white-space: pre-wrap;">{converter_out}</pre>
-    <h3>Feature Recognition</h3>
-    <pre style="white-space: pre-wrap;">{features_out}</pre>
-    <h3>DFM Analysis</h3>
-    <pre style="white-space: pre-wrap;">{dfm_out}</pre>
+    <h3>Analysis Output</h3>
+    <pre style="white-space: pre-wrap;">{analysis_out}</pre>
     <h3>Feature Measurements</h3>
     <pre>Volume (mm³): {meas.get('volume')} | Surface Area (mm²): {meas.get('surface_area')} | Centroid: {meas.get('centroid')}</pre>
     <p><strong>Converted model folder:</strong> {converted_folder}</p>
@@ -183,19 +306,114 @@ def analyze():
     """
     return html
 
+@app.route("/api/jobs", methods=["POST"])
+def submit_job():
+    file = request.files.get("cad_file")
+    if not file:
+        return jsonify({"error": "No file uploaded"}), 400
+
+    # A comma-separated list runs several processes on one import
+    process = normalize_process(request.form.get("process", "machining_milling"))
+    if not process:
+        return jsonify({"error": "No process given"}), 400
+    unknown = [p for p in process.split(",") if p not in PROCESSES]
+    if unknown:
+        return jsonify({"error": f"Unknown process: {', '.join(unknown)}"}), 400
+
+    save_path, converted_folder = save_upload(file)
+    try:
+        job = get_job_manager().submit(save_path, converted_folder, process)
+    except QueueFullError:
+        discard_upload(save_path)
+        print(f"[WARNING] Job queue full, refusing {file.filename}")
+        response = jsonify({"error": "Too many jobs queued, retry later"})
+        response.headers["Retry-After"] = str(JOB_RETRY_AFTER)
+        return response, 503
+
+    print(f"[INFO] Queued job {job.id} for {file.filename} ({process})")
+    status_url = f"/api/jobs/{job.id}"
+    response = jsonify({"jobId": job.id, "state": job.state, "statusUrl": status_url})
+    response.headers["Location"] = status_url
+    return response, 202
+
+@app.route("/api/jobs/<job_id>", methods=["GET"])
+def job_status(job_id):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return jsonify({"error": f"Job not found: {job_id}"}), 404
+
+    data = job.to_dict()
+    if job.state == "succeeded":
+        folder = os.path.basename(job.target)
+        model_name = Path(job.source).stem
+        data["result"] = {
+            "folder": folder,
+            "processData": f"/uploads/{folder}/process_data.json",
+            "manifest": f"/api/models/{folder}/manifest",
+            "archive": f"/api/models/{folder}/archive",
+            "viewerUrl": get_viewer_url(job.process, model_name, job.target),
+        }
+    return jsonify(data)
+
+@app.route("/api/cache/stats", methods=["GET"])
+def cache_stats():
+    if not CACHE_ENABLED:
+        return jsonify({"enabled": False})
+    stats = get_result_cache().stats()
+    stats["enabled"] = True
+    return jsonify(stats)
+
 @app.route("/uploads/<path:subpath>")
 def serve_uploads(subpath):
-    full_path = os.path.join(app.config["UPLOAD_FOLDER"], subpath)
-    folder = os.path.dirname(full_path)
-    file = os.path.basename(full_path)
-
-    if not os.path.exists(full_path):
+    """
+    Serves converted files with a strong ETag (the content hash), Last-Modified
+    and Range support. URLs carrying the hash as `v` (see the manifest) are
+    immutable; anything else must be revalidated. A precompressed .br/.gz
+    variant written at export time is served when the client accepts it and
+    no byte range was asked for. Reports are served as CBOR instead of JSON
+    to clients preferring application/cbor.
+    """
+    full_path = safe_join(app.config["UPLOAD_FOLDER"], subpath)
+    if full_path is None or not os.path.isfile(full_path):
         return jsonify({"error": f"File not found: {subpath}"}), 404
 
-    if file.endswith(".json"):
-        return send_file(full_path, mimetype="application/json")
-
-    return send_from_directory(folder, file)
+    negotiated = full_path.endswith("process_data.json")
+    if negotiated:
+        cbor_path = full_path[: -len(".json")] + ".cbor"
+        best = request.accept_mimetypes.best_match(["application/json", "application/cbor"])
+        if best == "application/cbor" and os.path.isfile(cbor_path):
+            full_path = cbor_path
+
+    etag = content_hash(full_path)
+    mimetype = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+    if full_path.endswith(".json"):
+        mimetype = "application/json"
+    elif full_path.endswith(".cbor"):
+        mimetype = "application/cbor"
+
+    send_path, encoding = full_path, None
+    if "Range" not in request.headers:
+        variant, encoding = find_encoded_variant(full_path, request.accept_encodings)
+        if variant is not None:
+            send_path = variant
+
+    response = send_file(
+        send_path,
+        mimetype=mimetype,
+        conditional=True,
+        etag=etag if encoding is None else f"{etag}-{encoding}",
+        last_modified=os.path.getmtime(full_path),
+    )
+    if encoding is not None:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    if negotiated:
+        response.vary.add("Accept")
+    if request.args.get("v") == etag:
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    else:
+        response.headers["Cache-Control"] = "no-cache"
+    return response
 
 @app.route("/api/listModels", methods=["GET"])
 def list_models():
@@ -210,6 +428,52 @@ def list_models():
         print(f"[ERROR] listModels failed: {e}")
         return jsonify({"error": str(e)}), 500
 
+def resolve_model_folder(folder):
+    """
+    Returns the absolute path of a converted model folder directly under the
+    upload folder, or None if the name doesn't designate one.
+    """
+    upload_root = os.path.realpath(app.config["UPLOAD_FOLDER"])
+    base_dir = os.path.realpath(os.path.join(upload_root, folder))
+    if os.path.dirname(base_dir) != upload_root or not os.path.isdir(base_dir):
+        return None
+    return base_dir
+
+@app.route("/api/models/<folder>/manifest", methods=["GET"])
+def model_manifest(folder):
+    base_dir = resolve_model_folder(folder)
+    if base_dir is None:
+        return jsonify({"error": f"Folder not found: {folder}"}), 404
+
+    files = build_manifest(base_dir)
+    for entry in files:
+        entry["url"] = f"/uploads/{folder}/{entry['path']}?v={entry['sha256']}"
+    return jsonify({
+        "folder": folder,
+        "totalSize": sum(entry["size"] for entry in files),
+        "files": files,
+    })
+
+@app.route("/api/models/<folder>/archive", methods=["GET"])
+def model_archive(folder):
+    base_dir = resolve_model_folder(folder)
+    if base_dir is None:
+        return jsonify({"error": f"Folder not found: {folder}"}), 404
+
+    archive_format = request.args.get("format", "tar")
+    if archive_format == "tar":
+        stream, mimetype = stream_tar, "application/x-tar"
+    elif archive_format == "zip":
+        stream, mimetype = stream_zip, "application/zip"
+    else:
+        return jsonify({"error": f"Unsupported archive format: {archive_format}"}), 400
+
+    files = build_manifest(base_dir)
+    response = Response(stream_with_context(stream(base_dir, files)), mimetype=mimetype)
+    response.headers["Content-Disposition"] = f'attachment; filename="{folder}.{archive_format}"'
+    return response
+
+# Superseded by /api/models/<folder>/manifest and /archive, kept for existing clients
 @app.route("/api/getAllFiles", methods=["GET"])
 def get_all_files():
     folder = request.args.get("folder")
@@ -224,6 +488,8 @@ def get_all_files():
     for root, _, files in os.walk(base_dir):
         for fname in files:
             full_path = os.path.join(root, fname)
+            if is_encoded_variant(full_path):
+                continue
             rel_path = os.path.relpath(full_path, base_dir).replace("\\", "/")
             with open(full_path, "rb") as f:
                 encoded = base64.b64encode(f.read()).decode("utf-8")
@@ -241,4 +507,7 @@ if __name__ == "__main__":
     print(f"Flask server running in {env_info} mode with full CORS enabled...")
     if IS_RAILWAY:
         print(f"   Public domain: {RAILWAY_DOMAIN}")
+    # Start the workers up front, in the reloader child only when debugging
+    if POOL_SIZE > 0 and os.getenv("WERKZEUG_RUN_MAIN") == "true":
+        get_worker_pool()
     app.run(host="0.0.0.0", port=int(os.getenv("PORT", 5000)), debug=True)
\ No newline at end of file
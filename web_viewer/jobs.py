@@ -0,0 +1,114 @@
+# jobs.py
+import queue
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+
+
+class QueueFullError(RuntimeError):
+    pass
+
+
+class Job:
+    def __init__(self, source, target, process):
+        self.id = uuid.uuid4().hex
+        self.source = str(source)
+        self.target = str(target)
+        self.process = process
+        self.state = "queued"
+        self.submitted_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.rc = None
+        self.output = ""
+        self.timings = {}
+        self.cached = False
+        self.error = None
+
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "state": self.state,
+            "process": self.process,
+            "submittedAt": self.submitted_at,
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+            "timings": dict(self.timings),
+        }
+        if self.started_at is not None:
+            data["timings"]["queued"] = self.started_at - self.submitted_at
+        if self.finished_at is not None:
+            data["timings"]["total"] = self.finished_at - self.started_at
+            data["rc"] = self.rc
+            data["cached"] = self.cached
+            data["output"] = self.output
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class JobManager:
+    """
+    Bounded queue of analysis jobs drained by a fixed number of dispatcher threads.
+
+    `runner(job)` does the actual work and returns a dict with "rc", "output"
+    and "timings". submit() raises QueueFullError instead of blocking when the
+    queue is at capacity so the caller can ask the client to retry later.
+    Finished jobs are kept for status queries, oldest dropped first.
+    """
+
+    def __init__(self, runner, concurrency=2, max_queued=32, max_finished=1000):
+        self.runner = runner
+        self.max_finished = max_finished
+        self._queue = queue.Queue(maxsize=max(1, max_queued))
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        for slot in range(max(1, concurrency)):
+            thread = threading.Thread(target=self._dispatch, daemon=True, name=f"mtk-job-{slot}")
+            thread.start()
+
+    def submit(self, source, target, process="machining_milling"):
+        job = Job(source, target, process)
+        with self._lock:
+            self._jobs[job.id] = job
+        try:
+            self._queue.put_nowait(job)
+        except queue.Full:
+            with self._lock:
+                del self._jobs[job.id]
+            raise QueueFullError("Job queue is full")
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def queued_count(self):
+        return self._queue.qsize()
+
+    def _dispatch(self):
+        while True:
+            job = self._queue.get()
+            job.state = "running"
+            job.started_at = time.time()
+            try:
+                result = self.runner(job)
+                job.rc = result.get("rc")
+                job.output = result.get("output", "")
+                job.timings.update(result.get("timings") or {})
+                job.cached = bool(result.get("cached"))
+                job.state = "succeeded" if job.rc == 0 else "failed"
+            except Exception as e:
+                job.error = str(e)
+                job.output = traceback.format_exc()
+                job.state = "failed"
+            job.finished_at = time.time()
+            self._forget_old_jobs()
+
+    def _forget_old_jobs(self):
+        with self._lock:
+            finished = [j.id for j in self._jobs.values() if j.finished_at is not None]
+            for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+                del self._jobs[job_id]
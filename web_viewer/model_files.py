@@ -0,0 +1,166 @@
+# model_files.py
+import hashlib
+import os
+import tarfile
+import threading
+import time
+import zipfile
+
+CHUNK_SIZE = 256 * 1024
+
+# Precompressed variants written next to the exported files, by preference
+ENCODED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+_hash_cache = {}  # path -> (mtime_ns, size, sha256)
+_hash_lock = threading.Lock()
+
+
+def content_hash(path):
+    """
+    SHA-256 of a file, remembered until its size or modification time changes.
+    """
+    stat = os.stat(path)
+    with _hash_lock:
+        cached = _hash_cache.get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _hash_lock:
+        _hash_cache[path] = (stat.st_mtime_ns, stat.st_size, value)
+    return value
+
+
+def is_encoded_variant(path):
+    """True for a .br/.gz file sitting next to the file it was compressed from."""
+    for _, suffix in ENCODED_VARIANTS:
+        if path.endswith(suffix) and os.path.isfile(path[: -len(suffix)]):
+            return True
+    return False
+
+
+def find_encoded_variant(path, accept_encodings):
+    """
+    Returns (variant path, content encoding) for the best precompressed copy of
+    `path` the client accepts, or (None, None). Variants older than the file
+    itself are ignored.
+    """
+    mtime = os.path.getmtime(path)
+    for encoding, suffix in ENCODED_VARIANTS:
+        if not accept_encodings[encoding]:
+            continue
+        variant = path + suffix
+        if os.path.isfile(variant) and os.path.getmtime(variant) >= mtime:
+            return variant, encoding
+    return None, None
+
+
+def _fetch_order(rel_path):
+    # Scenegraphs first so the viewer can build the tree while the geometry
+    # blobs are still on their way, then the report, then everything else
+    name = os.path.basename(rel_path)
+    if name == "scenegraph.mtkweb":
+        return 0, rel_path
+    if name.endswith(".json"):
+        return 1, rel_path
+    return 2, rel_path
+
+
+def build_manifest(base_dir):
+    """
+    Lists the files of a converted model folder as dicts with the relative
+    path, size and SHA-256, in the order a client should fetch them.
+    """
+    entries = []
+    for root, _, files in os.walk(base_dir):
+        for fname in files:
+            full_path = os.path.join(root, fname)
+            if is_encoded_variant(full_path):
+                continue
+            entries.append({
+                "path": os.path.relpath(full_path, base_dir).replace("\\", "/"),
+                "size": os.path.getsize(full_path),
+                "sha256": content_hash(full_path),
+            })
+    entries.sort(key=lambda e: _fetch_order(e["path"]))
+    return entries
+
+
+def _read_chunks(path):
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            yield chunk
+
+
+def stream_tar(base_dir, entries):
+    """Yields an uncompressed tar archive of `entries` chunk by chunk."""
+    for entry in entries:
+        full_path = os.path.join(base_dir, entry["path"])
+        info = tarfile.TarInfo(entry["path"])
+        info.size = entry["size"]
+        info.mtime = int(os.path.getmtime(full_path))
+        info.mode = 0o644
+        yield info.tobuf(format=tarfile.PAX_FORMAT)
+
+        for chunk in _read_chunks(full_path):
+            yield chunk
+        remainder = entry["size"] % tarfile.BLOCKSIZE
+        if remainder:
+            yield tarfile.NUL * (tarfile.BLOCKSIZE - remainder)
+
+    # End-of-archive marker: two zero blocks, padded to a full record
+    yield tarfile.NUL * tarfile.RECORDSIZE
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object collecting what zipfile writes."""
+
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def stream_zip(base_dir, entries):
+    """
+    Yields a zip archive of `entries` chunk by chunk. JSON is deflated, the
+    mtkweb buffers are stored as is.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w") as archive:
+        for entry in entries:
+            full_path = os.path.join(base_dir, entry["path"])
+            info = zipfile.ZipInfo(entry["path"], time.localtime(os.path.getmtime(full_path))[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED if entry["path"].endswith(".json") else zipfile.ZIP_STORED
+            info.file_size = entry["size"]
+            with archive.open(info, "w") as dest:
+                for chunk in _read_chunks(full_path):
+                    dest.write(chunk)
+                    data = sink.take()
+                    if data:
+                        yield data
+            data = sink.take()
+            if data:
+                yield data
+    data = sink.take()
+    if data:
+        yield data
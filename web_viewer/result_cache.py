@@ -0,0 +1,164 @@
+# result_cache.py
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+META_FILE = "cache_entry.json"
+MODEL_SUFFIXES = (".mtkweb", "_extra.mtkweb", "_unfolded.mtkweb")
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _tree_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for fname in files:
+            total += os.path.getsize(os.path.join(root, fname))
+    return total
+
+
+class ResultCache:
+    """
+    Content-addressed store of converter outputs.
+
+    Entries are keyed by the SHA-256 of the uploaded file together with the
+    process, the pipeline parameters and the toolkit version, and hold a copy
+    of the `_mtk` folder. The least recently used entries are evicted once the
+    cache holds more than `max_entries` entries or `max_bytes` bytes.
+    """
+
+    def __init__(self, root, max_bytes=2 * 1024 ** 3, max_entries=200):
+        self.root = str(root)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> {"size", "modelName", "lastUsed", "output"}
+        os.makedirs(self.root, exist_ok=True)
+        self._load()
+
+    @staticmethod
+    def make_key(file_hash, process, params, toolkit_version):
+        payload = json.dumps({
+            "file": file_hash,
+            "process": process,
+            "params": params,
+            "toolkit": toolkit_version,
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self):
+        entries = []
+        for key in os.listdir(self.root):
+            if key.startswith(".tmp-"):
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+                continue
+            meta_path = os.path.join(self.root, key, META_FILE)
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    entries.append((key, json.load(f)))
+            except (OSError, ValueError):
+                # Half-written or foreign directory
+                shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+        for key, meta in sorted(entries, key=lambda e: e[1].get("lastUsed", 0)):
+            self._entries[key] = meta
+
+    def _write_meta(self, key, meta):
+        with open(os.path.join(self.root, key, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+    def restore(self, key, target, model_name):
+        """
+        Copies a cached result into `target`, renaming the scenegraph folders
+        for `model_name`. Returns the entry's metadata, or None on a miss.
+        """
+        with self._lock:
+            meta = self._entries.get(key)
+            if meta is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            meta["lastUsed"] = time.time()
+            self._entries.move_to_end(key)
+            self._write_meta(key, meta)
+
+        source = os.path.join(self.root, key)
+        if os.path.isdir(target):
+            shutil.rmtree(target)
+        try:
+            # Copies, not links: the job folder is written to in place later on
+            shutil.copytree(source, target, ignore=shutil.ignore_patterns(META_FILE))
+        except (OSError, shutil.Error) as e:
+            # Evicted while being copied
+            print(f"[WARNING] Failed to restore cached result {key}: {e}")
+            shutil.rmtree(target, ignore_errors=True)
+            with self._lock:
+                self.hits -= 1
+                self.misses += 1
+            return None
+
+        cached_name = meta.get("modelName")
+        if cached_name and cached_name != model_name:
+            for suffix in MODEL_SUFFIXES:
+                old_path = os.path.join(target, cached_name + suffix)
+                if os.path.isdir(old_path):
+                    os.replace(old_path, os.path.join(target, model_name + suffix))
+        return meta
+
+    def store(self, key, source, model_name, output=""):
+        """Copies a freshly converted `_mtk` folder and its console output into the cache."""
+        if not os.path.isdir(source):
+            return
+
+        staging = os.path.join(self.root, f".tmp-{uuid.uuid4().hex}")
+        shutil.copytree(source, staging)
+        meta = {
+            "size": _tree_size(staging),
+            "modelName": model_name,
+            "lastUsed": time.time(),
+            "output": output,
+        }
+        with open(os.path.join(staging, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
+        with self._lock:
+            final = os.path.join(self.root, key)
+            if key in self._entries:
+                shutil.rmtree(staging, ignore_errors=True)
+                return
+            os.replace(staging, final)
+            self._entries[key] = meta
+            self._evict()
+
+    def _evict(self):
+        total = sum(m["size"] for m in self._entries.values())
+        while self._entries and (len(self._entries) > self.max_entries or total > self.max_bytes):
+            key, meta = self._entries.popitem(last=False)
+            total -= meta["size"]
+            shutil.rmtree(os.path.join(self.root, key), ignore_errors=True)
+            print(f"[INFO] Evicted cached result {key}")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": sum(m["size"] for m in self._entries.values()),
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+            }
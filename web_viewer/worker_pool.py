@@ -0,0 +1,174 @@
+# worker_pool.py
+import json
+import queue
+import subprocess
+import threading
+import uuid
+from concurrent.futures import Future
+
+
+# Time the toolkit may take to load and activate its license
+START_TIMEOUT = 120
+
+
+class WorkerError(RuntimeError):
+    pass
+
+
+class WorkerTimeout(WorkerError):
+    pass
+
+
+class _Worker:
+    """
+    One MTKConverter_Worker process, started and owned by a pool slot. Replies
+    are read by a thread of their own, so that waiting for one can time out.
+    """
+
+    def __init__(self, python_exe, worker_script, max_jobs, max_rss_mb):
+        self.process = subprocess.Popen(
+            [python_exe, worker_script,
+             "--max-jobs", str(max_jobs),
+             "--max-rss-mb", str(max_rss_mb)],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            text=True, encoding="utf-8", bufsize=1,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True, name=f"mtk-worker-reader-{self.process.pid}").start()
+        try:
+            hello = self._read(START_TIMEOUT)
+        except WorkerTimeout:
+            self.kill()
+            raise
+        if not hello.get("ready"):
+            self.close()
+            raise WorkerError(f"Worker failed to start: {hello.get('error', 'unknown error')}")
+        self.pid = hello.get("pid")
+
+    def _pump(self):
+        # An empty line marks the end of the output
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put("")
+
+    def _read(self, timeout=None):
+        try:
+            line = self._lines.get(timeout=timeout)
+        except queue.Empty:
+            raise WorkerTimeout(f"Worker didn't reply within {timeout} s") from None
+        if not line:
+            raise WorkerError(f"Worker exited with code {self.process.wait()}")
+        return json.loads(line)
+
+    def run(self, job, timeout=None):
+        self.process.stdin.write(json.dumps(job) + "\n")
+        self.process.stdin.flush()
+        return self._read(timeout)
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+
+
+class WorkerPool:
+    """
+    Fixed number of pre-warmed MTK workers fed from a shared queue.
+
+    Each slot owns one worker process and a thread that hands it jobs one at a
+    time. A worker that retires (job quota or memory high-water mark reached)
+    or crashes is replaced by a fresh one, started right away so the next job
+    doesn't wait for the toolkit to load. A worker still busy with a job after
+    `job_timeout` seconds (0 for no limit) is killed and replaced, and the job
+    fails.
+    """
+
+    def __init__(self, python_exe, worker_script, size=2, max_jobs=50, max_rss_mb=0, job_timeout=0):
+        self.python_exe = python_exe
+        self.worker_script = worker_script
+        self.size = max(1, size)
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.job_timeout = job_timeout
+        self._jobs = queue.Queue()
+        self._threads = []
+        for slot in range(self.size):
+            thread = threading.Thread(target=self._serve, args=(slot,), daemon=True,
+                                      name=f"mtk-worker-{slot}")
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, source, target, process="machining_milling", screenshot=True, report_version=1, cbor=False,
+               concurrent_dfm=False, wall_thickness_cache=None):
+        """Queues an analysis job and returns a Future resolving to the worker's reply."""
+        future = Future()
+        job = {
+            "id": uuid.uuid4().hex,
+            "source": str(source),
+            "target": str(target),
+            "process": process,
+            "screenshot": screenshot,
+            "reportVersion": report_version,
+            "cbor": cbor,
+            "concurrentDfm": concurrent_dfm,
+            "wallThicknessCache": str(wall_thickness_cache) if wall_thickness_cache else None,
+        }
+        self._jobs.put((job, future))
+        return future
+
+    def run(self, source, target, process="machining_milling", screenshot=True, report_version=1, cbor=False,
+            concurrent_dfm=False, wall_thickness_cache=None):
+        return self.submit(source, target, process, screenshot, report_version, cbor, concurrent_dfm,
+                           wall_thickness_cache).result()
+
+    def _spawn(self, slot):
+        try:
+            worker = _Worker(self.python_exe, self.worker_script, self.max_jobs, self.max_rss_mb)
+            print(f"[INFO] MTK worker {slot} ready (pid {worker.pid})")
+            return worker
+        except (OSError, ValueError, WorkerError) as e:
+            print(f"[ERROR] MTK worker {slot} failed to start: {e}")
+            return None
+
+    def _serve(self, slot):
+        worker = self._spawn(slot)
+        while True:
+            job, future = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            if worker is None:
+                worker = self._spawn(slot)
+            if worker is None:
+                future.set_exception(WorkerError("No MTK worker available"))
+                continue
+
+            try:
+                reply = worker.run(job, self.job_timeout or None)
+            except WorkerTimeout as e:
+                print(f"[ERROR] MTK worker {slot} timed out on job {job['id']}, killing it: {e}")
+                worker.kill()
+                worker = self._spawn(slot)
+                future.set_exception(e)
+                continue
+            except (OSError, ValueError, WorkerError) as e:
+                print(f"[ERROR] MTK worker {slot} crashed: {e}")
+                worker.close()
+                worker = self._spawn(slot)
+                future.set_exception(WorkerError(f"MTK worker crashed: {e}"))
+                continue
+
+            future.set_result(reply)
+            if reply.get("retire"):
+                print(f"[INFO] Recycling MTK worker {slot} (pid {worker.pid})")
+                worker.close()
+                worker = self._spawn(slot)